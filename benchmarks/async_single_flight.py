@@ -0,0 +1,79 @@
+"""
+Loader calls and latency for 1000 concurrent requests on one cold key.
+
+    python3 -m benchmarks.async_single_flight --requests 1000 --load-ms 20
+
+Requests arrive spread uniformly over --arrival-ms, all for the same key,
+which is not cached yet (a cold hot key, e.g. right after a deploy or an
+expiry). The loader sleeps --load-ms to stand in for a model call.
+  naive         check LRUCache, on a miss await the loader and put the result
+                (every request that misses before the first put calls it)
+  single-flight AsyncLoadingCache.get_or_load: misses share one load
+"""
+import argparse
+import asyncio
+import random
+import time
+
+import numpy as np
+
+from src.mlsys.data_structures.async_loading_cache import AsyncLoadingCache
+from src.mlsys.data_structures.lru_cache import LRUCache
+
+
+class Counter:
+    def __init__(self, load_ms: float):
+        self.calls = 0
+        self.load_s = load_ms / 1000
+
+    async def load(self):
+        self.calls += 1
+        await asyncio.sleep(self.load_s)
+        return "value"
+
+
+async def naive_request(cache: LRUCache, key, loader: Counter):
+    value = cache.get(key, None)
+    if value is None:
+        value = await loader.load()
+        cache.put(key, value)
+    return value
+
+
+async def run(mode: str, requests: int, arrival_ms: float, load_ms: float, seed: int):
+    rng = random.Random(seed)
+    loader = Counter(load_ms)
+    lru = LRUCache(1024)
+    single = AsyncLoadingCache(1024)
+    latencies = []
+
+    async def one(delay: float):
+        await asyncio.sleep(delay)
+        start = time.perf_counter()
+        if mode == "naive":
+            await naive_request(lru, "hot", loader)
+        else:
+            await single.get_or_load("hot", loader.load)
+        latencies.append(time.perf_counter() - start)
+
+    delays = [rng.uniform(0, arrival_ms / 1000) for _ in range(requests)]
+    await asyncio.gather(*(one(d) for d in delays))
+    lat = np.array(latencies) * 1000
+    return loader.calls, np.percentile(lat, 50), np.percentile(lat, 99)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--arrival-ms", type=float, default=50.0)
+    parser.add_argument("--load-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    print(f"{'mode':>14} {'loader calls':>13} {'p50 ms':>8} {'p99 ms':>8}")
+    for mode in ("naive", "single-flight"):
+        calls, p50, p99 = asyncio.run(run(mode, args.requests, args.arrival_ms, args.load_ms, seed=0))
+        print(f"{mode:>14} {calls:>13} {p50:>8.2f} {p99:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Hit ratio and throughput of eviction policies on synthetic traces.
+
+    python3 -m benchmarks.cache_policies --capacities 100 1000 10000 --length 1000000
+
+Traces:
+  zipf       keys drawn from Zipf(--alpha) over --keys distinct ids
+  zipf+scan  the same stream, interrupted every --scan-every requests by a
+             sequential scan of --scan-length never-repeated ids (think of a
+             nightly evaluation sweep going through the online cache)
+Each request is a get; a miss is followed by a put, as a read-through cache would do.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from src.mlsys.data_structures.cache_policies import ARCCache, SLRUCache, WTinyLFUCache
+from src.mlsys.data_structures.lru_cache import LRUCache
+
+POLICIES = {"LRU": LRUCache, "SLRU": SLRUCache, "ARC": ARCCache, "W-TinyLFU": WTinyLFUCache}
+
+
+def zipf_trace(length: int, keys: int, alpha: float, seed: int = 0) -> list:
+    rng = np.random.default_rng(seed)
+    ranks = np.arange(1, keys + 1, dtype=np.float64)
+    p = ranks**-alpha
+    p /= p.sum()
+    ids = rng.choice(keys, size=length, p=p)
+    # shuffle which ids are popular so popularity is unrelated to key order
+    return rng.permutation(keys)[ids].tolist()
+
+
+def scan_mixed_trace(base: list, scan_every: int, scan_length: int, first_scan_id: int) -> list:
+    out = []
+    next_id = first_scan_id
+    for start in range(0, len(base), scan_every):
+        out.extend(base[start : start + scan_every])
+        out.extend(range(next_id, next_id + scan_length))
+        next_id += scan_length
+    return out
+
+
+def replay(cache, trace: list) -> tuple[float, float]:
+    hits = 0
+    get, put = cache.get, cache.put
+    start = time.perf_counter()
+    for k in trace:
+        if get(k, None) is None:
+            put(k, k)
+        else:
+            hits += 1
+    secs = time.perf_counter() - start
+    return hits / len(trace), len(trace) / secs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--capacities", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--length", type=int, default=1_000_000)
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--alpha", type=float, default=0.9)
+    parser.add_argument("--scan-every", type=int, default=50_000)
+    parser.add_argument("--scan-length", type=int, default=20_000)
+    args = parser.parse_args()
+
+    base = zipf_trace(args.length, args.keys, args.alpha)
+    traces = {
+        "zipf": base,
+        "zipf+scan": scan_mixed_trace(base, args.scan_every, args.scan_length, args.keys),
+    }
+    print(f"{'trace':>10} {'capacity':>9} {'policy':>10} {'hit ratio':>10} {'ops/s':>11}")
+    for name, trace in traces.items():
+        for capacity in args.capacities:
+            for policy, cls in POLICIES.items():
+                hit_ratio, ops = replay(cls(capacity), trace)
+                print(f"{name:>10} {capacity:>9} {policy:>10} {hit_ratio:>10.4f} {ops:>11,.0f}")
+
+
+if __name__ == "__main__":
+    main()
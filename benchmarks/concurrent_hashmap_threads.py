@@ -0,0 +1,79 @@
+"""
+Multi-threaded map throughput: one lock around HashMap vs ConcurrentHashMap.
+
+    python3 -m benchmarks.concurrent_hashmap_threads --threads 1 2 4 8 16 32
+
+Each thread runs a get/set mix (--write-pct sets) over a shared key space
+that starts empty, so the early sets also drive resizes. With the GIL only
+one thread executes Python at a time, so the gap here mostly reflects lock
+handoffs (ConcurrentHashMap reads take none); on a free-threaded build the
+segments also run in parallel.
+"""
+import argparse
+import random
+import threading
+import time
+
+from src.mlsys.data_structures.concurrent_hashmap import ConcurrentHashMap
+from src.mlsys.data_structures.hashmap import _MISSING, HashMap
+
+
+class GlobalLockHashMap:
+    def __init__(self):
+        self._map = HashMap()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=_MISSING):
+        with self._lock:
+            return self._map.get(key, default)
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            self._map.set(key, value)
+
+
+def bench(table, threads: int, ops_per_thread: int, key_space: int, write_pct: int) -> float:
+    barrier = threading.Barrier(threads)
+    spans = []
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        keys = [rng.randrange(key_space) for _ in range(ops_per_thread)]
+        writes = [rng.randrange(100) < write_pct for _ in range(ops_per_thread)]
+        get, set_ = table.get, table.set
+        barrier.wait()
+        start = time.perf_counter()
+        for k, w in zip(keys, writes, strict=True):
+            if w:
+                set_(k, k)
+            else:
+                get(k, None)
+        spans.append((start, time.perf_counter()))
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    wall = max(end for _, end in spans) - min(start for start, _ in spans)
+    return threads * ops_per_thread / wall
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--ops", type=int, default=100_000, help="operations per thread")
+    parser.add_argument("--keys", type=int, default=200_000)
+    parser.add_argument("--write-pct", type=int, default=10)
+    parser.add_argument("--segments", type=int, default=16)
+    args = parser.parse_args()
+
+    print(f"{'threads':>8} {'global lock ops/s':>18} {'concurrent ops/s':>17}")
+    for n in args.threads:
+        locked = bench(GlobalLockHashMap(), n, args.ops, args.keys, args.write_pct)
+        concurrent = bench(ConcurrentHashMap(num_segments=args.segments), n, args.ops, args.keys, args.write_pct)
+        print(f"{n:>8} {locked:>18,.0f} {concurrent:>17,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Increments per second of ThreadSafeCounter under contention, striped vs locked.
+
+    python3 -m benchmarks.counter_contention --threads 1 4 16 64
+
+Every thread increments the shared counter in a tight loop; the final value
+is checked against the expected total.
+"""
+import argparse
+import threading
+import time
+
+from src.mlsys.data_structures.thread_safe_counter import ThreadSafeCounter
+
+
+def bench(mode: str, threads: int, per_thread: int) -> float:
+    counter = ThreadSafeCounter(mode=mode)
+    barrier = threading.Barrier(threads)
+    spans = []
+
+    def worker() -> None:
+        inc = counter.increment
+        barrier.wait()
+        start = time.perf_counter()
+        for _ in range(per_thread):
+            inc()
+        spans.append((start, time.perf_counter()))
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    assert counter.value() == threads * per_thread
+    wall = max(end for _, end in spans) - min(start for start, _ in spans)
+    return threads * per_thread / wall
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--increments", type=int, default=200_000, help="per thread")
+    args = parser.parse_args()
+
+    print(f"{'threads':>8} {'striped inc/s':>15} {'locked inc/s':>14}")
+    for n in args.threads:
+        striped = bench("striped", n, args.increments)
+        locked = bench("locked", n, args.increments)
+        print(f"{n:>8} {striped:>15,.0f} {locked:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Chained vs open-addressing HashMap vs dict: memory per entry and lookup throughput.
+
+    python3 -m benchmarks.hashmap_backends --sizes 10000000
+
+Memory is measured with tracemalloc while the map is built; keys and values
+are shared int objects allocated beforehand, so only the table itself counts.
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from src.mlsys.data_structures.hashmap import HashMap
+
+
+def _build(kind: str, keys: list):
+    if kind == "dict":
+        d = {}
+        for k in keys:
+            d[k] = k
+        return d
+    hm = HashMap(backend=kind)
+    for k in keys:
+        hm.set(k, k)
+    return hm
+
+
+def bench(kind: str, size: int, lookups: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    keys = rng.sample(range(size * 4), size)
+    probes = [rng.choice(keys) for _ in range(lookups)]
+
+    tracemalloc.start()
+    table = _build(kind, keys)
+    table_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    get = table.get
+    start = time.perf_counter()
+    for k in probes:
+        get(k)
+    lookup_s = time.perf_counter() - start
+    return {
+        "kind": kind,
+        "size": size,
+        "bytes_per_entry": table_bytes / size,
+        "lookups_per_s": lookups / lookup_s,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000_000])
+    parser.add_argument("--lookups", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{'kind':>8} {'size':>10} {'B/entry':>9} {'lookups/s':>12}")
+    for size in args.sizes:
+        for kind in ("chained", "open", "dict"):
+            r = bench(kind, size, args.lookups)
+            print(
+                f"{r['kind']:>8} {r['size']:>10} {r['bytes_per_entry']:>9.1f}"
+                f" {r['lookups_per_s']:>12,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Building a HashMap from N pairs: repeated set() vs update()/from_items().
+
+    python3 -m benchmarks.hashmap_bulk_build --sizes 1000000 10000000
+
+Reports how many times the table was rebuilt and the wall time for each path.
+"""
+import argparse
+import time
+
+from src.mlsys.data_structures.hashmap import HashMap
+
+
+def _count_rehashes(hm: HashMap) -> list:
+    calls = []
+    rehash = hm._rehash
+
+    def counting(capacity):
+        calls.append(capacity)
+        rehash(capacity)
+
+    hm._rehash = counting
+    return calls
+
+
+def bench(path: str, backend: str, pairs: list) -> tuple[int, float]:
+    hm = HashMap(backend=backend)
+    rehashes = _count_rehashes(hm)
+    start = time.perf_counter()
+    if path == "set loop":
+        for k, v in pairs:
+            hm.set(k, v)
+    elif path == "update":
+        hm.update(pairs)
+    else:  # reserve + set loop, as from_items does for an unsized iterable
+        hm.reserve(len(pairs))
+        hm.update(iter(pairs))
+    return len(rehashes), time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--backends", nargs="+", default=["chained", "open"])
+    args = parser.parse_args()
+
+    print(f"{'backend':>8} {'size':>10} {'path':>18} {'rehashes':>9} {'seconds':>9}")
+    for size in args.sizes:
+        pairs = [(f"tok{i}", i) for i in range(size)]
+        for backend in args.backends:
+            for path in ("set loop", "update", "reserve + update"):
+                n, secs = bench(path, backend, pairs)
+                print(f"{backend:>8} {size:>10} {path:>18} {n:>9} {secs:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
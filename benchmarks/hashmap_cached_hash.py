@@ -0,0 +1,127 @@
+"""
+Cost of __hash__/__eq__ with and without cached hashes in HashMap.
+
+    python3 -m benchmarks.hashmap_cached_hash --size 100000
+
+The keys mimic tuples of feature names: hashing and comparing them walks the
+whole tuple every time. UncachedHashMap reproduces the previous chained map,
+which stored bare (key, value) pairs, re-hashed every key on resize and called
+__eq__ on every key in the probed bucket.
+"""
+import argparse
+import random
+import time
+
+from src.mlsys.data_structures.hashmap import _MISSING, HashMap
+
+
+class FeatureKey:
+    hash_calls = 0
+    eq_calls = 0
+
+    def __init__(self, names: tuple):
+        self.names = names
+
+    def __hash__(self):
+        FeatureKey.hash_calls += 1
+        return hash(self.names)
+
+    def __eq__(self, other):
+        FeatureKey.eq_calls += 1
+        return isinstance(other, FeatureKey) and self.names == other.names
+
+
+class UncachedHashMap(HashMap):
+    def set(self, key, value) -> None:
+        idx = hash(key) % self._capacity
+        bucket = self._buckets[idx]
+        if bucket is None:
+            self._buckets[idx] = [(key, value)]
+        else:
+            for i, (existing_key, _) in enumerate(bucket):
+                if existing_key == key:
+                    bucket[i] = (key, value)
+                    return
+            bucket.append((key, value))
+        self._size += 1
+        if self._size / self._capacity > self._load_factor:
+            self._resize()
+
+    def get(self, key, default=_MISSING):
+        for existing_key, value in self._buckets[hash(key) % self._capacity] or ():
+            if existing_key == key:
+                return value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def _resize(self):
+        self._capacity *= 2
+        buckets = [None] * self._capacity
+        for bucket in self._buckets:
+            for key, value in bucket or ():
+                idx = hash(key) % self._capacity
+                if buckets[idx] is None:
+                    buckets[idx] = [(key, value)]
+                else:
+                    buckets[idx].append((key, value))
+        self._buckets = buckets
+
+
+def _make_keys(n: int, width: int, seed: int) -> list:
+    rng = random.Random(seed)
+    vocab = [f"feature_{i}" for i in range(1_000)]
+    return [FeatureKey(tuple(rng.choices(vocab, k=width)) + (i,)) for i in range(n)]
+
+
+def bench(name: str, factory, keys: list, probes: list) -> dict:
+    FeatureKey.hash_calls = FeatureKey.eq_calls = 0
+    start = time.perf_counter()
+    hm = factory()
+    for i, k in enumerate(keys):
+        hm.set(k, i)
+    build_s = time.perf_counter() - start
+    build_hash, build_eq = FeatureKey.hash_calls, FeatureKey.eq_calls
+
+    FeatureKey.hash_calls = FeatureKey.eq_calls = 0
+    start = time.perf_counter()
+    for k in probes:
+        hm.get(k)
+    lookup_s = time.perf_counter() - start
+    return {
+        "name": name,
+        "build_s": build_s,
+        "build_hash": build_hash,
+        "build_eq": build_eq,
+        "lookup_s": lookup_s,
+        "lookup_eq": FeatureKey.eq_calls,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--width", type=int, default=32, help="feature names per key")
+    parser.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args()
+
+    keys = _make_keys(args.size, args.width, seed=0)
+    # equal-but-distinct key objects, as when ids come off the wire
+    rng = random.Random(1)
+    probes = [FeatureKey(keys[rng.randrange(args.size)].names) for _ in range(args.lookups)]
+
+    print(f"{'map':>10} {'build s':>8} {'hash()':>10} {'__eq__':>10} {'lookup s':>9} {'__eq__':>10}")
+    for name, factory in (
+        ("uncached", UncachedHashMap),
+        ("chained", HashMap),
+        ("open", lambda: HashMap(backend="open")),
+    ):
+        r = bench(name, factory, keys, probes)
+        print(
+            f"{r['name']:>10} {r['build_s']:>8.2f} {r['build_hash']:>10,} {r['build_eq']:>10,}"
+            f" {r['lookup_s']:>9.2f} {r['lookup_eq']:>10,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
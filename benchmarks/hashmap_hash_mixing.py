@@ -0,0 +1,72 @@
+"""
+Chain lengths and lookup throughput of strided and sequential int keys, with and without hash mixing.
+
+    python3 -m benchmarks.hashmap_hash_mixing --size 20000 --strides 1 64 4096
+
+For each stride s the keys are 0, s, 2s, ...; stride 1 is sequential ids.
+Both backends are built with the raw hash (mixer "none") and with each
+hash_mixer. max and mean are chain lengths from HashMap.stats(): bucket
+lengths for chained, probe lengths for open; p99 is over entries, i.e. the
+chain a typical lookup walks. Building a map of strided keys without mixing is
+quadratic, so keep --size moderate.
+"""
+import argparse
+import random
+import time
+
+from src.mlsys.data_structures.hashmap import HashMap
+
+MIXERS = (None, "fibonacci", "splitmix")
+
+
+def bench(backend: str, mixer: str | None, keys: list, probes: list) -> dict:
+    hm = HashMap(backend=backend, hash_mixer=mixer)
+    start = time.perf_counter()
+    for k in keys:
+        hm.set(k, k)
+    build_s = time.perf_counter() - start
+
+    get = hm.get
+    start = time.perf_counter()
+    for k in probes:
+        get(k)
+    lookup_s = time.perf_counter() - start
+
+    stats = hm.stats()
+    # chain length seen by each entry: for chained, every entry of a bucket of length L sits in an L-chain
+    per_entry = sorted(
+        length for length, n in stats.histogram.items() for _ in range(n * (length if backend == "chained" else 1))
+    )
+    return {
+        "max": stats.max_chain,
+        "mean": stats.mean_chain,
+        "p99": per_entry[int(0.99 * (len(per_entry) - 1))] if per_entry else 0,
+        "build_s": build_s,
+        "lookups_per_s": len(probes) / lookup_s,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--strides", type=int, nargs="+", default=[1, 64, 4096])
+    parser.add_argument("--lookups", type=int, default=200_000)
+    parser.add_argument("--backends", nargs="+", choices=("chained", "open"), default=["chained", "open"])
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'backend':>8} {'stride':>7} {'mixer':>10} {'max':>6} {'mean':>7} {'p99':>5} {'build s':>8} {'lookups/s':>12}")
+    for stride in args.strides:
+        keys = [i * stride for i in range(args.size)]
+        probes = [rng.choice(keys) for _ in range(args.lookups)]
+        for backend in args.backends:
+            for mixer in MIXERS:
+                r = bench(backend, mixer, keys, probes)
+                print(
+                    f"{backend:>8} {stride:>7} {mixer or 'none':>10} {r['max']:>6} {r['mean']:>7.2f}"
+                    f" {r['p99']:>5} {r['build_s']:>8.2f} {r['lookups_per_s']:>12,.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
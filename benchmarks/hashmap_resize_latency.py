@@ -0,0 +1,60 @@
+"""
+Per-set() latency while a HashMap grows: stop-the-world vs incremental resize.
+
+    python3 -m benchmarks.hashmap_resize_latency --size 10000000
+
+The stop-the-world map pays for each doubling inside a single set() call;
+the incremental map spreads the same work over the calls that follow.
+The cyclic GC is disabled while timing (as timeit does) unless --gc is given,
+so its full collections over millions of entries don't mask the resize cost.
+"""
+import argparse
+import gc
+import time
+
+from src.mlsys.data_structures.hashmap import HashMap
+
+
+def _percentile(sorted_ns: list, q: float) -> float:
+    return sorted_ns[min(len(sorted_ns) - 1, int(q * len(sorted_ns)))]
+
+
+def bench(size: int, incremental: bool) -> dict:
+    hm = HashMap(incremental_resize=incremental)
+    set_ = hm.set
+    clock = time.perf_counter_ns
+    lat = [0] * size
+    for i in range(size):
+        t0 = clock()
+        set_(i, i)
+        lat[i] = clock() - t0
+    total_s = sum(lat) / 1e9
+    lat.sort()
+    return {
+        "p50_us": _percentile(lat, 0.50) / 1e3,
+        "p99_us": _percentile(lat, 0.99) / 1e3,
+        "p999_us": _percentile(lat, 0.999) / 1e3,
+        "max_ms": lat[-1] / 1e6,
+        "total_s": total_s,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=10_000_000)
+    parser.add_argument("--gc", action="store_true", help="leave the cyclic GC enabled")
+    args = parser.parse_args()
+    if not args.gc:
+        gc.disable()
+
+    print(f"{'mode':>15} {'p50 us':>8} {'p99 us':>8} {'p99.9 us':>9} {'max ms':>9} {'total s':>8}")
+    for name, incremental in (("stop-the-world", False), ("incremental", True)):
+        r = bench(args.size, incremental)
+        print(
+            f"{name:>15} {r['p50_us']:>8.2f} {r['p99_us']:>8.2f} {r['p999_us']:>9.2f}"
+            f" {r['max_ms']:>9.2f} {r['total_s']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Memory held by a HashMap after mass deletes: no shrink vs auto-shrink vs compact() vs clear().
+
+    python3 -m benchmarks.hashmap_shrink_memory --size 10000000 --keep 0.01
+
+Traced bytes (tracemalloc) are sampled after building, after deleting all
+but --keep of the entries, and after the reclaiming step. Keys and values are
+shared int objects allocated beforehand, so only table memory counts.
+"""
+import argparse
+import time
+import tracemalloc
+
+from src.mlsys.data_structures.hashmap import HashMap
+
+
+def bench(backend: str, mode: str, keys: list, keep: int) -> dict:
+    kwargs = {"min_load_factor": 0.1} if mode == "auto-shrink" else {}
+    tracemalloc.start()
+    hm = HashMap(backend=backend, **kwargs)
+    for k in keys:
+        hm.set(k, k)
+    peak = tracemalloc.get_traced_memory()[0]
+
+    for k in keys[keep:]:
+        hm.delete(k)
+    after_delete = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    if mode == "compact":
+        hm.compact()
+    elif mode == "clear":
+        hm.clear()
+    reclaim_s = time.perf_counter() - start
+    final = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    n = len(hm.items())
+    iter_s = time.perf_counter() - start
+    return {
+        "peak_mb": peak / 2**20,
+        "after_delete_mb": after_delete / 2**20,
+        "final_mb": final / 2**20,
+        "reclaim_s": reclaim_s,
+        "capacity": hm._capacity,
+        "items": n,
+        "iter_ms": iter_s * 1e3,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=10_000_000)
+    parser.add_argument("--keep", type=float, default=0.01, help="fraction of entries left after deletes")
+    args = parser.parse_args()
+
+    keys = list(range(args.size))
+    keep = int(args.size * args.keep)
+    print(
+        f"{'backend':>8} {'mode':>12} {'peak MB':>9} {'deleted MB':>11} {'final MB':>9}"
+        f" {'reclaim s':>10} {'capacity':>10} {'items() ms':>11}"
+    )
+    for backend in ("chained", "open"):
+        for mode in ("none", "auto-shrink", "compact", "clear"):
+            r = bench(backend, mode, keys, keep)
+            print(
+                f"{backend:>8} {mode:>12} {r['peak_mb']:>9.1f} {r['after_delete_mb']:>11.1f}"
+                f" {r['final_mb']:>9.1f} {r['reclaim_s']:>10.3f} {r['capacity']:>10} {r['iter_ms']:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
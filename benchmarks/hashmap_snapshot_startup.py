@@ -0,0 +1,90 @@
+"""
+Warm-start cost of a HashMap: rebuild from items vs pickle vs mmap snapshot.
+
+    python3 -m benchmarks.hashmap_snapshot_startup --entries 500000 --dim 32
+
+The map holds --entries str keys, each with a float32 embedding of --dim
+values. Each strategy starts in a fresh spawn process so nothing is shared
+with the parent, then serves --lookups random gets:
+  rebuild  unpickle the source (key, value) list and HashMap.from_items it
+  pickle   unpickle a pickled HashMap
+  mmap     HashMap.open_mmap on a snapshot written by HashMap.save
+"ready" is the time until the first lookup can be served. RSS is read from
+/proc/self/statm (Linux). For mmap it is only the file pages the lookups
+touched (random gets touch most pages of a small file); those are clean
+page cache, shared between processes mapping the same snapshot, which the
+kernel can drop and re-read at will, unlike the heap of the other two.
+"""
+import argparse
+import multiprocessing
+import os
+import pickle
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.mlsys.data_structures.hashmap import HashMap
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def start(strategy: str, path: str, keys: list) -> dict:
+    base = _rss_mb()
+    t0 = time.perf_counter()
+    if strategy == "rebuild":
+        with open(path, "rb") as f:
+            hm = HashMap.from_items(pickle.load(f))
+    elif strategy == "pickle":
+        with open(path, "rb") as f:
+            hm = pickle.load(f)
+    else:
+        hm = HashMap.open_mmap(path)
+    ready = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    checksum = 0.0
+    for k in keys:
+        checksum += float(hm.get(k)[0])
+    lookup = (time.perf_counter() - t0) / len(keys)
+    return {"ready_s": ready, "lookup_us": lookup * 1e6, "rss_mb": _rss_mb() - base, "checksum": checksum}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=500_000)
+    parser.add_argument("--dim", type=int, default=32)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((args.entries, args.dim), dtype=np.float32)
+    items = [(f"user:{i}", vectors[i].copy()) for i in range(args.entries)]
+    hm = HashMap.from_items(items)
+    sample = random.Random(0)
+    keys = [f"user:{sample.randrange(args.entries)}" for _ in range(args.lookups)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {s: os.path.join(tmp, s) for s in ("rebuild", "pickle", "mmap")}
+        with open(paths["rebuild"], "wb") as f:
+            pickle.dump(items, f, protocol=pickle.HIGHEST_PROTOCOL)
+        with open(paths["pickle"], "wb") as f:
+            pickle.dump(hm, f, protocol=pickle.HIGHEST_PROTOCOL)
+        hm.save(paths["mmap"])
+        del items, hm
+
+        print(f"{'strategy':>9} {'file MB':>8} {'ready s':>9} {'lookup us':>10} {'RSS +MB':>9}")
+        for strategy, path in paths.items():
+            with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                r = pool.submit(start, strategy, path, keys).result()
+            size = os.path.getsize(path) / 2**20
+            print(f"{strategy:>9} {size:>8.1f} {r['ready_s']:>9.4f} {r['lookup_us']:>10.2f} {r['rss_mb']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Streaming HashMap entries through live views vs materializing lists.
+
+    python3 -m benchmarks.hashmap_views --size 10000000
+
+"list" materializes keys()/values()/items() the way the old list-returning
+methods did; "view" iterates the live view directly. Peak traced memory is
+what the traversal itself allocates on top of the built map.
+"""
+import argparse
+import time
+import tracemalloc
+
+from src.mlsys.data_structures.hashmap import HashMap
+
+
+def _measure(fn) -> tuple[float, float]:
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    fn()
+    secs = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return secs, peak / 2**20
+
+
+def _consume(it) -> None:
+    for _ in it:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    print(f"{'backend':>8} {'traversal':>16} {'list s':>8} {'list MB':>9} {'view s':>8} {'view MB':>9}")
+    for backend in ("chained", "open"):
+        hm = HashMap.from_items(((i, i) for i in range(args.size)), size_hint=args.size, backend=backend)
+        cases = {
+            "keys": (lambda hm=hm: _consume(list(hm.keys())), lambda hm=hm: _consume(hm.keys())),
+            "values": (lambda hm=hm: _consume(list(hm.values())), lambda hm=hm: _consume(hm.values())),
+            "items": (lambda hm=hm: _consume(list(hm.items())), lambda hm=hm: _consume(hm.items())),
+            "first key": (lambda hm=hm: list(hm.keys())[0], lambda hm=hm: next(iter(hm))),
+        }
+        for name, (as_list, as_view) in cases.items():
+            list_s, list_mb = _measure(as_list)
+            view_s, view_mb = _measure(as_view)
+            print(f"{backend:>8} {name:>16} {list_s:>8.3f} {list_mb:>9.1f} {view_s:>8.3f} {view_mb:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Scheduler workload with frequent priority changes: IndexedHeap vs heapq + lazy invalidation.
+
+    python3 -m benchmarks.heap_priority_updates --ops 1000000 --update-ratio 0.6
+
+The lazy baseline marks a changed entry as stale and pushes a new one, so the
+heap list keeps growing with dead entries until they surface at the top.
+"""
+import argparse
+import heapq
+import itertools
+import random
+import time
+import tracemalloc
+
+from src.mlsys.data_structures.heap import IndexedHeap
+
+_REMOVED = object()
+
+
+class LazyHeap:
+    """The usual heapq recipe: [priority, tiebreak, key] entries plus a finder dict."""
+
+    def __init__(self):
+        self._heap = []
+        self._entries = {}
+        self._counter = itertools.count()
+
+    def push(self, key, priority) -> None:
+        if key in self._entries:
+            self._entries.pop(key)[-1] = _REMOVED
+        entry = [priority, next(self._counter), key]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+
+    update_priority = push
+
+    def pop(self):
+        while self._heap:
+            priority, _, key = heapq.heappop(self._heap)
+            if key is not _REMOVED:
+                del self._entries[key]
+                return key, priority
+        raise IndexError("pop from empty heap")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _workload(ops: int, live: int, update_ratio: float, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    plan = []
+    for _ in range(ops):
+        r = rng.random()
+        if r < update_ratio:
+            plan.append(("update", rng.randrange(live), rng.random()))
+        elif r < (1 + update_ratio) / 2:
+            plan.append(("push", None, rng.random()))
+        else:
+            plan.append(("pop", None, None))
+    return plan
+
+
+def _run(name: str, plan: list, live: int):
+    heap = IndexedHeap() if name == "IndexedHeap" else LazyHeap()
+    index = heap._pos if name == "IndexedHeap" else heap._entries
+    rng = random.Random(1)
+    for k in range(live):
+        heap.push(k, rng.random())
+    yield heap
+    next_key = live
+    recent = list(range(live))  # update targets; some will have been popped already
+    for op, slot, priority in plan:
+        if op == "update":
+            key = recent[slot]
+            if key in index:
+                heap.update_priority(key, priority)
+        elif op == "push":
+            heap.push(next_key, priority)
+            recent[next_key % live] = next_key
+            next_key += 1
+        elif len(heap):
+            heap.pop()
+    yield heap
+
+
+def bench(name: str, plan: list, live: int) -> dict:
+    # timed run without tracemalloc, then a traced run for memory growth
+    run = _run(name, plan, live)
+    next(run)
+    start = time.perf_counter()
+    heap = next(run)
+    secs = time.perf_counter() - start
+
+    tracemalloc.start()
+    run = _run(name, plan, live)
+    next(run)
+    start_mem = tracemalloc.get_traced_memory()[0]
+    next(run)
+    growth = tracemalloc.get_traced_memory()[0] - start_mem
+    tracemalloc.stop()
+
+    backing = len(heap._keys) if name == "IndexedHeap" else len(heap._heap)
+    return {
+        "ops_per_s": len(plan) / secs,
+        "live": len(heap),
+        "backing": backing,
+        "mem_growth_mb": growth / 2**20,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=1_000_000)
+    parser.add_argument("--live", type=int, default=100_000, help="keys in the heap at the start")
+    parser.add_argument("--update-ratio", type=float, default=0.6)
+    args = parser.parse_args()
+
+    plan = _workload(args.ops, args.live, args.update_ratio)
+    print(f"{'heap':>12} {'ops/s':>12} {'live keys':>10} {'heap entries':>13} {'mem growth MB':>14}")
+    for name in ("LazyHeap", "IndexedHeap"):
+        r = bench(name, plan, args.live)
+        print(
+            f"{name:>12} {r['ops_per_s']:>12,.0f} {r['live']:>10,} {r['backing']:>13,}"
+            f" {r['mem_growth_mb']:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Batched IntHashMap lookups vs a Python loop over HashMap.get and dict.get.
+
+    python3 -m benchmarks.int_hashmap_batch --size 1000000 --batch 1000000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from src.mlsys.data_structures.hashmap import HashMap
+from src.mlsys.data_structures.int_hashmap import IntHashMap
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1_000_000, help="entries in the map")
+    parser.add_argument("--batch", type=int, default=1_000_000, help="ids per lookup batch")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    ids = rng.choice(1 << 40, size=args.size, replace=False).astype(np.int64)
+    rows = np.arange(args.size, dtype=np.int64)
+    batch = ids[rng.integers(0, args.size, size=args.batch)]
+    batch_list = batch.tolist()
+
+    ihm = IntHashMap()
+    set_ihm = _timed(lambda: ihm.set_many(ids, rows))
+    hm = HashMap()
+    set_hm = _timed(lambda: [hm.set(k, v) for k, v in zip(ids.tolist(), rows.tolist(), strict=True)])
+    d = dict(zip(ids.tolist(), rows.tolist(), strict=True))
+
+    get_ihm = _timed(lambda: ihm.get_many(batch))
+    get_hm = _timed(lambda: [hm.get(k) for k in batch_list])
+    get_d = _timed(lambda: [d.get(k) for k in batch_list])
+
+    print(f"{'':>22} {'seconds':>9} {'ids/s':>14}")
+    for name, secs, n in (
+        ("HashMap.set loop", set_hm, args.size),
+        ("IntHashMap.set_many", set_ihm, args.size),
+        ("HashMap.get loop", get_hm, args.batch),
+        ("dict.get loop", get_d, args.batch),
+        ("IntHashMap.get_many", get_ihm, args.batch),
+    ):
+        print(f"{name:>22} {secs:>9.3f} {n / secs:>14,.0f}")
+    print(f"get_many speedup over HashMap.get: {get_hm / get_ihm:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
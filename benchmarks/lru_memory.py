@@ -0,0 +1,81 @@
+"""
+Bytes per entry of LRUCache layouts, measured with tracemalloc.
+
+    python3 -m benchmarks.lru_memory --sizes 1000000 5000000
+
+"dict-node" is the original Node layout with an instance __dict__,
+"slots-node" the current LRUCache, "compact" the CompactLRUCache index
+arrays, and OrderedDict is shown for reference. Keys and values are shared
+int objects allocated beforehand, so only the cache's own structures count.
+"""
+import argparse
+import time
+import tracemalloc
+from collections import OrderedDict
+from unittest import mock
+
+from src.mlsys.data_structures import lru_cache
+from src.mlsys.data_structures.lru_cache import CompactLRUCache, LRUCache
+
+
+class DictNode:
+    def __init__(self, key, value, prev, next):
+        self._prev = prev
+        self._next = next
+        self._key = key
+        self._value = value
+
+
+class _OrderedDictCache:
+    def __init__(self, capacity: int):
+        self._capacity = capacity
+        self._od = OrderedDict()
+
+    def put(self, key, value) -> None:
+        od = self._od
+        if key in od:
+            od.move_to_end(key)
+        elif len(od) >= self._capacity:
+            od.popitem(last=False)
+        od[key] = value
+
+
+def bench(name: str, size: int, keys: list) -> dict:
+    patch = mock.patch.object(lru_cache, "Node", DictNode) if name == "dict-node" else mock.MagicMock()
+    factory = {
+        "dict-node": LRUCache,
+        "slots-node": LRUCache,
+        "compact": CompactLRUCache,
+        "OrderedDict": _OrderedDictCache,
+    }[name]
+    with patch:
+        tracemalloc.start()
+        cache = factory(size)
+        for k in keys:
+            cache.put(k, k)
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        # steady state: every put evicts the LRU entry
+        start = time.perf_counter()
+        for k in keys:
+            cache.put(-k - 1, k)
+        evict_ns = (time.perf_counter() - start) / len(keys) * 1e9
+    return {"bytes_per_entry": used / size, "evict_ns": evict_ns}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 5_000_000])
+    args = parser.parse_args()
+
+    print(f"{'layout':>12} {'size':>10} {'B/entry':>9} {'put+evict ns':>13}")
+    for size in args.sizes:
+        keys = list(range(size))
+        for name in ("dict-node", "slots-node", "compact", "OrderedDict"):
+            r = bench(name, size, keys)
+            print(f"{name:>12} {size:>10} {r['bytes_per_entry']:>9.1f} {r['evict_ns']:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Per-op latency of LRUCache as the cache grows.
+
+    python3 -m benchmarks.lru_scaling --sizes 1000 10000 100000 1000000
+
+With O(1) operations the ns/op columns should stay flat across sizes.
+"""
+import argparse
+import random
+import time
+
+from src.mlsys.data_structures.lru_cache import LRUCache
+
+
+def _ns_per_op(fn, keys) -> float:
+    start = time.perf_counter_ns()
+    for k in keys:
+        fn(k)
+    return (time.perf_counter_ns() - start) / len(keys)
+
+
+def bench(size: int, ops: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    cache = LRUCache(size)
+    for i in range(size):
+        cache.put(i, i)
+
+    hits = [rng.randrange(size) for _ in range(ops)]
+    fresh = list(range(size, size + ops))
+    return {
+        "size": size,
+        "get": _ns_per_op(cache.get, hits),
+        "contains": _ns_per_op(cache.__contains__, hits),
+        "put_update": _ns_per_op(lambda k: cache.put(k, k), hits),
+        # every insert on a full cache also evicts the LRU entry
+        "put_evict": _ns_per_op(lambda k: cache.put(k, k), fresh),
+        # the most recent inserts are guaranteed to still be resident
+        "delete": _ns_per_op(cache.delete, fresh[-min(size, ops) // 2 :]),
+        "len": _ns_per_op(lambda _: len(cache), hits),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--ops", type=int, default=100_000)
+    args = parser.parse_args()
+
+    cols = ["get", "contains", "put_update", "put_evict", "delete", "len"]
+    print(f"{'size':>10} " + " ".join(f"{c:>11}" for c in cols) + "   (ns/op)")
+    for size in args.sizes:
+        row = bench(size, args.ops)
+        print(f"{size:>10} " + " ".join(f"{row[c]:>11.0f}" for c in cols))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Multi-threaded LRU throughput: one lock around LRUCache vs ShardedLRUCache.
+
+    python3 -m benchmarks.lru_sharded_threads --threads 1 2 4 8 16 32
+
+Each thread runs a 90/10 get/put mix over a shared key space. With the GIL
+only one thread executes Python at a time, so the gap here mostly reflects
+lock handoff cost; on a free-threaded build shards also run in parallel.
+"""
+import argparse
+import random
+import threading
+import time
+
+from src.mlsys.data_structures.lru_cache import _MISSING, LRUCache
+from src.mlsys.data_structures.sharded_lru_cache import ShardedLRUCache
+
+
+class GlobalLockLRUCache:
+    def __init__(self, capacity: int):
+        self._cache = LRUCache(capacity)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=_MISSING):
+        with self._lock:
+            return self._cache.get(key, default)
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._cache.put(key, value)
+
+
+def bench(cache, threads: int, ops_per_thread: int, key_space: int) -> float:
+    barrier = threading.Barrier(threads)
+    spans = []
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        keys = [rng.randrange(key_space) for _ in range(ops_per_thread)]
+        get, put = cache.get, cache.put
+        barrier.wait()
+        start = time.perf_counter()
+        for i, k in enumerate(keys):
+            if i % 10 == 0:
+                put(k, i)
+            else:
+                get(k, None)
+        spans.append((start, time.perf_counter()))
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    wall = max(end for _, end in spans) - min(start for start, _ in spans)
+    return threads * ops_per_thread / wall
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--ops", type=int, default=200_000, help="operations per thread")
+    parser.add_argument("--capacity", type=int, default=100_000)
+    parser.add_argument("--shards", type=int, default=16)
+    args = parser.parse_args()
+
+    print(f"{'threads':>8} {'global lock ops/s':>18} {'sharded ops/s':>15}")
+    for n in args.threads:
+        single = bench(GlobalLockLRUCache(args.capacity), n, args.ops, args.capacity * 2)
+        sharded = bench(ShardedLRUCache(args.capacity, args.shards), n, args.ops, args.capacity * 2)
+        print(f"{n:>8} {single:>18,.0f} {sharded:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Steady-state cost of TTL expiry in LRUCache with entries expiring continuously.
+
+    python3 -m benchmarks.lru_ttl_expiry --live 1000000 --ops 1000000
+
+A fake clock advances one tick per operation and every entry gets a TTL of
+--live ticks, so the cache holds about --live entries and each put is matched
+by one expiry. The baseline is the same put/get mix on a cache that never
+expires anything and evicts by capacity instead.
+"""
+import argparse
+import random
+import time
+
+from src.mlsys.data_structures.lru_cache import LRUCache
+
+
+class TickClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def bench(live: int, ops: int, ttl: bool) -> dict:
+    clock = TickClock()
+    # with TTLs, capacity is never the binding limit
+    cache = LRUCache(live * 2 if ttl else live, default_ttl=live if ttl else None, clock=clock)
+    rng = random.Random(0)
+    for i in range(live):
+        clock.now += 1
+        cache.put(i, i)
+    probes = [rng.randrange(ops) for _ in range(ops)]
+
+    start = time.perf_counter()
+    for i in range(ops):
+        clock.now += 1
+        cache.put(live + i, i)
+        cache.get(live + probes[i] % (i + 1), None)
+    secs = time.perf_counter() - start
+    return {"ns_per_op": secs / (2 * ops) * 1e9, "size": len(cache)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--live", type=int, default=1_000_000)
+    parser.add_argument("--ops", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{'mode':>12} {'ns/op':>8} {'entries at end':>15}")
+    for name, ttl in (("capacity", False), ("ttl expiry", True)):
+        r = bench(args.live, args.ops, ttl)
+        print(f"{name:>12} {r['ns_per_op']:>8.0f} {r['size']:>15,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Process RSS under a mixed-size numpy workload: count-capped vs byte-budgeted LRUCache.
+
+    python3 -m benchmarks.lru_weighted_rss --budget-mb 256 --ops 2000
+
+Values are arrays from a few KB up to --max-mb, drawn log-uniformly, mimicking
+embeddings next to KV blocks. The count-capped cache is sized so its *average*
+footprint matches the budget; the weighted cache enforces the budget itself.
+Each cache runs in a fresh process so allocator state from one run can't
+hide the other's footprint; RSS is read from /proc/self/statm (Linux). RSS also includes memory the
+allocator has freed but not yet returned to the OS, so the traced peak is the
+tighter view of what the cache itself holds.
+"""
+import argparse
+import math
+import multiprocessing
+import os
+import random
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.mlsys.data_structures.lru_cache import LRUCache
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def bench(name: str, capacity: int, budget: int | None, sizes: list, keys: list) -> dict:
+    cache = LRUCache(capacity, max_weight=budget)
+    base = _rss_mb()
+    peak = base
+    tracemalloc.start()  # numpy reports its buffers to tracemalloc
+    for key, size in zip(keys, sizes, strict=True):
+        if key in cache:
+            cache.get(key)
+        else:
+            cache.put(key, np.ones(size, dtype=np.uint8))
+        peak = max(peak, _rss_mb())
+    traced_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    cached_mb = sum(v.nbytes for v in cache.values()) / 2**20
+    return {
+        "peak_mb": peak - base,
+        "end_mb": _rss_mb() - base,
+        "traced_peak_mb": traced_peak / 2**20,
+        "cached_mb": cached_mb,
+        "entries": len(cache),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-mb", type=int, default=256)
+    parser.add_argument("--max-mb", type=int, default=64)
+    parser.add_argument("--ops", type=int, default=2_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    lo, hi = math.log(4 * 2**10), math.log(args.max_mb * 2**20)
+    n_keys = args.ops // 2
+    size_of = [int(math.exp(rng.uniform(lo, hi))) for _ in range(n_keys)]
+    keys = [rng.randrange(n_keys) for _ in range(args.ops)]
+    sizes = [size_of[k] for k in keys]
+    mean = sum(size_of) / n_keys
+    budget = args.budget_mb * 2**20
+
+    print(
+        f"{'cache':>14} {'entries':>8} {'cached MB':>10} {'traced peak MB':>15}"
+        f" {'peak RSS +MB':>13} {'end RSS +MB':>12}"
+    )
+    runs = (
+        ("count-capped", max(1, int(budget / mean)), None),
+        ("byte-budgeted", args.ops, budget),
+    )
+    for name, capacity, max_weight in runs:
+        with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            r = pool.submit(bench, name, capacity, max_weight, sizes, keys).result()
+        print(
+            f"{name:>14} {r['entries']:>8} {r['cached_mb']:>10.1f} {r['traced_peak_mb']:>15.1f}"
+            f" {r['peak_mb']:>13.1f} {r['end_mb']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
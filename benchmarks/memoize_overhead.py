@@ -0,0 +1,64 @@
+"""
+Per-call overhead of lru_memoize against functools.lru_cache.
+
+    python3 -m benchmarks.memoize_overhead --calls 1000000
+
+The wrapped function returns its argument, so the timings are almost all
+decorator overhead: key building, the cache lookup and the bookkeeping.
+  hit   every call finds its key (a small set of keys, warmed up first)
+  miss  every call is a new key, so each call inserts and, once the cache
+        is full, evicts
+Both are run with an int argument (the single-argument fast path) and with
+two positional plus one keyword argument.
+"""
+import argparse
+import functools
+import time
+
+from src.mlsys.data_structures.memoize import lru_memoize
+
+
+def make(decorator, maxsize: int):
+    @decorator(maxsize=maxsize)
+    def one(x):
+        return x
+
+    @decorator(maxsize=maxsize)
+    def three(x, y, z=0):
+        return x
+
+    return one, three
+
+
+def time_calls(fn, keys: list, kwargs: bool) -> float:
+    start = time.perf_counter()
+    if kwargs:
+        for k in keys:
+            fn(k, 1, z=2)
+    else:
+        for k in keys:
+            fn(k)
+    return (time.perf_counter() - start) / len(keys) * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--maxsize", type=int, default=1024)
+    args = parser.parse_args()
+
+    hot = list(range(args.maxsize // 2)) * (args.calls // (args.maxsize // 2))
+    cold = list(range(args.calls))
+    print(f"{'decorator':>20} {'args':>6} {'hit ns':>8} {'miss ns':>8}")
+    for name, decorator in (("functools.lru_cache", functools.lru_cache), ("lru_memoize", lru_memoize)):
+        for label, kwargs in (("1", False), ("2+kw", True)):
+            one, three = make(decorator, args.maxsize)
+            fn = three if kwargs else one
+            time_calls(fn, hot[: args.maxsize], kwargs)  # warm up
+            hit = time_calls(fn, hot, kwargs)
+            miss = time_calls(fn, [k + args.calls for k in cold], kwargs)
+            print(f"{name:>20} {label:>6} {hit:>8.0f} {miss:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Aggregate hit rate and memory of 8 pool workers: per-process vs shared cache.
+
+    python3 -m benchmarks.shared_cache_workers --workers 8 --capacity 20000
+
+A Zipf(--alpha) stream of --requests keys over --keys distinct ids is split
+round-robin across the workers; each request is a read-through lookup whose
+miss "computes" a --value-bytes payload and caches it.
+  per-process  every worker owns an LRUCache of --capacity entries
+  shared       one SharedMemoryCache of --capacity entries, all workers attached
+  shared xN    one SharedMemoryCache of --capacity * workers entries, i.e. the
+               same total entry budget as the per-process caches
+Memory is the workers' summed PSS growth (/proc/self/smaps_rollup, Linux):
+PSS splits each shared page between the processes mapping it, so the
+segment is counted once rather than once per worker as RSS would.
+"""
+import argparse
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.mlsys.data_structures.lru_cache import LRUCache
+from src.mlsys.data_structures.shared_memory_cache import SharedMemoryCache
+
+
+def _pss_mb() -> float:
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError("no Pss line in smaps_rollup")
+
+
+def run_worker(cache, capacity: int, keys: list, value_bytes: int, start_at: float) -> tuple:
+    if cache is None:
+        cache = LRUCache(capacity)
+    base = _pss_mb()
+    while time.time() < start_at:  # line the workers up so they really overlap
+        time.sleep(0.001)
+    hits = 0
+    for k in keys:
+        if cache.get(k, None) is None:
+            cache.put(k, k.to_bytes(8, "little") * (value_bytes // 8))
+        else:
+            hits += 1
+    return hits, len(keys), _pss_mb() - base
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--capacity", type=int, default=20_000)
+    parser.add_argument("--requests", type=int, default=400_000)
+    parser.add_argument("--keys", type=int, default=200_000)
+    parser.add_argument("--alpha", type=float, default=0.9)
+    parser.add_argument("--value-bytes", type=int, default=256)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    p = np.arange(1, args.keys + 1, dtype=np.float64) ** -args.alpha
+    stream = rng.choice(args.keys, size=args.requests, p=p / p.sum()).tolist()
+    chunks = [stream[w :: args.workers] for w in range(args.workers)]
+    value_size = args.value_bytes + 64  # pickle framing
+
+    print(f"{'cache':>12} {'entries/worker':>15} {'hit rate':>9} {'PSS +MB':>9} {'seconds':>8}")
+    configs = (("per-process", 1), ("shared", 1), (f"shared x{args.workers}", args.workers))
+    ctx = multiprocessing.get_context("spawn")
+    for name, scale in configs:
+        capacity = args.capacity * scale
+        shared = None if name == "per-process" else SharedMemoryCache(capacity, 16, value_size)
+        try:
+            with ProcessPoolExecutor(args.workers, mp_context=ctx) as pool:
+                list(pool.map(abs, range(args.workers)))  # start the workers first
+                start_at = time.time() + 0.5
+                t0 = time.perf_counter()
+                futures = [
+                    pool.submit(run_worker, shared, capacity, chunk, args.value_bytes, start_at) for chunk in chunks
+                ]
+                results = [f.result() for f in futures]
+                secs = time.perf_counter() - t0 - 0.5
+        finally:
+            if shared is not None:
+                shared.close()
+                shared.unlink()
+        hits = sum(r[0] for r in results)
+        total = sum(r[1] for r in results)
+        pss = sum(r[2] for r in results)
+        per_worker = capacity if name == "per-process" else f"{capacity} shared"
+        print(f"{name:>12} {per_worker!s:>15} {hits / total:>9.3f} {pss:>9.1f} {secs:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,408 @@
+"""
+Benchmark suite: HashMap vs dict, LRUCache vs OrderedDict and functools.lru_cache.
+
+    python3 -m benchmarks run --sizes 1000 100000 1000000 --out results.json
+    python3 -m benchmarks compare baseline.json results.json --threshold 0.10
+
+run measures throughput and per-op latency percentiles of set/get/delete/
+contains/iterate (maps) and put/get/delete/contains/iterate (LRU caches,
+where get is a read-through: a miss is followed by a put; every
+implementation replays the same keys, half of them misses) for every size
+and key distribution:
+  uniform  distinct random ints; lookups spread evenly over them
+  zipf     the same keys, lookups drawn from Zipf(--zipf-alpha)
+  collide  ints whose low 32 bits are zero, so every key lands in the same
+           bucket of a power-of-two or modulo-indexed table; dict perturbs
+           its probes with the high bits and shrugs it off. Quadratic for
+           HashMap, so sizes above --max-collide are skipped.
+Throughput is the best of --repeat tight loops over bound methods, each on
+a fresh structure. Latencies come from
+a second pass on a fresh structure that times a sample of the ops
+individually, minus the measured cost of timing an empty call.
+
+compare matches rows of two result files and flags every row whose
+throughput dropped by more than --threshold; it exits 1 if any did.
+Each row also records a short calibration loop timed next to it, and
+compare scales by it (see compare()) unless --raw is given.
+"""
+import argparse
+import functools
+import json
+import platform
+import random
+import sys
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from src.mlsys.data_structures.hashmap import HashMap
+from src.mlsys.data_structures.lru_cache import LRUCache
+
+DISTS = ("uniform", "zipf", "collide")
+MAP_IMPLS = ("HashMap[chained]", "HashMap[open]", "dict")
+LRU_IMPLS = ("LRUCache", "OrderedDict", "functools.lru_cache")
+MAP_OPS = ("set", "get", "contains", "delete", "iterate")
+LRU_OPS = ("put", "get", "contains", "delete", "iterate")
+
+
+class OrderedDictLRU:
+    """The textbook OrderedDict LRU, as the baseline for LRUCache."""
+
+    def __init__(self, capacity: int):
+        self._capacity = capacity
+        self._od = OrderedDict()
+
+    def get(self, key, default=None):
+        od = self._od
+        if key not in od:
+            return default
+        od.move_to_end(key)
+        return od[key]
+
+    def put(self, key, value) -> None:
+        od = self._od
+        if key in od:
+            od.move_to_end(key)
+        elif len(od) >= self._capacity:
+            od.popitem(last=False)
+        od[key] = value
+
+    def delete(self, key) -> None:
+        del self._od[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._od
+
+    def items(self):
+        return self._od.items()
+
+
+# ----------------------------
+# Workloads
+# ----------------------------
+
+def make_keys(dist: str, size: int, seed: int) -> list[int]:
+    if dist == "collide":
+        return [i << 32 for i in range(1, size + 1)]
+    return random.Random(seed).sample(range(size * 4), size)
+
+
+def make_trace(dist: str, keys: list, length: int, alpha: float, seed: int) -> list:
+    """Lookup order over keys: Zipf-skewed for zipf, uniform otherwise."""
+    rng = np.random.default_rng(seed)
+    if dist == "zipf":
+        p = np.arange(1, len(keys) + 1, dtype=np.float64) ** -alpha
+        idx = rng.choice(len(keys), size=length, p=p / p.sum())
+    else:
+        idx = rng.integers(0, len(keys), size=length)
+    return [keys[i] for i in idx.tolist()]
+
+
+def _new_map(impl: str):
+    if impl == "dict":
+        return {}
+    return HashMap(backend="open" if impl == "HashMap[open]" else "chained")
+
+
+def _map_methods(table) -> dict:
+    if isinstance(table, dict):
+        return {"set": table.__setitem__, "get": table.__getitem__, "delete": table.__delitem__}
+    return {"set": table.set, "get": table.get, "delete": table.delete}
+
+
+def map_case(impl: str, op: str, keys: list, trace: list, misses: list):
+    """(callable, items, arity) for one op on a freshly built map."""
+    table = _new_map(impl)
+    methods = _map_methods(table)
+    if op == "set":
+        return methods["set"], [(k, k) for k in keys], 2
+    for k in keys:
+        methods["set"](k, k)
+    if op == "get":
+        return methods["get"], trace, 1
+    if op == "contains":
+        # half hits, half misses
+        return table.__contains__, [x for pair in zip(trace, misses, strict=False) for x in pair], 1
+    if op == "delete":
+        return methods["delete"], keys, 1
+    return table.__iter__, None, 0
+
+
+def _new_lru(impl: str, capacity: int):
+    if impl == "LRUCache":
+        return LRUCache(capacity)
+    return OrderedDictLRU(capacity)
+
+
+def lru_case(impl: str, op: str, keys: list, trace: list, misses: list):
+    """(callable, items, arity), or None where the implementation lacks the op."""
+    capacity = len(keys)
+    # every impl's get replays the same keys: the trace interleaved with
+    # fresh ones, so half the calls miss, put and evict
+    lookups = [t if i % 2 else m for i, (t, m) in enumerate(zip(trace, misses, strict=False))]
+    if impl == "functools.lru_cache":
+        cached = functools.lru_cache(maxsize=capacity)(_identity)
+        if op not in ("put", "get"):
+            return None
+        if op == "get":
+            for k in keys:
+                cached(k)
+        # a call is a read-through get; on fresh keys it is a put
+        return cached, keys if op == "put" else lookups, 1
+    cache = _new_lru(impl, capacity)
+    if op == "put":
+        return cache.put, [(k, k) for k in keys], 2
+    for k in keys:
+        cache.put(k, k)
+    if op == "get":
+        get, put = cache.get, cache.put
+
+        def read_through(k):
+            if get(k, None) is None:
+                put(k, k)
+
+        return read_through, lookups, 1
+    if op == "contains":
+        return cache.__contains__, [x for pair in zip(trace, misses, strict=False) for x in pair], 1
+    if op == "delete":
+        return cache.delete, keys, 1
+    return lambda: iter(cache.items()), None, 0
+
+
+def _identity(x):
+    return x
+
+
+# ----------------------------
+# Timing
+# ----------------------------
+
+def _run_bulk(fn, items, arity: int) -> tuple[float, int]:
+    start = time.perf_counter()
+    if arity == 2:
+        for a, b in items:
+            fn(a, b)
+    elif arity == 1:
+        for a in items:
+            fn(a)
+    else:
+        n = 0
+        for _ in fn():
+            n += 1
+        return time.perf_counter() - start, n
+    return time.perf_counter() - start, len(items)
+
+
+def _noop(*args):
+    pass
+
+
+def _sample_latencies(fn, items, arity: int, samples: int) -> list[int]:
+    clock = time.perf_counter_ns
+    stride = max(1, len(items) // samples)
+    out = []
+    for i, item in enumerate(items):
+        if i % stride:
+            fn(*item) if arity == 2 else fn(item)
+            continue
+        if arity == 2:
+            t0 = clock()
+            fn(*item)
+        else:
+            t0 = clock()
+            fn(item)
+        out.append(clock() - t0)
+    return out
+
+
+def _timer_overhead() -> float:
+    clock = time.perf_counter_ns
+    lat = []
+    for i in range(20_000):
+        t0 = clock()
+        _noop(i)
+        lat.append(clock() - t0)
+    return float(np.median(lat))
+
+
+def _calibrate(n: int = 20_000, repeat: int = 3) -> float:
+    """Speed of a fixed pure-Python dict workload, to normalise away machine drift."""
+    best = float("inf")
+    for _ in range(repeat):
+        d = {}
+        start = time.perf_counter()
+        for i in range(n):
+            d[i] = i
+        for i in range(n):
+            d.get(i)
+        best = min(best, time.perf_counter() - start)
+    return 2 * n / best
+
+
+def measure(make_case, repeat: int, samples: int, overhead: float, min_time: float = 0.02) -> dict | None:
+    case = make_case()
+    if case is None:
+        return None
+    # best of `repeat` runs, as timeit does: slower runs measure interference
+    # from the rest of the machine, not the code. Each run chains passes over
+    # fresh state until min_time has been timed, so small sizes are not
+    # dominated by a single scheduler hiccup.
+    best = float("inf")
+    for _ in range(repeat):
+        secs, n = 0.0, 0
+        while secs < min_time:
+            fn, items, arity = case
+            dt, k = _run_bulk(fn, items, arity)
+            secs, n = secs + dt, n + k
+            case = make_case()
+        best = min(best, secs / n if n else float("inf"))
+    row = {"ops_per_s": 1 / best if best else float("inf"), "ops": k, "calibration_ops_per_s": _calibrate()}
+    if arity:
+        fn, items, arity = make_case()  # fresh state for the timed pass
+        lat = np.maximum(np.array(_sample_latencies(fn, items, arity, samples)) - overhead, 0)
+        row.update({f"p{q}_ns": float(np.percentile(lat, q)) for q in (50, 90, 99)})
+    else:
+        row.update({"p50_ns": None, "p90_ns": None, "p99_ns": None})
+    return row
+
+
+def run(args) -> dict:
+    overhead = _timer_overhead()
+    results = []
+    suites = {"map": (MAP_IMPLS, MAP_OPS, map_case), "lru": (LRU_IMPLS, LRU_OPS, lru_case)}
+    for size in args.sizes:
+        for dist in args.dists:
+            if dist == "collide" and size > args.max_collide:
+                print(f"skip collide size={size} (> --max-collide)", file=sys.stderr)
+                continue
+            keys = make_keys(dist, size, args.seed)
+            length = min(max(size, 1_000), args.ops)
+            trace = make_trace(dist, keys, length, args.zipf_alpha, args.seed)
+            # keys guaranteed absent: odd multiples shifted past the key range
+            misses = [(size * 4 + 1 + 2 * i) << (32 if dist == "collide" else 0) for i in range(length)]
+            for suite in args.suites:
+                impls, ops, case_fn = suites[suite]
+                for impl in impls:
+                    for op in ops:
+                        row = measure(
+                            functools.partial(case_fn, impl, op, keys, trace, misses),
+                            args.repeat,
+                            args.latency_samples,
+                            overhead,
+                            args.min_time,
+                        )
+                        if row is None:
+                            continue
+                        row = {"suite": suite, "impl": impl, "dist": dist, "size": size, "op": op, **row}
+                        results.append(row)
+                        print(_format_row(row), file=sys.stderr)
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "timer_overhead_ns": overhead,
+            "args": {k: v for k, v in vars(args).items() if k != "func"},
+        },
+        "results": results,
+    }
+
+
+def _format_row(row: dict) -> str:
+    p = " ".join(f"{row[f'p{q}_ns']:>8.0f}" if row[f"p{q}_ns"] is not None else f"{'-':>8}" for q in (50, 90, 99))
+    return (
+        f"{row['suite']:>4} {row['impl']:>20} {row['dist']:>8} {row['size']:>9} {row['op']:>8}"
+        f" {row['ops_per_s']:>13,.0f} {p}"
+    )
+
+
+# ----------------------------
+# Compare
+# ----------------------------
+
+def _row_key(row: dict) -> tuple:
+    return row["suite"], row["impl"], row["dist"], row["size"], row["op"]
+
+
+def compare(old: dict, new: dict, threshold: float, normalize: bool = True) -> list[dict]:
+    """
+    Rows present in both files, with the throughput ratio new/old and a regression flag.
+
+    With normalize, each ratio is divided by the ratio of the calibration
+    loops timed next to the two rows, so a machine that was slower while a
+    row ran (another tenant, a lower clock) does not read as a regression.
+    """
+    baseline = {_row_key(r): r for r in old["results"]}
+    out = []
+    for row in new["results"]:
+        before = baseline.get(_row_key(row))
+        if before is None:
+            continue
+        ratio = row["ops_per_s"] / before["ops_per_s"]
+        if normalize:
+            ratio /= row["calibration_ops_per_s"] / before["calibration_ops_per_s"]
+        out.append({"key": _row_key(row), "ratio": ratio, "regression": ratio < 1 - threshold})
+    return out
+
+
+def _compare_cmd(args) -> int:
+    with open(args.old) as f:
+        old = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    rows = compare(old, new, args.threshold, normalize=not args.raw)
+    regressions = [r for r in rows if r["regression"]]
+    for r in rows if args.all else regressions:
+        suite, impl, dist, size, op = r["key"]
+        flag = "REGRESSION" if r["regression"] else ""
+        print(f"{suite:>4} {impl:>20} {dist:>8} {size:>9} {op:>8} {r['ratio']:>7.2f}x {flag}")
+    print(f"{len(regressions)} of {len(rows)} rows regressed by more than {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def _run_cmd(args) -> int:
+    print(
+        f"{'':>4} {'impl':>20} {'dist':>8} {'size':>9} {'op':>8} {'ops/s':>13} {'p50 ns':>8} {'p90 ns':>8}"
+        f" {'p99 ns':>8}",
+        file=sys.stderr,
+    )
+    report = run(args)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=1)
+    else:
+        json.dump(report, sys.stdout, indent=1)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python3 -m benchmarks", description=__doc__.splitlines()[1])
+    sub = parser.add_subparsers(required=True)
+
+    p_run = sub.add_parser("run", help="run the suite and write JSON results")
+    p_run.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    p_run.add_argument("--dists", nargs="+", choices=DISTS, default=list(DISTS))
+    p_run.add_argument("--suites", nargs="+", choices=("map", "lru"), default=["map", "lru"])
+    p_run.add_argument("--ops", type=int, default=200_000, help="max lookups per measurement")
+    p_run.add_argument("--repeat", type=int, default=5, help="throughput runs per row; the best is kept")
+    p_run.add_argument(
+        "--min-time", type=float, default=0.02, help="seconds each throughput run is timed for, over repeated passes"
+    )
+    p_run.add_argument("--latency-samples", type=int, default=10_000)
+    p_run.add_argument("--zipf-alpha", type=float, default=1.0)
+    p_run.add_argument("--max-collide", type=int, default=2_000)
+    p_run.add_argument("--seed", type=int, default=0)
+    p_run.add_argument("--out", help="write JSON here instead of stdout")
+    p_run.set_defaults(func=_run_cmd)
+
+    p_cmp = sub.add_parser("compare", help="flag throughput regressions between two result files")
+    p_cmp.add_argument("old")
+    p_cmp.add_argument("new")
+    p_cmp.add_argument("--threshold", type=float, default=0.10, help="allowed relative throughput drop")
+    p_cmp.add_argument("--all", action="store_true", help="print every matched row, not only regressions")
+    p_cmp.add_argument("--raw", action="store_true", help="compare raw throughput, without calibration scaling")
+    p_cmp.set_defaults(func=_compare_cmd)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
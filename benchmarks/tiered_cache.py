@@ -0,0 +1,105 @@
+"""
+Hit rate and latency per tier: LRUCache alone vs TieredCache, working set 10x memory.
+
+    python3 -m benchmarks.tiered_cache --capacity 2000 --requests 100000 --dim 256
+
+A Zipf(--alpha) stream of --requests lookups over 10 * --capacity distinct
+ids; each value is a float32 embedding of --dim elements. A miss
+"recomputes" the embedding (--compute-us of busy work) and puts it.
+  memory   LRUCache(--capacity): everything it evicts is lost
+  tiered   TieredCache(--capacity) spilling to a disk tier sized for
+           --disk-fraction of the working set, in a temp dir under --dir
+Latency is per get(), split by the tier that answered it; "miss" excludes
+the recompute. Hit rates show how much recomputation the disk tier saves.
+"""
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from src.mlsys.data_structures.lru_cache import LRUCache
+from src.mlsys.data_structures.tiered_cache import TieredCache
+
+_ABSENT = object()
+
+
+def compute(key: int, dim: int, compute_us: float) -> np.ndarray:
+    deadline = time.perf_counter() + compute_us / 1e6
+    while time.perf_counter() < deadline:
+        pass
+    return np.full(dim, key, dtype=np.float32)
+
+
+def run(cache, trace: np.ndarray, dim: int, compute_us: float) -> tuple[dict, float]:
+    tiered = isinstance(cache, TieredCache)
+    lat: dict[str, list] = {"memory": [], "buffer": [], "disk": [], "miss": []}
+    clock = time.perf_counter_ns
+    start = time.perf_counter()
+    for key in trace.tolist():
+        before = cache.info() if tiered else None
+        t0 = clock()
+        value = cache.get(key, _ABSENT)
+        dt = clock() - t0
+        if value is _ABSENT:
+            lat["miss"].append(dt)
+            cache.put(key, compute(key, dim, compute_us))
+        elif not tiered:
+            lat["memory"].append(dt)
+        else:
+            after = cache.info()
+            if after.disk_hits > before.disk_hits:
+                lat["disk"].append(dt)
+            elif after.buffer_hits > before.buffer_hits:
+                lat["buffer"].append(dt)
+            else:
+                lat["memory"].append(dt)
+    return lat, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--capacity", type=int, default=2_000)
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--alpha", type=float, default=0.9)
+    parser.add_argument("--compute-us", type=float, default=200.0)
+    parser.add_argument("--disk-fraction", type=float, default=1.0)
+    parser.add_argument("--dir", default=None, help="parent directory of the disk tier (default: system temp)")
+    args = parser.parse_args()
+
+    keys = 10 * args.capacity
+    rng = np.random.default_rng(0)
+    ranks = np.arange(1, keys + 1, dtype=np.float64)
+    p = ranks**-args.alpha
+    # shuffle ids so popularity is not correlated with key order
+    trace = rng.permutation(keys)[rng.choice(keys, size=args.requests, p=p / p.sum())]
+    value_bytes = 4 * args.dim + 200  # pickled array: data plus header
+    disk_bytes = int(args.disk_fraction * keys * value_bytes)
+
+    print(
+        f"working set {keys} keys x {4 * args.dim} B, memory {args.capacity} entries, "
+        f"disk {disk_bytes / 2**20:.1f} MiB"
+    )
+    print(f"{'cache':>7} {'tier':>7} {'hit %':>7} {'p50 us':>8} {'p99 us':>8} {'total s':>8}")
+    memory = LRUCache(args.capacity)
+    with tempfile.TemporaryDirectory(dir=args.dir) as d:
+        tiered = TieredCache(args.capacity, disk_max_bytes=disk_bytes, directory=d)
+        try:
+            for name, cache in (("memory", memory), ("tiered", tiered)):
+                lat, total = run(cache, trace, args.dim, args.compute_us)
+                for tier, samples in lat.items():
+                    if not samples:
+                        continue
+                    us = np.array(samples) / 1000
+                    share = 100 * len(samples) / len(trace)
+                    print(
+                        f"{name:>7} {tier:>7} {share:>7.1f} {np.percentile(us, 50):>8.1f}"
+                        f" {np.percentile(us, 99):>8.1f} {total:>8.2f}"
+                    )
+        finally:
+            tiered.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .lru_cache import _MISSING, LRUCache
+
+Loader = Callable[[], Awaitable[Any]]
+_ABSENT = object()  # LRUCache.get raises for _MISSING, so misses need their own sentinel
+
+
+class AsyncLoadingCache:
+    """
+    asyncio read-through cache over LRUCache with single-flight loading.
+
+    get_or_load(key, loader) returns the cached value or awaits loader(). All
+    concurrent misses for a key share one in-flight load task, so a cold hot
+    key costs one loader call, not one per caller. Waiters await the task
+    through asyncio.shield: cancelling a waiter abandons only that waiter,
+    and the load still fills the cache for everyone else. A loader exception
+    is raised in every waiter of that load and is not cached; the next call
+    starts a fresh load.
+
+    With a ttl, entries expire like LRUCache entries. refresh_ahead (same
+    units as ttl) starts a background reload when a hit lands within that
+    window of the deadline; callers keep getting the current value until the
+    reload replaces it, and a failed refresh leaves it to expire as usual.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        ttl: float | None = None,
+        refresh_ahead: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if refresh_ahead is not None:
+            if ttl is None:
+                raise ValueError("refresh_ahead needs a ttl")
+            if not 0 < refresh_ahead < ttl:
+                raise ValueError("refresh_ahead must be in (0, ttl)")
+        self._cache = LRUCache(capacity, default_ttl=ttl, clock=clock)
+        self._refresh_ahead = refresh_ahead
+        self._clock = clock
+        self._inflight: dict[Any, asyncio.Task] = {}
+        self.loads = 0  # loader calls started, for single-flight accounting
+
+    async def get_or_load(self, key, loader: Loader) -> Any:
+        value = self._cache.get(key, _ABSENT)
+        if value is not _ABSENT:
+            if self._refresh_ahead is not None and key not in self._inflight and self._due_for_refresh(key):
+                self._start_load(key, loader)
+            return value
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_load(key, loader)
+        return await asyncio.shield(task)
+
+    def get(self, key, default=_MISSING) -> Any:
+        """Cached value only; never starts a load."""
+        return self._cache.get(key, default)
+
+    def put(self, key, value) -> None:
+        # a load already in flight for key would overwrite this, so drop it
+        self._inflight.pop(key, None)
+        self._cache.put(key, value)
+
+    def invalidate(self, key) -> None:
+        """Forget key; a load in flight still answers its waiters but is not cached."""
+        self._inflight.pop(key, None)
+        if key in self._cache:
+            self._cache.delete(key)
+
+    def clear(self) -> None:
+        self._inflight.clear()
+        self._cache.clear()
+
+    def __contains__(self, key) -> bool:
+        return key in self._cache
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __repr__(self) -> str:
+        return f"AsyncLoadingCache(size={len(self._cache)}, inflight={len(self._inflight)})"
+
+    def _due_for_refresh(self, key) -> bool:
+        expiry = self._cache._expiry
+        if expiry is None or key not in expiry:
+            return False
+        return expiry.priority(key) - self._clock() <= self._refresh_ahead
+
+    def _start_load(self, key, loader: Loader) -> asyncio.Task:
+        self.loads += 1
+        task = asyncio.ensure_future(self._load(key, loader))
+        self._inflight[key] = task
+        # mark the outcome retrieved even if every waiter was cancelled, so
+        # asyncio does not warn about an unobserved exception
+        task.add_done_callback(_observe)
+        return task
+
+    async def _load(self, key, loader: Loader) -> Any:
+        task = asyncio.current_task()
+        try:
+            value = await loader()
+        finally:
+            # only the load that is still registered may clear or fill the
+            # slot; invalidate() or put() may have replaced it meanwhile
+            current = self._inflight.get(key) is task
+            if current:
+                del self._inflight[key]
+        if current:
+            self._cache.put(key, value)
+        return value
+
+
+def _observe(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()
@@ -0,0 +1,317 @@
+from typing import Any
+
+from .hashmap import _GOLDEN, _MASK64
+from .lru_cache import _MISSING, LRUCache, Node
+
+_HALVE = bytes(i >> 1 for i in range(256))
+
+
+def _segment(capacity: int) -> LRUCache:
+    # segments are sized by their owning policy, never by LRUCache itself
+    return LRUCache(max(1, capacity))
+
+
+class SLRUCache:
+    """
+    Segmented LRU: a probationary and a protected LRUCache segment.
+
+    New keys enter probation; a second hit promotes them to protected, whose
+    LRU end is demoted back to probation when it overflows. Evictions come
+    from probation first, so a one-off scan only churns probation and leaves
+    the protected working set alone.
+    """
+
+    def __init__(self, capacity: int, protected_ratio: float = 0.8):
+        if capacity <= 0:
+            raise ValueError
+        self._capacity = capacity
+        self._protected_capacity = min(int(capacity * protected_ratio), capacity - 1)
+        self._probation = _segment(capacity)
+        self._protected = _segment(capacity)
+
+    def get(self, key, default=_MISSING) -> Any:
+        node = self._protected._get_node(key)
+        if node is not None:
+            self._protected._move_to_end(node)
+            return node._value
+        node = self._probation._get_node(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self._promote(node)
+        return node._value
+
+    def put(self, key, value) -> None:
+        node = self._protected._get_node(key)
+        if node is not None:
+            node._value = value
+            self._protected._move_to_end(node)
+            return
+        node = self._probation._get_node(key)
+        if node is not None:
+            node._value = value
+            self._promote(node)
+            return
+        if len(self) >= self._capacity:
+            self._evict()
+        self._probation.put(key, value)
+
+    def delete(self, key) -> None:
+        if key in self._protected:
+            self._protected.delete(key)
+        else:
+            self._probation.delete(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._protected or key in self._probation
+
+    def __len__(self) -> int:
+        return len(self._probation) + len(self._protected)
+
+    def __repr__(self) -> str:
+        return (
+            f"SLRUCache(capacity={self._capacity}, probation={len(self._probation)},"
+            f" protected={len(self._protected)})"
+        )
+
+    def _promote(self, node: Node) -> None:
+        if self._protected_capacity == 0:
+            self._probation._move_to_end(node)
+            return
+        self._probation.delete(node._key)
+        if len(self._protected) >= self._protected_capacity:
+            demoted = self._protected._evict()
+            self._probation.put(demoted._key, demoted._value)
+        self._protected.put(node._key, node._value)
+
+    def _victim(self) -> Node:
+        # the entry _evict would remove, without removing it
+        segment = self._probation if len(self._probation) else self._protected
+        return segment.head._next
+
+    def _evict(self) -> Node:
+        segment = self._probation if len(self._probation) else self._protected
+        return segment._evict()
+
+
+class ARCCache:
+    """
+    Adaptive Replacement Cache (Megiddo & Modha, 2003).
+
+    T1 holds keys seen once recently, T2 keys seen at least twice; B1 and B2
+    are ghost lists remembering keys recently evicted from each. A ghost hit
+    in B1 means T1 was too small and grows the target size p, a hit in B2
+    shrinks it, so the split between recency and frequency adapts to the
+    trace. Only T1 + T2 hold values, at most `capacity` of them.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError
+        self._capacity = capacity
+        self._p = 0.0
+        self._t1, self._t2 = _segment(capacity), _segment(capacity)
+        self._b1, self._b2 = _segment(capacity), _segment(capacity)
+
+    def get(self, key, default=_MISSING) -> Any:
+        node = self._t1._get_node(key)
+        if node is not None:
+            self._t1.delete(key)
+            self._t2.put(key, node._value)
+            return node._value
+        node = self._t2._get_node(key)
+        if node is not None:
+            self._t2._move_to_end(node)
+            return node._value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def put(self, key, value) -> None:
+        c, t1, t2, b1, b2 = self._capacity, self._t1, self._t2, self._b1, self._b2
+        if key in t1:
+            t1.delete(key)
+            t2.put(key, value)
+            return
+        if key in t2:
+            t2.put(key, value)
+            return
+        if key in b1:
+            self._p = min(c, self._p + max(len(b2) / len(b1), 1))
+            b1.delete(key)
+            self._replace(in_b2=False)
+            t2.put(key, value)
+            return
+        if key in b2:
+            self._p = max(0.0, self._p - max(len(b1) / len(b2), 1))
+            b2.delete(key)
+            self._replace(in_b2=True)
+            t2.put(key, value)
+            return
+        # a key in neither the cache nor the ghosts
+        l1 = len(t1) + len(b1)
+        if l1 >= c:
+            if len(t1) < c:
+                b1._evict()
+                self._replace(in_b2=False)
+            else:
+                t1._evict()
+        else:
+            total = l1 + len(t2) + len(b2)
+            if total >= c:
+                if total >= 2 * c and len(b2):
+                    b2._evict()
+                self._replace(in_b2=False)
+        t1.put(key, value)
+
+    def delete(self, key) -> None:
+        if key in self._t1:
+            self._t1.delete(key)
+        else:
+            self._t2.delete(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._t1 or key in self._t2
+
+    def __len__(self) -> int:
+        return len(self._t1) + len(self._t2)
+
+    def __repr__(self) -> str:
+        return f"ARCCache(capacity={self._capacity}, p={self._p:.1f}, t1={len(self._t1)}, t2={len(self._t2)})"
+
+    def _replace(self, in_b2: bool) -> None:
+        # evict from T1 or T2 into the matching ghost list, steered by p;
+        # only needed once the cache proper is full
+        t1, t2 = self._t1, self._t2
+        if len(t1) + len(t2) < self._capacity:
+            return
+        if len(t1) and (len(t1) > self._p or (in_b2 and len(t1) == self._p) or not len(t2)):
+            self._b1.put(t1._evict()._key, None)
+        else:
+            self._b2.put(t2._evict()._key, None)
+
+
+class CountMinSketch:
+    """
+    Count-min sketch of 4-bit counters for popularity estimates.
+
+    Each of `depth` rows is a bytearray; row k is indexed by a + k * b, where
+    a and b come from one multiplicative mix of hash(key) (Kirsch-Mitzenmacher
+    double hashing), and estimate() takes the minimum over rows. Counters
+    saturate at 15 and all of them are halved once `sample_size` increments
+    have been recorded, so old popularity fades (the TinyLFU "reset").
+    """
+
+    def __init__(self, width: int, depth: int = 4, sample_size: int | None = None):
+        size = 16
+        while size < width:
+            size <<= 1
+        self._mask = size - 1
+        self._rows = [bytearray(size) for _ in range(depth)]
+        self._sample_size = sample_size or 10 * size
+        self._additions = 0
+
+    def increment(self, key) -> None:
+        mixed = (hash(key) * _GOLDEN) & _MASK64
+        a, b, mask = mixed >> 32, (mixed & 0xFFFFFFFF) | 1, self._mask
+        added = False
+        for row in self._rows:
+            i = a & mask
+            if row[i] < 15:
+                row[i] += 1
+                added = True
+            a += b
+        if added:
+            self._additions += 1
+            if self._additions >= self._sample_size:
+                self._reset()
+
+    def estimate(self, key) -> int:
+        mixed = (hash(key) * _GOLDEN) & _MASK64
+        a, b, mask = mixed >> 32, (mixed & 0xFFFFFFFF) | 1, self._mask
+        lowest = 15
+        for row in self._rows:
+            count = row[a & mask]
+            if count < lowest:
+                lowest = count
+            a += b
+        return lowest
+
+    def _reset(self) -> None:
+        self._rows = [bytearray(row.translate(_HALVE)) for row in self._rows]
+        self._additions //= 2
+
+
+class WTinyLFUCache:
+    """
+    W-TinyLFU (Einziger, Friedman & Manes, 2017), as used by Caffeine.
+
+    A small LRU window (window_ratio of the capacity) absorbs new keys and
+    bursts. A key evicted from the window is only admitted to the main SLRU
+    region if a CountMinSketch estimates it more popular than the entry the
+    main region would evict, so a scan of one-off keys cannot displace the
+    frequently used set.
+    """
+
+    def __init__(self, capacity: int, window_ratio: float = 0.01):
+        if capacity <= 0:
+            raise ValueError
+        self._capacity = capacity
+        self._window_capacity = min(capacity, max(1, int(capacity * window_ratio)))
+        self._main_capacity = capacity - self._window_capacity
+        self._window = _segment(self._window_capacity)
+        self._main = SLRUCache(self._main_capacity) if self._main_capacity else None
+        self._sketch = CountMinSketch(capacity)
+
+    def get(self, key, default=_MISSING) -> Any:
+        self._sketch.increment(key)
+        node = self._window._get_node(key)
+        if node is not None:
+            self._window._move_to_end(node)
+            return node._value
+        if self._main is not None:
+            return self._main.get(key, default)
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def put(self, key, value) -> None:
+        if key in self._window:
+            self._window.put(key, value)
+            return
+        if self._main is not None and key in self._main:
+            self._main.put(key, value)
+            return
+        self._sketch.increment(key)
+        if len(self._window) >= self._window_capacity:
+            self._admit(self._window._evict())
+        self._window.put(key, value)
+
+    def delete(self, key) -> None:
+        if key in self._window:
+            self._window.delete(key)
+        elif self._main is not None:
+            self._main.delete(key)
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._window or (self._main is not None and key in self._main)
+
+    def __len__(self) -> int:
+        return len(self._window) + (len(self._main) if self._main is not None else 0)
+
+    def __repr__(self) -> str:
+        return f"WTinyLFUCache(capacity={self._capacity}, window={self._window_capacity}, size={len(self)})"
+
+    def _admit(self, candidate: Node) -> None:
+        main = self._main
+        if main is None:
+            return
+        if len(main) >= self._main_capacity:
+            victim = main._victim()
+            if self._sketch.estimate(candidate._key) <= self._sketch.estimate(victim._key):
+                return
+            main._evict()
+        main.put(candidate._key, candidate._value)
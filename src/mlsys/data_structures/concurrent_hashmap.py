@@ -0,0 +1,202 @@
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from .hashmap import _GOLDEN, _MASK64, _MISSING
+
+_ABSENT = object()  # a miss in internal lookups, where _MISSING would mean "raise"
+
+
+class _Segment:
+    __slots__ = ("lock", "table", "count")
+
+    def __init__(self, capacity: int):
+        self.lock = threading.Lock()
+        # each bucket is None or an immutable tuple of (hash, key, value)
+        # entries; writers replace whole buckets, so a reader never sees one
+        # half-updated
+        self.table: list[tuple | None] = [None] * capacity
+        self.count = 0
+
+
+class ConcurrentHashMap:
+    """
+    Thread-safe hash map striped over independently locked segments.
+
+    A key's mixed hash picks its segment by the top bits and its bucket
+    within the segment's table by the bits below, so strided int keys still
+    spread. Writers take only their segment's lock, and a segment resizes on
+    its own, so writers to different segments never wait for each other.
+
+    Reads take no lock. Buckets are immutable tuples that writers replace
+    whole, and a resize fills a new table before swapping it in, so a
+    reader holding either table sees every entry that was committed when it
+    looked; a table is never modified once it has been replaced.
+
+    compute_if_absent() and update() are atomic per key. They run the
+    caller's function under the segment lock, so keep it cheap: it stalls
+    every writer of that segment, and calling back into the map from it
+    deadlocks.
+
+    len() and iteration are weakly consistent, as in ShardedLRUCache: they
+    never raise on concurrent writes and yield each key at most once, but
+    may or may not reflect writes made while they run.
+    """
+
+    def __init__(self, initial_capacity: int = 16, load_factor: float = 0.75, num_segments: int = 16):
+        if initial_capacity <= 0 or num_segments <= 0 or load_factor <= 0:
+            raise ValueError
+        bits = max(num_segments - 1, 0).bit_length()
+        per_segment = 2
+        while per_segment * (1 << bits) < initial_capacity:
+            per_segment <<= 1
+        self._segments = [_Segment(per_segment) for _ in range(1 << bits)]
+        self._segment_shift = 64 - bits
+        self._load_factor = load_factor
+
+    def get(self, key, default=_MISSING) -> Any:
+        h = hash(key)
+        mixed = (h * _GOLDEN) & _MASK64
+        table = self._segments[mixed >> self._segment_shift].table
+        n = len(table)
+        bucket = table[(mixed >> (self._segment_shift - n.bit_length() + 1)) & (n - 1)]
+        for existing_hash, existing_key, value in bucket or ():
+            if existing_hash == h and (existing_key is key or existing_key == key):
+                return value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, _ABSENT) is not _ABSENT
+
+    def set(self, key, value) -> None:
+        h = hash(key)
+        seg, mixed = self._segment(h)
+        with seg.lock:
+            self._put(seg, mixed, h, key, value)
+
+    def delete(self, key) -> None:
+        h = hash(key)
+        seg, mixed = self._segment(h)
+        with seg.lock:
+            table = seg.table
+            i = self._slot(mixed, len(table))
+            bucket = table[i] or ()
+            for j, (existing_hash, existing_key, _) in enumerate(bucket):
+                if existing_hash == h and (existing_key is key or existing_key == key):
+                    table[i] = bucket[:j] + bucket[j + 1 :] or None
+                    seg.count -= 1
+                    return
+        raise KeyError(key)
+
+    def compute_if_absent(self, key, factory: Callable[[], Any]) -> Any:
+        """Return the value for key, or store and return factory(); factory runs at most once per insert."""
+        value = self.get(key, _ABSENT)
+        if value is not _ABSENT:
+            return value
+        h = hash(key)
+        seg, mixed = self._segment(h)
+        with seg.lock:
+            # another writer may have won the race since the unlocked read
+            value = self._find(seg, mixed, h, key)
+            if value is _ABSENT:
+                value = factory()
+                self._put(seg, mixed, h, key, value)
+            return value
+
+    def update(self, key, fn: Callable[[Any], Any], default=_MISSING) -> Any:
+        """
+        Atomically replace key's value with fn(value) and return the result.
+
+        For a missing key fn(default) is stored, or KeyError is raised if no
+        default is given. Unlike HashMap.update this is a read-modify-write
+        of a single key, e.g. update(word, lambda n: n + 1, 0) counts words.
+        """
+        h = hash(key)
+        seg, mixed = self._segment(h)
+        with seg.lock:
+            value = self._find(seg, mixed, h, key)
+            if value is _ABSENT:
+                if default is _MISSING:
+                    raise KeyError(key)
+                value = default
+            value = fn(value)
+            self._put(seg, mixed, h, key, value)
+            return value
+
+    def clear(self) -> None:
+        for seg in self._segments:
+            with seg.lock:
+                seg.table = [None] * len(seg.table)
+                seg.count = 0
+
+    def __len__(self) -> int:
+        return sum(seg.count for seg in self._segments)
+
+    def __iter__(self):
+        return self.keys()
+
+    def keys(self):
+        return (entry[1] for entry in self._iter_entries())
+
+    def values(self):
+        return (entry[2] for entry in self._iter_entries())
+
+    def items(self):
+        return ((entry[1], entry[2]) for entry in self._iter_entries())
+
+    def __repr__(self) -> str:
+        return f"ConcurrentHashMap(segments={len(self._segments)}, size={len(self)})"
+
+    def _segment(self, h: int) -> tuple[_Segment, int]:
+        mixed = (h * _GOLDEN) & _MASK64
+        return self._segments[mixed >> self._segment_shift], mixed
+
+    def _slot(self, mixed: int, capacity: int) -> int:
+        # the bits just below the segment bits; derived from the table's own
+        # length so readers and writers agree on whichever table they hold
+        return (mixed >> (self._segment_shift - capacity.bit_length() + 1)) & (capacity - 1)
+
+    def _find(self, seg: _Segment, mixed: int, h: int, key) -> Any:
+        table = seg.table
+        for existing_hash, existing_key, value in table[self._slot(mixed, len(table))] or ():
+            if existing_hash == h and (existing_key is key or existing_key == key):
+                return value
+        return _ABSENT
+
+    def _put(self, seg: _Segment, mixed: int, h: int, key, value) -> None:
+        # caller holds seg.lock
+        table = seg.table
+        i = self._slot(mixed, len(table))
+        bucket = table[i]
+        entry = (h, key, value)
+        if bucket:
+            for j, (existing_hash, existing_key, _) in enumerate(bucket):
+                if existing_hash == h and (existing_key is key or existing_key == key):
+                    table[i] = bucket[:j] + (entry,) + bucket[j + 1 :]
+                    return
+            table[i] = bucket + (entry,)
+        else:
+            table[i] = (entry,)
+        seg.count += 1
+        if seg.count > len(table) * self._load_factor:
+            self._grow(seg)
+
+    def _grow(self, seg: _Segment) -> None:
+        # caller holds seg.lock; build the new table aside, then publish it
+        # with one reference swap, leaving the old one intact for readers
+        capacity = 2 * len(seg.table)
+        table: list[tuple | None] = [None] * capacity
+        for bucket in seg.table:
+            for entry in bucket or ():
+                i = self._slot((entry[0] * _GOLDEN) & _MASK64, capacity)
+                table[i] = table[i] + (entry,) if table[i] else (entry,)
+        seg.table = table
+
+    def _iter_entries(self):
+        for seg in self._segments:
+            table = seg.table
+            for i in range(len(table)):
+                yield from table[i] or ()
+
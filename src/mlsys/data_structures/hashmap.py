@@ -1,79 +1,804 @@
 # import numpy as np
-from typing import Any
+import time
+from array import array
+from collections import Counter
+from collections.abc import Callable, Collection, Set
+from itertools import islice
+from typing import Any, NamedTuple
+
+from .hashmap_snapshot import MappedHashMap, write_snapshot
+
 _MISSING = object()
+_ABSENT = object()  # a miss in _probe, where _MISSING would mean "raise"
+_BACKENDS = ("chained", "open")
+_MIXERS = ("fibonacci", "splitmix")
+_REPR_ITEMS = 8  # entries shown by __repr__ before it elides the rest
+_GOLDEN = 0x9E3779B97F4A7C15  # 2^64 / phi
+_MASK64 = (1 << 64) - 1
+
+
+def _make_mixer(name: str | None, seed: int | None) -> Callable[[int], int] | None:
+    """
+    64-bit finalizer for hash_mixer=name, or None for the identity.
+
+    Tables index by the top bits of the result, which every input bit
+    reaches: ints hash to themselves, so strided keys differ only in high
+    bits and `h % capacity` would pile them into a few buckets.
+    """
+    if name is None:
+        if seed is not None:
+            raise ValueError("hash_seed needs a hash_mixer")
+        return None
+    if name not in _MIXERS:
+        raise ValueError(f"unknown hash_mixer {name!r}, expected one of {_MIXERS}")
+    seed = (seed or 0) & _MASK64
+    if name == "fibonacci":
+        # multiplicative hashing: the top bits of h * 2^64/phi
+        return lambda h: ((h ^ seed) * _GOLDEN) & _MASK64
+
+    def splitmix(h: int) -> int:
+        # splitmix64's finalizer: full avalanche, so the seed changes every bit
+        z = (h + seed + _GOLDEN) & _MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return z ^ (z >> 31)
+
+    return splitmix
+
+
+def _pow2_at_least(n: int) -> int:
+    capacity = 1
+    while capacity < n:
+        capacity <<= 1
+    return capacity
+
+
+class HashMapStats(NamedTuple):
+    """
+    Snapshot returned by HashMap.stats().
+
+    histogram maps a chain length to how many chains have it: bucket
+    lengths (empty buckets included) for the chained backend, and per-entry
+    probe lengths for the open backend. The last three fields are None
+    unless the map was built with track_stats=True.
+    """
+
+    size: int
+    capacity: int
+    load_factor: float
+    histogram: dict[int, int]
+    max_chain: int
+    mean_chain: float
+    resizes: int | None
+    resize_seconds: float | None
+    comparisons_per_lookup: float | None
+
+
+def _check_min_load_factor(load_factor: float, min_load_factor: float | None) -> None:
+    # a shrink lands between load_factor / 4 and load_factor / 2, so the
+    # threshold has to sit below that band or the table would thrash
+    if min_load_factor is not None and not 0 < min_load_factor < load_factor / 4:
+        raise ValueError("min_load_factor must be in (0, load_factor / 4)")
+
+
 class HashMap:
-    def __init__(self, initial_capacity: int = 8, load_factor: float = 0.75):
-        self._buckets = [ [] for _ in range(initial_capacity) ]
+    """
+    Hash map with a selectable collision strategy.
+
+    backend="chained" (default) keeps a list of (hash, key, value) entries per
+    bucket; backend="open" returns an OpenAddressingHashMap, which stores
+    hashes, keys and values in flat parallel arrays and resolves collisions by
+    linear probing.
+
+    hash_mixer="fibonacci" or "splitmix" passes each hash through a 64-bit
+    finalizer and indexes the (power-of-two) table by its top bits, so int
+    keys with a common stride spread out instead of sharing buckets; the
+    default keeps the raw hash. hash_seed, e.g. random.getrandbits(64),
+    makes the bucket of a key differ per instance, which blunts inputs
+    crafted to collide.
+    """
+
+    # buckets migrated per operation while an incremental resize is in flight
+    _REHASH_STEP = 4
+
+    # options after backend are keyword-only in __init__, as they are here
+    def __new__(
+        cls,
+        initial_capacity: int = 8,
+        load_factor: float = 0.75,
+        backend: str = "chained",
+        *,
+        track_stats: bool = False,
+        **kwargs,
+    ):
+        if backend not in _BACKENDS:
+            raise ValueError(f"unknown backend {backend!r}, expected one of {_BACKENDS}")
+        if cls is HashMap and backend == "open":
+            cls = OpenAddressingHashMap
+        if track_stats:
+            # counting lives in subclasses, so untracked maps pay nothing for it
+            cls = _TRACKED.get(cls, cls)
+        return super().__new__(cls)
+
+    def __init__(
+        self,
+        initial_capacity: int = 8,
+        load_factor: float = 0.75,
+        backend: str = "chained",
+        *,
+        incremental_resize: bool = False,
+        min_load_factor: float | None = None,
+        track_stats: bool = False,
+        hash_mixer: str | None = None,
+        hash_seed: int | None = None,
+    ):
+        _check_min_load_factor(load_factor, min_load_factor)
+        _init_counters(self, track_stats)
+        self._mixer_name, self._seed = hash_mixer, hash_seed
+        self._mix = _make_mixer(hash_mixer, hash_seed)
+        if self._mix is not None:
+            # bucket indexes are top bits of the mixed hash, so sizes stay powers of two
+            initial_capacity = _pow2_at_least(initial_capacity)
+        # each bucket holds (hash, key, value) entries: the stored hash lets
+        # resizes skip hash(key) and lets lookups reject a key without __eq__.
+        # Buckets stay None until first used, so (re)allocating a table is a
+        # single flat list rather than one list object per bucket.
+        self._buckets = [None] * initial_capacity
         self._capacity = initial_capacity
+        self._min_capacity = initial_capacity
         self._size = 0
         self._load_factor = load_factor
+        self._min_load_factor = min_load_factor
+        # bumped on every insert, delete and rebuild so iterators can detect them
+        self._version = 0
+        # with incremental_resize, growing keeps the old table alive in
+        # _old_buckets and every later operation migrates _REHASH_STEP of its
+        # buckets (plus the bucket of the key it touches), as Redis does
+        self._incremental = incremental_resize
+        self._old_buckets = None
+        self._old_capacity = 0
+        self._rehash_idx = 0
 
     def set(self, key, value) -> None:
-        bucket_idx = self._bucket_index(key)
-        for idx, item in enumerate(self._buckets[bucket_idx]):
-            existing_key, existing_value = item
-            if existing_key == key:
-                self._buckets[bucket_idx][idx] = (key, value)
-                return
-        self._buckets[bucket_idx].append((key, value))
+        h = hash(key)
+        if self._old_buckets is not None:
+            self._migrate_for(h)
+        bucket_idx = self._index(h)
+        bucket = self._buckets[bucket_idx]
+        if bucket is None:
+            self._buckets[bucket_idx] = [(h, key, value)]
+        else:
+            for idx, (existing_hash, existing_key, _) in enumerate(bucket):
+                if existing_hash == h and (existing_key is key or existing_key == key):
+                    bucket[idx] = (h, key, value)
+                    return
+            bucket.append((h, key, value))
         self._size += 1
+        self._version += 1
         if self._size/self._capacity > self._load_factor:
             self._resize()
 
-
     def get(self, key, default= _MISSING) -> Any:
-        bucket_idx = self._bucket_index(key)
-        for existing_key, value in self._buckets[bucket_idx]:
-            if existing_key == key:
+        h = hash(key)
+        if self._old_buckets is not None:
+            self._migrate_for(h)
+        for existing_hash, existing_key, value in self._buckets[self._index(h)] or ():
+            if existing_hash == h and (existing_key is key or existing_key == key):
                 return value
-        if default == _MISSING:
-            raise KeyError
+        if default is _MISSING:
+            raise KeyError(key)
         return default
 
     def delete(self, key) -> None:
-        bucket_idx = self._bucket_index(key)
-        deleted = False
-        for idx, item in enumerate(self._buckets[bucket_idx]):
-            existing_key, value = item
-            if existing_key == key:
-                self._buckets[bucket_idx].pop(idx)
+        h = hash(key)
+        if self._old_buckets is not None:
+            self._migrate_for(h)
+        bucket_idx = self._index(h)
+        bucket = self._buckets[bucket_idx] or ()
+        for idx, (existing_hash, existing_key, _) in enumerate(bucket):
+            if existing_hash == h and (existing_key is key or existing_key == key):
+                bucket.pop(idx)
+                if not bucket:
+                    self._buckets[bucket_idx] = None
                 self._size -= 1
-                deleted = True
-                break
-        if not deleted:
-            raise KeyError
+                self._version += 1
+                if self._min_load_factor is not None and self._size < self._capacity * self._min_load_factor:
+                    self._shrink()
+                return
+        raise KeyError(key)
 
     def __contains__(self, key) -> bool:
-        bucket_idx = self._bucket_index(key)
-        for existing_key, value in self._buckets[bucket_idx]:
-            if existing_key == key:
+        h = hash(key)
+        if self._old_buckets is not None:
+            self._migrate_for(h)
+        for existing_hash, existing_key, _ in self._buckets[self._index(h)] or ():
+            if existing_hash == h and (existing_key is key or existing_key == key):
                 return True
         return False
 
     def __len__(self): return self._size
 
-    def keys(self) -> list:
-        return [pair[0] for bucket in self._buckets for pair in bucket]
+    def __iter__(self):
+        return self._iter_keys()
+
+    def keys(self) -> "HashMapKeysView":
+        return HashMapKeysView(self)
 
-    def values(self) -> list: 
-        return [pair[1] for bucket in self._buckets for pair in bucket]
+    def values(self) -> "HashMapValuesView":
+        return HashMapValuesView(self)
 
-    def items(self) -> list[tuple]:
-        return [pair for bucket in self._buckets for pair in bucket]
+    def items(self) -> "HashMapItemsView":
+        return HashMapItemsView(self)
 
     def __repr__(self) -> str:
-        return f"HashMap(capacity={self._capacity}, buckets={self._buckets})"
+        return f"HashMap(capacity={self._capacity}, size={self._size}, items={self._repr_items()})"
+
+    def stats(self) -> HashMapStats:
+        """
+        Chain-length histogram, load factor and, with track_stats, resize and lookup counters.
+
+        The structural fields come from one pass over the table, so the call
+        is O(capacity); like iteration, it finishes an incremental resize first.
+        """
+        histogram = Counter(self._chain_lengths())
+        chains = sum(n for length, n in histogram.items() if length)
+        entries = sum(length * n for length, n in histogram.items())
+        resizes = resize_seconds = per_lookup = None
+        if self._track_stats:
+            resizes, resize_seconds = self._resizes, self._resize_seconds
+            per_lookup = self._comparisons / self._lookups if self._lookups else 0.0
+        return HashMapStats(
+            size=self._size,
+            capacity=self._capacity,
+            load_factor=self._size / self._capacity,
+            histogram=dict(sorted(histogram.items())),
+            max_chain=max(histogram, default=0),
+            mean_chain=entries / chains if chains else 0.0,
+            resizes=resizes,
+            resize_seconds=resize_seconds,
+            comparisons_per_lookup=per_lookup,
+        )
+
+    def reserve(self, n: int) -> None:
+        """Grow the table once so that n entries fit without further resizes."""
+        capacity = self._capacity
+        while n > capacity * self._load_factor:
+            capacity *= 2
+        if capacity != self._capacity:
+            self._rehash(capacity)
+
+    def update(self, other) -> None:
+        """Insert from a mapping (anything with items()) or an iterable of pairs."""
+        pairs = other.items() if hasattr(other, "items") else other
+        if hasattr(pairs, "__len__"):
+            self.reserve(self._size + len(pairs))
+        set_ = self.set
+        for key, value in pairs:
+            set_(key, value)
+
+    @classmethod
+    def from_items(cls, items, size_hint: int | None = None, **kwargs) -> "HashMap":
+        """Build a map sized once for size_hint (or len(items)) entries."""
+        hm = cls(**kwargs)
+        if size_hint is None and hasattr(items, "__len__"):
+            size_hint = len(items)
+        if size_hint:
+            hm.reserve(size_hint)
+        hm.update(items)
+        return hm
+
+    def __reduce__(self):
+        # the cached hashes are only valid in this interpreter (str and bytes
+        # hashing is salted per process), so pickle the entries instead of the
+        # table and re-insert them on load
+        kwargs = {
+            "initial_capacity": self._min_capacity,
+            "load_factor": self._load_factor,
+            "min_load_factor": self._min_load_factor,
+        }
+        if isinstance(self, OpenAddressingHashMap):
+            kwargs["backend"] = "open"
+        else:
+            kwargs["incremental_resize"] = self._incremental
+        if self._track_stats:
+            kwargs["track_stats"] = True
+        if self._mix is not None:
+            kwargs["hash_mixer"], kwargs["hash_seed"] = self._mixer_name, self._seed
+        return _unpickle, (type(self), kwargs, list(self._iter_items()))
 
-    # clear(self) -> None
+    def save(self, path) -> None:
+        """
+        Write a snapshot of the entries that open_mmap() can serve without a rebuild.
+
+        Keys must be str, bytes, int, None or tuples of them; others raise TypeError.
+        """
+        write_snapshot(self._iter_items(), len(self), path)
+
+    @staticmethod
+    def open_mmap(path) -> MappedHashMap:
+        """Memory-map a snapshot written by save() as a read-only MappedHashMap."""
+        return MappedHashMap(path)
+
+    def clear(self) -> None:
+        """Drop every entry and go back to the initial capacity."""
+        self._buckets = [None] * self._min_capacity
+        self._capacity = self._min_capacity
+        self._size = 0
+        self._version += 1
+        self._old_buckets = None
+
+    def compact(self) -> None:
+        """Rebuild at the smallest capacity that holds the current entries."""
+        self._rehash(self._fit_capacity(self._load_factor))
+
+    def _index(self, h: int) -> int:
+        if self._mix is None:
+            return h % self._capacity
+        return self._mix(h) >> (65 - self._capacity.bit_length())
+
+    def _index_for(self, h: int, capacity: int) -> int:
+        if self._mix is None:
+            return h % capacity
+        return self._mix(h) >> (65 - capacity.bit_length())
 
     def _bucket_index(self, key):
-        return hash(key)%self._capacity
-
-    def _resize(self):
-        self._capacity = self._capacity * 2
-        extended_buckets = [ [] for _ in range(self._capacity) ]
-        for lst in self._buckets:
-            for idx, item in enumerate(lst):
-                key, value = item
-                extended_buckets[self._bucket_index(key)].append((key, value))
-        self._buckets = extended_buckets
\ No newline at end of file
+        return self._index(hash(key))
+
+    def _repr_items(self) -> str:
+        # read the tables directly: _iter_entries would finish a migration,
+        # and a repr should neither mutate the map nor walk all of it
+        pending = self._old_buckets[self._rehash_idx :] if self._old_buckets is not None else ()
+        buckets = (b for table in (self._buckets, pending) for b in table if b)
+        shown = [f"{k!r}: {v!r}" for _, k, v in islice((e for b in buckets for e in b), _REPR_ITEMS)]
+        if self._size > len(shown):
+            shown.append("...")
+        return "{" + ", ".join(shown) + "}"
+
+    def _chain_lengths(self):
+        self._finish_migration()
+        return (len(b) if b else 0 for b in self._buckets)
+
+    def _probe(self, key) -> tuple[Any, int]:
+        """get() that also counts the entries it compares: (value or _ABSENT, count)."""
+        h = hash(key)
+        if self._old_buckets is not None:
+            self._migrate_for(h)
+        n = 0
+        for existing_hash, existing_key, value in self._buckets[self._index(h)] or ():
+            n += 1
+            if existing_hash == h and (existing_key is key or existing_key == key):
+                return value, n
+        return _ABSENT, n
+
+    def _iter_entries(self):
+        # entries only move between tables during a migration, so finish it
+        # first; after that any move comes from a resize and bumps _version
+        self._finish_migration()
+        version = self._version
+        for bucket in self._buckets:
+            if bucket:
+                for entry in bucket:
+                    yield entry
+                    if self._version != version:
+                        raise RuntimeError("HashMap changed size during iteration")
+
+    def _iter_keys(self):
+        return (entry[1] for entry in self._iter_entries())
+
+    def _iter_values(self):
+        return (entry[2] for entry in self._iter_entries())
+
+    def _iter_items(self):
+        return ((entry[1], entry[2]) for entry in self._iter_entries())
+
+    def _fit_capacity(self, load: float) -> int:
+        # halve from the current capacity while the entries still fit at `load`
+        capacity = self._capacity
+        while capacity // 2 >= self._min_capacity and self._size <= capacity // 2 * load:
+            capacity //= 2
+        return capacity
+
+    def _shrink(self) -> None:
+        # land at or below half the max load factor, so the table has to double
+        # in size before it grows again and halve again before it next shrinks
+        capacity = self._fit_capacity(self._load_factor / 2)
+        if capacity < self._capacity:
+            self._resize(capacity)
+
+    def _resize(self, capacity: int | None = None):
+        if capacity is None:
+            capacity = self._capacity * 2
+        if not self._incremental:
+            self._rehash(capacity)
+            return
+        # a resize due while the previous one is still migrating finishes it first
+        self._finish_migration()
+        self._version += 1
+        self._old_buckets = self._buckets
+        self._old_capacity = self._capacity
+        self._rehash_idx = 0
+        self._capacity = capacity
+        self._buckets = [None] * self._capacity
+
+    def _rehash(self, capacity: int) -> None:
+        self._finish_migration()
+        self._version += 1
+        old_buckets = self._buckets
+        self._capacity = capacity
+        self._buckets = [None] * capacity
+        for lst in old_buckets:
+            if lst:
+                self._place(lst)
+
+    def _place(self, entries: list) -> None:
+        buckets, capacity = self._buckets, self._capacity
+        for entry in entries:
+            idx = self._index_for(entry[0], capacity)
+            if buckets[idx] is None:
+                buckets[idx] = [entry]
+            else:
+                buckets[idx].append(entry)
+
+    def _migrate_for(self, h: int) -> None:
+        # move the caller's bucket now so it only has to look in the new table,
+        # then advance the sweep by a bounded number of buckets
+        old = self._old_buckets
+        own = self._index_for(h, self._old_capacity)
+        if old[own]:
+            self._place(old[own])
+            old[own] = None
+        idx = self._rehash_idx
+        end = min(idx + self._REHASH_STEP, self._old_capacity)
+        while idx < end:
+            if old[idx]:
+                self._place(old[idx])
+                old[idx] = None
+            idx += 1
+        self._rehash_idx = idx
+        if idx == self._old_capacity:
+            self._old_buckets = None
+
+    def _finish_migration(self) -> None:
+        if self._old_buckets is None:
+            return
+        for bucket in self._old_buckets[self._rehash_idx:]:
+            if bucket:
+                self._place(bucket)
+        self._old_buckets = None
+
+
+_EMPTY = object()
+_DELETED = object()
+
+
+def _unpickle(cls, kwargs: dict, items: list) -> HashMap:
+    return cls.from_items(items, **kwargs)
+
+
+def _init_counters(hm: HashMap, track_stats: bool) -> None:
+    hm._track_stats = track_stats
+    hm._resizes = 0
+    hm._resize_seconds = 0.0
+    hm._lookups = 0
+    hm._comparisons = 0
+
+
+class OpenAddressingHashMap(HashMap):
+    """
+    Linear-probing hash map over flat parallel arrays.
+
+    _hashes is an int64 array holding the full hash of each slot, _keys and
+    _values are plain lists. A slot is free when its key is _EMPTY and a
+    tombstone when it is _DELETED; tombstones keep probe chains intact after
+    deletes and are dropped on the next rebuild. The capacity is a power of
+    two so the probe start is h & mask, or the top bits of the mixed hash
+    with a hash_mixer.
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = 8,
+        load_factor: float = 0.75,
+        backend: str = "open",
+        *,
+        incremental_resize: bool = False,
+        min_load_factor: float | None = None,
+        track_stats: bool = False,
+        hash_mixer: str | None = None,
+        hash_seed: int | None = None,
+    ):
+        if incremental_resize:
+            raise ValueError("incremental_resize is only supported by the chained backend")
+        if not 0 < load_factor < 1:
+            raise ValueError("open addressing needs 0 < load_factor < 1")
+        _check_min_load_factor(load_factor, min_load_factor)
+        _init_counters(self, track_stats)
+        self._mixer_name, self._seed = hash_mixer, hash_seed
+        self._mix = _make_mixer(hash_mixer, hash_seed)
+        capacity = _pow2_at_least(initial_capacity)
+        self._min_capacity = capacity
+        self._load_factor = load_factor
+        self._min_load_factor = min_load_factor
+        self._size = 0
+        self._version = 0
+        self._alloc(capacity)
+
+    def set(self, key, value) -> None:
+        h = hash(key)
+        keys, hashes, mask = self._keys, self._hashes, self._mask
+        i = h & mask if self._mix is None else self._mix(h) >> self._shift
+        tombstone = -1
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                break
+            if k is _DELETED:
+                if tombstone < 0:
+                    tombstone = i
+            elif hashes[i] == h and (k is key or k == key):
+                self._values[i] = value
+                return
+            i = (i + 1) & mask
+        if tombstone >= 0:
+            i = tombstone
+        else:
+            self._used += 1
+        keys[i] = key
+        hashes[i] = h
+        self._values[i] = value
+        self._size += 1
+        self._version += 1
+        if self._used > self._capacity * self._load_factor:
+            self._resize()
+
+    def get(self, key, default=_MISSING) -> Any:
+        i = self._find(key)
+        if i < 0:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return self._values[i]
+
+    def delete(self, key) -> None:
+        i = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        self._keys[i] = _DELETED
+        self._values[i] = None
+        self._size -= 1
+        self._version += 1
+        if self._min_load_factor is not None and self._size < self._capacity * self._min_load_factor:
+            self._shrink()
+
+    def __contains__(self, key) -> bool:
+        return self._find(key) >= 0
+
+    def clear(self) -> None:
+        self._size = 0
+        self._version += 1
+        self._alloc(self._min_capacity)
+
+    def __repr__(self) -> str:
+        return f"HashMap(backend='open', capacity={self._capacity}, size={self._size}, items={self._repr_items()})"
+
+    def _alloc(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._shift = 65 - capacity.bit_length()  # top bits of a mixed hash index the table
+        self._hashes = array("q", bytes(8 * capacity))
+        self._keys = [_EMPTY] * capacity
+        self._values = [None] * capacity
+        self._used = 0  # live slots + tombstones
+
+    def _repr_items(self) -> str:
+        keys, values = self._keys, self._values
+        live = (i for i, k in enumerate(keys) if k is not _EMPTY and k is not _DELETED)
+        shown = [f"{keys[i]!r}: {values[i]!r}" for i in islice(live, _REPR_ITEMS)]
+        if self._size > len(shown):
+            shown.append("...")
+        return "{" + ", ".join(shown) + "}"
+
+    def _chain_lengths(self):
+        # probe length of each live entry: its distance from its home slot, plus one
+        keys, hashes, mask = self._keys, self._hashes, self._mask
+        return (
+            ((i - self._home(h)) & mask) + 1
+            for i, (h, k) in enumerate(zip(hashes, keys, strict=True))
+            if k is not _EMPTY and k is not _DELETED
+        )
+
+    def _probe(self, key) -> tuple[Any, int]:
+        """get() that also counts the slots it compares, tombstones included."""
+        h = hash(key)
+        keys, hashes, mask = self._keys, self._hashes, self._mask
+        i = self._home(h)
+        n = 0
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                return _ABSENT, n
+            n += 1
+            if k is not _DELETED and hashes[i] == h and (k is key or k == key):
+                return self._values[i], n
+            i = (i + 1) & mask
+
+    def _home(self, h: int) -> int:
+        return h & self._mask if self._mix is None else self._mix(h) >> self._shift
+
+    def _iter_slots(self):
+        version = self._version
+        keys = self._keys
+        for i, k in enumerate(keys):
+            if k is not _EMPTY and k is not _DELETED:
+                yield i
+                if self._version != version:
+                    raise RuntimeError("HashMap changed size during iteration")
+
+    def _iter_keys(self):
+        keys = self._keys
+        return (keys[i] for i in self._iter_slots())
+
+    def _iter_values(self):
+        values = self._values
+        return (values[i] for i in self._iter_slots())
+
+    def _iter_items(self):
+        keys, values = self._keys, self._values
+        return ((keys[i], values[i]) for i in self._iter_slots())
+
+    def _find(self, key) -> int:
+        h = hash(key)
+        keys, hashes, mask = self._keys, self._hashes, self._mask
+        i = h & mask if self._mix is None else self._mix(h) >> self._shift
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                return -1
+            if k is not _DELETED and hashes[i] == h and (k is key or k == key):
+                return i
+            i = (i + 1) & mask
+
+    def _resize(self, capacity: int | None = None):
+        if capacity is not None:
+            self._rehash(capacity)
+            return
+        # grow only when live entries need it; otherwise this just purges tombstones
+        capacity = self._capacity
+        if self._size > capacity * self._load_factor / 2:
+            capacity *= 2
+        self._rehash(capacity)
+
+    def _rehash(self, capacity: int) -> None:
+        self._version += 1
+        old_hashes, old_keys, old_values = self._hashes, self._keys, self._values
+        self._alloc(capacity)
+        keys, hashes, values, mask = self._keys, self._hashes, self._values, self._mask
+        mix, shift = self._mix, self._shift
+        for h, k, v in zip(old_hashes, old_keys, old_values, strict=True):
+            if k is _EMPTY or k is _DELETED:
+                continue
+            i = h & mask if mix is None else mix(h) >> shift
+            while keys[i] is not _EMPTY:
+                i = (i + 1) & mask
+            keys[i] = k
+            hashes[i] = h
+            values[i] = v
+        self._used = self._size
+
+
+class _StatsTracking:
+    """
+    Counters behind stats(), mixed into a backend when track_stats=True.
+
+    Lookups go through the backend's _probe, which counts comparisons on
+    its single walk of the key's chain.
+    """
+
+    def get(self, key, default=_MISSING) -> Any:
+        value, compared = self._probe(key)
+        self._lookups += 1
+        self._comparisons += compared
+        if value is _ABSENT:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return value
+
+    def __contains__(self, key) -> bool:
+        value, compared = self._probe(key)
+        self._lookups += 1
+        self._comparisons += compared
+        return value is not _ABSENT
+
+    def _rehash(self, capacity: int) -> None:
+        start = time.perf_counter()
+        super()._rehash(capacity)
+        self._resize_seconds += time.perf_counter() - start
+        self._resizes += 1
+
+
+class _TrackedHashMap(_StatsTracking, HashMap):
+    def _resize(self, capacity: int | None = None):
+        if not self._incremental:
+            super()._resize(capacity)  # counted by _rehash
+            return
+        start = time.perf_counter()
+        super()._resize(capacity)
+        self._resize_seconds += time.perf_counter() - start
+        self._resizes += 1
+
+    def _migrate_for(self, h: int) -> None:
+        # an incremental resize is paid for in these steps, so they count too
+        start = time.perf_counter()
+        super()._migrate_for(h)
+        self._resize_seconds += time.perf_counter() - start
+
+
+class _TrackedOpenAddressingHashMap(_StatsTracking, OpenAddressingHashMap):
+    pass
+
+
+_TRACKED = {
+    HashMap: _TrackedHashMap,
+    OpenAddressingHashMap: _TrackedOpenAddressingHashMap,
+}
+
+
+class _HashMapView:
+    """Live view over a HashMap; iterating it streams entries without copying."""
+
+    __slots__ = ("_map",)
+
+    def __init__(self, hm: HashMap):
+        self._map = hm
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+class HashMapKeysView(_HashMapView, Set):
+    __slots__ = ()
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __iter__(self):
+        return self._map._iter_keys()
+
+    def __contains__(self, key) -> bool:
+        return key in self._map
+
+
+class HashMapValuesView(_HashMapView, Collection):
+    __slots__ = ()
+
+    def __iter__(self):
+        return self._map._iter_values()
+
+    def __contains__(self, value) -> bool:
+        return any(v is value or v == value for v in self)
+
+
+class HashMapItemsView(_HashMapView, Set):
+    __slots__ = ()
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __iter__(self):
+        return self._map._iter_items()
+
+    def __contains__(self, item) -> bool:
+        if not isinstance(item, tuple) or len(item) != 2:
+            return False
+        key, value = item
+        try:
+            v = self._map.get(key)
+        except KeyError:
+            return False
+        return v is value or v == value
@@ -0,0 +1,296 @@
+import contextlib
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Mapping
+from hashlib import blake2b
+from typing import Any
+
+import numpy as np
+
+_MISSING = object()
+
+MAGIC = b"MLHMSNAP"
+VERSION = 2  # 2: canonical tuple keys instead of pickled ones
+# magic, version, entry count, index slots
+_HEADER = struct.Struct("<8sIQQ")
+# per index slot: stable key hash, absolute offset of the record (0 = empty)
+_SLOT = struct.Struct("<QQ")
+# per record: key tag, value tag, key length, value length
+_RECORD = struct.Struct("<BBIQ")
+_ARRAY_META = struct.Struct("<BB")  # ndim, dtype string length
+_ELEMENT = struct.Struct("<BI")  # per tuple element of a key: tag, payload length
+_ALIGN = 16
+
+# type tags; values without a native encoding are pickled, keys never are
+_BYTES, _STR, _INT, _FLOAT, _NONE, _NDARRAY, _PICKLE, _TUPLE = range(8)
+
+
+def _align(n: int) -> int:
+    return -(-n // _ALIGN) * _ALIGN
+
+
+def _encode_key(key) -> tuple[int, bytes]:
+    """
+    Canonical (tag, payload) of a key: equal keys always encode to equal bytes.
+
+    Keys are str, bytes, int, None, or tuples of those. Other types are
+    rejected rather than pickled: pickle output depends on object identity
+    (the memo) and, for sets, on the per-process hash seed, so equal keys
+    could encode differently and miss.
+    """
+    kind = type(key)
+    if kind is bytes:
+        return _BYTES, key
+    if kind is str:
+        return _STR, key.encode()
+    if kind is int:
+        return _INT, key.to_bytes(key.bit_length() // 8 + 1, "little", signed=True)
+    if key is None:
+        return _NONE, b""
+    if kind is tuple:
+        parts = []
+        for element in key:
+            tag, payload = _encode_key(element)
+            parts.append(_ELEMENT.pack(tag, len(payload)))
+            parts.append(payload)
+        return _TUPLE, b"".join(parts)
+    raise TypeError(f"unsupported key type {kind.__name__}: keys must be str, bytes, int, None or tuples of them")
+
+
+def _decode_key(tag: int, raw: bytes) -> Any:
+    if tag == _BYTES:
+        return raw
+    if tag == _STR:
+        return raw.decode()
+    if tag == _INT:
+        return int.from_bytes(raw, "little", signed=True)
+    if tag == _NONE:
+        return None
+    if tag == _TUPLE:
+        out, pos = [], 0
+        while pos < len(raw):
+            element_tag, length = _ELEMENT.unpack_from(raw, pos)
+            pos += _ELEMENT.size
+            out.append(_decode_key(element_tag, raw[pos : pos + length]))
+            pos += length
+        return tuple(out)
+    raise ValueError(f"unknown key tag {tag}")
+
+
+def _stable_hash(tag: int, payload: bytes) -> int:
+    # hash() of str and bytes is salted per process, so the index on disk
+    # needs a hash that a later process computes identically
+    h = blake2b(payload, digest_size=8, person=bytes([tag]))
+    return int.from_bytes(h.digest(), "little")
+
+
+def _encode_value(value, start: int) -> tuple[int, bytes]:
+    """Value payload for a record whose value area begins at file offset start."""
+    kind = type(value)
+    if kind is bytes:
+        return _BYTES, value
+    if kind is str:
+        return _STR, value.encode()
+    if kind is int:
+        return _INT, value.to_bytes(value.bit_length() // 8 + 1, "little", signed=True)
+    if kind is float:
+        return _FLOAT, struct.pack("<d", value)
+    if value is None:
+        return _NONE, b""
+    # dtype.str only describes plain dtypes (a structured one is just "|V12"),
+    # so arrays with fields or objects are pickled instead
+    if isinstance(value, np.ndarray) and value.dtype.names is None and not value.dtype.hasobject:
+        dtype = value.dtype.str.encode()
+        meta = _ARRAY_META.pack(value.ndim, len(dtype)) + dtype + struct.pack(f"<{value.ndim}q", *value.shape)
+        # pad so the array data itself is aligned in the file
+        pad = _align(start + len(meta)) - (start + len(meta))
+        return _NDARRAY, meta + b"\0" * pad + value.tobytes(order="C")
+    return _PICKLE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def write_snapshot(items: Iterable, count: int, path) -> None:
+    """
+    Write count (key, value) pairs to path in the snapshot format.
+
+    Layout: a header, then an open-addressing index of (hash, offset) slots
+    at load factor <= 0.5, then one record per entry: a fixed record header,
+    the key bytes, and the value bytes starting at a 16-byte boundary. The
+    file is written next to path and renamed over it, so readers never see a
+    half-written snapshot; a key _encode_key rejects raises TypeError and
+    leaves path untouched.
+    """
+    slots = 8
+    while slots < 2 * count:
+        slots <<= 1
+    mask = slots - 1
+    index = array("Q", bytes(_SLOT.size * slots))
+    offset = _align(_HEADER.size + _SLOT.size * slots)
+    tmp = f"{os.fspath(path)}.tmp"
+    written = 0
+    try:
+        with open(tmp, "wb") as f:
+            f.seek(offset)
+            for key, value in items:
+                key_tag, key_bytes = _encode_key(key)
+                h = _stable_hash(key_tag, key_bytes)
+                value_start = _align(offset + _RECORD.size + len(key_bytes))
+                value_tag, value_bytes = _encode_value(value, value_start)
+                i = h & mask
+                while index[2 * i + 1]:
+                    i = (i + 1) & mask
+                index[2 * i] = h
+                index[2 * i + 1] = offset
+                f.write(_RECORD.pack(key_tag, value_tag, len(key_bytes), len(value_bytes)))
+                f.write(key_bytes)
+                f.write(b"\0" * (value_start - offset - _RECORD.size - len(key_bytes)))
+                f.write(value_bytes)
+                offset = _align(value_start + len(value_bytes))
+                f.seek(offset)
+                written += 1
+            if written != count:
+                raise ValueError(f"expected {count} items, got {written}")
+            f.truncate(offset)
+            f.seek(0)
+            f.write(_HEADER.pack(MAGIC, VERSION, count, slots))
+            if sys.byteorder != "little":
+                index.byteswap()
+            f.write(index.tobytes())
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+    os.replace(tmp, path)
+
+
+class MappedHashMap(Mapping):
+    """
+    Read-only HashMap served straight from a memory-mapped snapshot.
+
+    Opening only maps the file and reads the header: get() and `in` probe
+    the on-disk index and decode just the record they land on, so startup
+    costs nothing per entry and untouched pages never become resident. Keys
+    must be str, bytes, int, None or tuples of them (see _encode_key) and
+    match by their encoded form, so unlike a dict, 1 and 1.0 are different
+    keys and a float key is rejected with TypeError. bytes values
+    come back as read-only memoryviews and numpy arrays as read-only views
+    of the mapping, both without copying; they pin the mapping, so close()
+    raises BufferError while any of them is alive.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < _HEADER.size:
+            self._mm.close()
+            raise ValueError(f"{path!s} is not a HashMap snapshot")
+        magic, version, count, slots = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path!s} is not a HashMap snapshot")
+        if version != VERSION:
+            self._mm.close()
+            raise ValueError(f"unsupported snapshot version {version} (expected {VERSION})")
+        self._view = memoryview(self._mm)
+        self._size = count
+        self._slots = slots
+        self._mask = slots - 1
+
+    def get(self, key, default=_MISSING) -> Any:
+        offset = self._find(key)
+        if not offset:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return self._decode_value(offset)
+
+    def __getitem__(self, key) -> Any:
+        return self.get(key)
+
+    def __contains__(self, key) -> bool:
+        return self._find(key) != 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        for offset in self._offsets():
+            yield self._decode_key(offset)
+
+    def close(self) -> None:
+        self._view.release()
+        try:
+            self._mm.close()
+        except BufferError:
+            # a value handed out earlier still pins the mapping; stay usable
+            self._view = memoryview(self._mm)
+            raise
+
+    def __enter__(self) -> "MappedHashMap":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"MappedHashMap(size={self._size}, slots={self._slots})"
+
+    def _find(self, key) -> int:
+        """Record offset of key, or 0 if absent."""
+        try:
+            tag, payload = _encode_key(key)
+        except TypeError:
+            return 0  # a type save() cannot write is never in the file
+        h = _stable_hash(tag, payload)
+        mm, mask, base = self._mm, self._mask, _HEADER.size
+        i = h & mask
+        while True:
+            stored, offset = _SLOT.unpack_from(mm, base + _SLOT.size * i)
+            if not offset:
+                return 0
+            if stored == h:
+                key_tag, _, key_len, _ = _RECORD.unpack_from(mm, offset)
+                start = offset + _RECORD.size
+                if key_tag == tag and mm[start : start + key_len] == payload:
+                    return offset
+            i = (i + 1) & mask
+
+    def _offsets(self):
+        mm, base = self._mm, _HEADER.size
+        for i in range(self._slots):
+            _, offset = _SLOT.unpack_from(mm, base + _SLOT.size * i)
+            if offset:
+                yield offset
+
+    def _decode_key(self, offset: int) -> Any:
+        tag, _, key_len, _ = _RECORD.unpack_from(self._mm, offset)
+        start = offset + _RECORD.size
+        return _decode_key(tag, self._mm[start : start + key_len])
+
+    def _decode_value(self, offset: int) -> Any:
+        _, tag, key_len, value_len = _RECORD.unpack_from(self._mm, offset)
+        start = _align(offset + _RECORD.size + key_len)
+        if tag == _BYTES:
+            return self._view[start : start + value_len]
+        if tag == _NDARRAY:
+            ndim, dtype_len = _ARRAY_META.unpack_from(self._mm, start)
+            pos = start + _ARRAY_META.size
+            dtype = np.dtype(self._mm[pos : pos + dtype_len].decode())
+            pos += dtype_len
+            shape = struct.unpack_from(f"<{ndim}q", self._mm, pos)
+            data = _align(pos + 8 * ndim)
+            count = int(np.prod(shape, dtype=np.int64))
+            return np.frombuffer(self._mm, dtype=dtype, count=count, offset=data).reshape(shape)
+        raw = self._mm[start : start + value_len]
+        if tag == _STR:
+            return raw.decode()
+        if tag == _INT:
+            return int.from_bytes(raw, "little", signed=True)
+        if tag == _FLOAT:
+            return struct.unpack("<d", raw)[0]
+        if tag == _NONE:
+            return None
+        return pickle.loads(raw)
@@ -0,0 +1,179 @@
+import operator
+from typing import Any
+
+
+class IndexedHeap:
+    """
+    d-ary min- (or max-) heap with a key -> position index.
+
+    Keys and priorities are kept in two flat parallel lists in heap order, and
+    _pos maps every key to its slot, so a key's priority can be changed or the
+    key removed in O(log n) instead of leaving stale entries behind as
+    heapq-plus-lazy-deletion does. A wider fan-out (d=4 by default) makes the
+    tree shallower, which trades a few more comparisons per sift-down level
+    for fewer levels and fewer moves.
+    """
+
+    def __init__(self, items=None, d: int = 4, max_heap: bool = False):
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self._d = d
+        self._max_heap = max_heap
+        # _before(a, b): priority a belongs closer to the root than b
+        self._before = operator.gt if max_heap else operator.lt
+        self._keys: list = []
+        self._prios: list = []
+        self._pos: dict[Any, int] = {}
+        if items is not None:
+            self.heapify(items)
+
+    def heapify(self, items) -> None:
+        """Replace the contents with (key, priority) pairs in O(n)."""
+        keys, prios, pos = [], [], {}
+        for key, priority in items:
+            if key in pos:
+                raise ValueError(f"duplicate key {key!r}")
+            pos[key] = len(keys)
+            keys.append(key)
+            prios.append(priority)
+        self._keys, self._prios, self._pos = keys, prios, pos
+        for i in range((len(keys) - 2) // self._d, -1, -1):
+            self._sift_down(i)
+
+    def push(self, key, priority) -> None:
+        if key in self._pos:
+            raise ValueError(f"{key!r} is already in the heap")
+        i = len(self._keys)
+        self._keys.append(key)
+        self._prios.append(priority)
+        self._pos[key] = i
+        self._sift_up(i)
+
+    def pop(self) -> tuple:
+        if not self._keys:
+            raise IndexError("pop from empty heap")
+        key, priority = self._keys[0], self._prios[0]
+        self._remove_at(0)
+        return key, priority
+
+    def peek(self) -> Any:
+        """Key at the top of the heap, without removing it."""
+        if not self._keys:
+            raise IndexError("peek at empty heap")
+        return self._keys[0]
+
+    def peek_priority(self) -> Any:
+        if not self._prios:
+            raise IndexError("peek at empty heap")
+        return self._prios[0]
+
+    def pushpop(self, key, priority) -> tuple:
+        """Push then pop, in one sift; returns the new pair if it would be on top."""
+        if key in self._pos:
+            raise ValueError(f"{key!r} is already in the heap")
+        if not self._keys or not self._before(self._prios[0], priority):
+            return key, priority
+        top = self._keys[0], self._prios[0]
+        self._place(0, key, priority)
+        del self._pos[top[0]]
+        self._sift_down(0)
+        return top
+
+    def replace(self, key, priority) -> tuple:
+        """Pop then push, in one sift; the heap must not be empty."""
+        if not self._keys:
+            raise IndexError("replace on empty heap")
+        top = self._keys[0], self._prios[0]
+        if key in self._pos and key != top[0]:
+            raise ValueError(f"{key!r} is already in the heap")
+        del self._pos[top[0]]
+        self._place(0, key, priority)
+        self._sift_down(0)
+        return top
+
+    def update_priority(self, key, priority) -> None:
+        i = self._pos[key]
+        old = self._prios[i]
+        self._prios[i] = priority
+        if self._before(priority, old):
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def remove(self, key) -> Any:
+        """Remove key and return its priority."""
+        i = self._pos[key]
+        priority = self._prios[i]
+        self._remove_at(i)
+        return priority
+
+    def priority(self, key) -> Any:
+        return self._prios[self._pos[key]]
+
+    def __contains__(self, key) -> bool:
+        return key in self._pos
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __bool__(self) -> bool:
+        return bool(self._keys)
+
+    def __repr__(self) -> str:
+        kind = "max" if self._max_heap else "min"
+        return f"IndexedHeap({kind}, d={self._d}, size={len(self._keys)})"
+
+    def _place(self, i: int, key, priority) -> None:
+        self._keys[i] = key
+        self._prios[i] = priority
+        self._pos[key] = i
+
+    def _remove_at(self, i: int) -> None:
+        keys, prios = self._keys, self._prios
+        del self._pos[keys[i]]
+        last_key, last_prio = keys.pop(), prios.pop()
+        if i == len(keys):
+            return
+        old = prios[i]
+        self._place(i, last_key, last_prio)
+        if self._before(last_prio, old):
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def _sift_up(self, i: int) -> None:
+        keys, prios, pos, before, d = self._keys, self._prios, self._pos, self._before, self._d
+        key, priority = keys[i], prios[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if not before(priority, prios[parent]):
+                break
+            keys[i] = keys[parent]
+            prios[i] = prios[parent]
+            pos[keys[i]] = i
+            i = parent
+        keys[i] = key
+        prios[i] = priority
+        pos[key] = i
+
+    def _sift_down(self, i: int) -> None:
+        keys, prios, pos, before, d = self._keys, self._prios, self._pos, self._before, self._d
+        n = len(keys)
+        key, priority = keys[i], prios[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            best = first
+            for child in range(first + 1, min(first + d, n)):
+                if before(prios[child], prios[best]):
+                    best = child
+            if not before(prios[best], priority):
+                break
+            keys[i] = keys[best]
+            prios[i] = prios[best]
+            pos[keys[i]] = i
+            i = best
+        keys[i] = key
+        prios[i] = priority
+        pos[key] = i
@@ -0,0 +1,175 @@
+from typing import Any
+
+import numpy as np
+
+_MISSING = object()
+
+_EMPTY, _FULL, _DELETED = 0, 1, 2
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+class IntHashMap:
+    """
+    int64 -> int64/float64 hash map whose storage lives in numpy arrays.
+
+    Open addressing with linear probing over parallel _keys/_values/_state
+    arrays, power-of-two capacity and Fibonacci hashing. The *_many methods
+    probe a whole batch at once: each round advances every still-unresolved
+    key by one slot, so the Python-level loop runs once per probe step rather
+    than once per key.
+    """
+
+    def __init__(self, initial_capacity: int = 8, load_factor: float = 0.5, value_dtype=np.int64):
+        if not 0 < load_factor < 1:
+            raise ValueError("load_factor must be in (0, 1)")
+        self._load_factor = load_factor
+        self._value_dtype = np.dtype(value_dtype)
+        self._size = 0
+        self._alloc(self._capacity_for(initial_capacity))
+
+    # ---- batched API ----
+
+    def get_many(self, keys, default=_MISSING) -> np.ndarray:
+        keys = self._as_keys(keys)
+        pos = self._lookup(keys)
+        missing = pos < 0
+        if missing.any() and default is _MISSING:
+            raise KeyError(int(keys[missing][0]))
+        out = np.empty(keys.shape[0], dtype=self._value_dtype)
+        out[~missing] = self._values[pos[~missing]]
+        if missing.any():
+            out[missing] = default
+        return out
+
+    def contains_many(self, keys) -> np.ndarray:
+        return self._lookup(self._as_keys(keys)) >= 0
+
+    def set_many(self, keys, values) -> None:
+        keys = self._as_keys(keys)
+        values = np.broadcast_to(np.asarray(values, dtype=self._value_dtype), keys.shape)
+        if keys.shape[0] == 0:
+            return
+        # last write wins for duplicates inside the batch
+        rev_unique, rev_idx = np.unique(keys[::-1], return_index=True)
+        keys, values = rev_unique, values[::-1][rev_idx]
+
+        pos = self._lookup(keys)
+        found = pos >= 0
+        self._values[pos[found]] = values[found]
+
+        new_keys, new_values = keys[~found], values[~found]
+        if new_keys.shape[0] == 0:
+            return
+        if self._used + new_keys.shape[0] > self._capacity * self._load_factor:
+            self._rebuild(self._capacity_for(self._size + new_keys.shape[0]))
+        self._insert_absent(new_keys, new_values)
+
+    def delete_many(self, keys) -> None:
+        keys = np.unique(self._as_keys(keys))
+        pos = self._lookup(keys)
+        if (pos < 0).any():
+            raise KeyError(int(keys[pos < 0][0]))
+        self._state[pos] = _DELETED
+        self._size -= pos.shape[0]
+
+    # ---- scalar API, same semantics as HashMap ----
+
+    def set(self, key, value) -> None:
+        self.set_many([key], [value])
+
+    def get(self, key, default=_MISSING) -> Any:
+        pos = self._lookup(self._as_keys([key]))[0]
+        if pos < 0:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return self._values[pos].item()
+
+    def delete(self, key) -> None:
+        self.delete_many([key])
+
+    def __contains__(self, key) -> bool:
+        return bool(self.contains_many([key])[0])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def keys(self) -> np.ndarray:
+        return self._keys[self._state == _FULL].copy()
+
+    def values(self) -> np.ndarray:
+        return self._values[self._state == _FULL].copy()
+
+    def items(self) -> list[tuple]:
+        live = self._state == _FULL
+        return list(zip(self._keys[live].tolist(), self._values[live].tolist(), strict=True))
+
+    def __repr__(self) -> str:
+        return f"IntHashMap(capacity={self._capacity}, size={self._size}, value_dtype={self._value_dtype})"
+
+    # ---- internals ----
+
+    def _capacity_for(self, n: int) -> int:
+        capacity = 8
+        while n > capacity * self._load_factor:
+            capacity <<= 1
+        return capacity
+
+    def _alloc(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._shift = np.uint64(64 - (capacity.bit_length() - 1))
+        self._keys = np.zeros(capacity, dtype=np.int64)
+        self._values = np.zeros(capacity, dtype=self._value_dtype)
+        self._state = np.zeros(capacity, dtype=np.uint8)
+        self._used = 0  # live slots + tombstones
+
+    @staticmethod
+    def _as_keys(keys) -> np.ndarray:
+        return np.asarray(keys, dtype=np.int64).reshape(-1)
+
+    def _slot(self, keys: np.ndarray) -> np.ndarray:
+        # Fibonacci hashing: the top bits of key * 2^64/phi
+        return ((keys.view(np.uint64) * _GOLDEN) >> self._shift).astype(np.int64)
+
+    def _lookup(self, keys: np.ndarray) -> np.ndarray:
+        """Slot of each key, or -1 when absent."""
+        out = np.full(keys.shape[0], -1, dtype=np.int64)
+        active = np.arange(keys.shape[0])
+        pos = self._slot(keys)
+        while active.shape[0]:
+            state = self._state[pos]
+            hit = (state == _FULL) & (self._keys[pos] == keys[active])
+            out[active[hit]] = pos[hit]
+            pending = ~(hit | (state == _EMPTY))
+            active = active[pending]
+            pos = (pos[pending] + 1) & self._mask
+        return out
+
+    def _insert_absent(self, keys: np.ndarray, values: np.ndarray) -> None:
+        """Insert distinct keys known not to be in the table."""
+        active = np.arange(keys.shape[0])
+        pos = self._slot(keys)
+        while active.shape[0]:
+            free = self._state[pos] != _FULL
+            # several keys may want the same free slot; the first one wins it
+            cand = np.flatnonzero(free)
+            slots, first = np.unique(pos[cand], return_index=True)
+            winners = cand[first]
+            self._used += int((self._state[slots] == _EMPTY).sum())
+            self._keys[slots] = keys[active[winners]]
+            self._values[slots] = values[active[winners]]
+            self._state[slots] = _FULL
+
+            pending = np.ones(active.shape[0], dtype=bool)
+            pending[winners] = False
+            active = active[pending]
+            pos = (pos[pending] + 1) & self._mask
+        self._size += keys.shape[0]
+
+    def _rebuild(self, capacity: int) -> None:
+        live = self._state == _FULL
+        keys, values = self._keys[live], self._values[live]
+        self._alloc(capacity)
+        self._size = 0
+        self._insert_absent(keys, values)
@@ -1,141 +1,360 @@
+import sys
+import time
+from array import array
+from collections.abc import Callable
 from typing import Any
-from collections import OrderedDict
+
+from .heap import IndexedHeap
+
 _MISSING = object()
 
+
+def default_weigher(value) -> int:
+    """Bytes held by value: nbytes for numpy arrays and tensors, else sys.getsizeof."""
+    nbytes = getattr(value, "nbytes", None)
+    return nbytes if isinstance(nbytes, int) else sys.getsizeof(value)
+
+
 class Node:
+    __slots__ = ("_prev", "_next", "_key", "_value")
+
     def __init__(self, key, value, prev, next):
         self._prev = prev
         self._next = next
         self._key = key
         self._value = value
+
+
 class LRUCache:
-    def __init__(self, capacity: int):
+    """
+    LRU cache with O(1) get/put/delete/contains/len.
+
+    A dict maps each key to its Node in a doubly linked list bounded by two
+    sentinels: head._next is the least recently used entry and tail._prev the
+    most recently used one, so no operation ever has to walk the list.
+
+    Entries may carry a TTL (put(..., ttl=...) or default_ttl). Deadlines live
+    in an IndexedHeap keyed by cache key; every operation first pops the
+    entries whose deadline has passed, so a read never sees a stale value and
+    each entry costs one heap push and one pop over its lifetime. Caches that
+    never set a TTL don't allocate the heap and skip the check.
+
+    With max_weight set, the cache also keeps the summed weigher(value) of its
+    entries within that budget, evicting from the LRU end until a new entry
+    fits; an entry heavier than the whole budget is rejected with ValueError.
+
+    on_evict(key, value), if given, is called for every entry put() pushes
+    out to make room, after it has left the cache. Deletes, overwrites,
+    clear() and TTL expiry do not call it: those values are not worth keeping.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        default_ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        max_weight: int | None = None,
+        weigher: Callable[[Any], int] = default_weigher,
+        on_evict: Callable[[Any, Any], None] | None = None,
+    ):
         if capacity <= 0:
             raise ValueError
+        if default_ttl is not None and default_ttl <= 0:
+            raise ValueError("default_ttl must be positive")
+        if max_weight is not None and max_weight <= 0:
+            raise ValueError("max_weight must be positive")
         self._capacity = capacity
-        self._size = 0
-        # self._cache = OrderedDict() 
-        head = Node(key = None, value = None, prev = None, next = None)
-        self.head = head
+        self._map: dict[Any, Node] = {}
+        self.head = Node(key=None, value=None, prev=None, next=None)
+        self.tail = Node(key=None, value=None, prev=self.head, next=None)
+        self.head._next = self.tail
+        self._default_ttl = default_ttl
+        self._clock = clock
+        self._expiry: IndexedHeap | None = IndexedHeap() if default_ttl is not None else None
+        self._max_weight = max_weight
+        self._weigher = weigher
+        self._weights: dict[Any, int] | None = {} if max_weight is not None else None
+        self._current_weight = 0
+        self._on_evict = on_evict
 
     def get(self, key, default=_MISSING) -> Any:
-        self._move_to_end(key)
-        value = self._get_node(key)._value
-        if value:
-            return value
-        # if self.__contains__(key):
-        #     self._cache.move_to_end(key)
-        #     value = self._cache[key]
-        #     return value
-        if default != _MISSING:
+        if self._expiry is not None:
+            self._expire()
+        node = self._map.get(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
             return default
-        raise KeyError
-    
+        self._move_to_end(node)
+        return node._value
 
-    
-
-    def put(self, key, value) -> None:
-        if self.__contains__(key):
-            self._move_to_end(key)
-            self.get_tail(key)._value = value
-            return 
-        if self._size >= self._capacity:
-            self.head._next = self.head._next._next
-            self.head._next._prev = self.head
-            # self._cache.popitem(last = False)
-        new_node = Node(key=key, value=value, prev=self.get_tail(), next= None)
-        self.get_tail()._next = new_node
-        self._size  = self.__len__()
+    def put(self, key, value, ttl: float | None = _MISSING) -> None:
+        """
+        Insert or overwrite key as the most recently used entry.
 
+        ttl is in clock units (seconds by default); it defaults to the cache's
+        default_ttl, and None stores the entry without expiry. Overwriting a
+        key resets its TTL.
+        """
+        if ttl is _MISSING:
+            ttl = self._default_ttl
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if self._expiry is not None:
+            self._expire()
+        if self._weights is not None:
+            weight = self._weigher(value)
+            if weight > self._max_weight:
+                raise ValueError(f"entry weight {weight} exceeds max_weight {self._max_weight}")
+        node = self._map.get(key)
+        if node is not None:
+            node._value = value
+            self._move_to_end(node)
+            if self._weights is not None:
+                self._current_weight += weight - self._weights[key]
+                self._weights[key] = weight
+                # the updated entry is MRU and fits on its own, so this stops before it
+                while self._current_weight > self._max_weight:
+                    self._evict()
+        else:
+            if len(self._map) >= self._capacity:
+                self._evict()
+            if self._weights is not None:
+                while self._current_weight + weight > self._max_weight:
+                    self._evict()
+                self._weights[key] = weight
+                self._current_weight += weight
+            node = Node(key=key, value=value, prev=None, next=None)
+            self._map[key] = node
+            self._link_last(node)
+        if ttl is not None:
+            self._set_deadline(key, self._clock() + ttl)
+        elif self._expiry is not None and key in self._expiry:
+            self._expiry.remove(key)
 
     def delete(self, key) -> None:
-        node = self.head._next
-        while (node):
-            if node._key == key:
-                node._prev._next = node._next
-                node._next._prev = node._prev
-            node = node._next
-
-        self._size  = self.__len__()
+        if self._expiry is not None:
+            self._expire()
+        self._drop(key)
+        if self._expiry is not None and key in self._expiry:
+            self._expiry.remove(key)
 
-        if not node:
-            raise KeyError
+    def clear(self) -> None:
+        self._map.clear()
+        self.head._next = self.tail
+        self.tail._prev = self.head
+        if self._expiry is not None:
+            self._expiry = IndexedHeap()
+        if self._weights is not None:
+            self._weights.clear()
+            self._current_weight = 0
 
-        # self._cache.pop(key)
-        
+    @property
+    def current_weight(self) -> int:
+        """Summed weight of the cached entries (0 unless max_weight is set)."""
+        if self._expiry is not None:
+            self._expire()
+        return self._current_weight
 
     def __contains__(self, key) -> bool:
-        node = self.head._next
-        while node:
-            if key == node._key:
-                return True
-            node = node._next
-        return False
+        if self._expiry is not None:
+            self._expire()
+        return key in self._map
 
     def __len__(self) -> int:
-        n = 0
-        node = self.head._next
-        while node:
-            n += 1
-            node = node._next
-        return n
+        if self._expiry is not None:
+            self._expire()
+        return len(self._map)
 
     def keys(self) -> list:
-        keys = []
-        node = self.head._next
-        while node:
-            keys.append(node._key)
-            node = node._next
-        return keys
+        return [node._key for node in self._iter_nodes()]
 
     def values(self) -> list:
-        values = []
-        node = self.head._next
-        while node:
-            values.append(node._value)
-            node = node._next
-        return values
-    
+        return [node._value for node in self._iter_nodes()]
+
     def items(self) -> list:
-        items = []
-        node = self.head._next
-        while node:
-            items.append((node._key, node._value))
-            node = node._next
-        return items
-    
+        return [(node._key, node._value) for node in self._iter_nodes()]
+
+    def __repr__(self) -> str:
+        return f"LRUCache(capacity={self._capacity}, size={len(self._map)})"
+
     def get_tail(self) -> Node:
-        head = self.head
-        while head._next:
-            head = head._next
-        return head
-    
-    def _move_to_end(self, key):
+        # most recently used node, or the head sentinel when empty
+        return self.tail._prev
+
+    def _iter_nodes(self):
+        if self._expiry is not None:
+            self._expire()
         node = self.head._next
-        while node:
-            if node._key == key:
-                break
+        while node is not self.tail:
+            yield node
             node = node._next
+
+    def _link_last(self, node: Node) -> None:
+        last = self.tail._prev
+        node._prev = last
+        node._next = self.tail
+        last._next = node
+        self.tail._prev = node
+
+    def _unlink(self, node: Node) -> None:
         node._prev._next = node._next
         node._next._prev = node._prev
-        self.get_tail()._next = node
-        node._next = None
-    
-    def _get_node(self, key) -> Node:
-        node = self.head._next
-        while node:
-            if node._key == key:
-                return node
-            node = node._next
-        return None
-
-nil  = LRUCache(3)
-nil.put(3, 61)
-nil.put(8, 10)
-nil.put(4, 6)
-print(nil.items())
-print(nil.get(8))
-nil.put(53, 9)
-nil.put(63, 7)
-print(nil.keys())
-# print(nil.get(3))
\ No newline at end of file
+        node._prev = node._next = None
+
+    def _move_to_end(self, node: Node) -> None:
+        if node is self.tail._prev:
+            return
+        self._unlink(node)
+        self._link_last(node)
+
+    def _drop(self, key) -> Node:
+        node = self._map.pop(key)
+        self._unlink(node)
+        if self._weights is not None:
+            self._current_weight -= self._weights.pop(key)
+        return node
+
+    def _evict(self) -> Node:
+        node = self._drop(self.head._next._key)
+        if self._expiry is not None and node._key in self._expiry:
+            self._expiry.remove(node._key)
+        if self._on_evict is not None:
+            self._on_evict(node._key, node._value)
+        return node
+
+    def _set_deadline(self, key, deadline: float) -> None:
+        if self._expiry is None:
+            self._expiry = IndexedHeap()
+        if key in self._expiry:
+            self._expiry.update_priority(key, deadline)
+        else:
+            self._expiry.push(key, deadline)
+
+    def _expire(self) -> None:
+        expiry = self._expiry
+        if not expiry:
+            return
+        now = self._clock()
+        while expiry and expiry.peek_priority() <= now:
+            key, _ = expiry.pop()
+            self._drop(key)
+
+    def _get_node(self, key) -> Node | None:
+        return self._map.get(key)
+
+
+class CompactLRUCache:
+    """
+    LRU cache over preallocated slots instead of Node objects.
+
+    Keys and values live in two lists of `capacity` slots and the recency list
+    is a pair of int arrays, _prev and _next, indexed by slot. Slot `capacity`
+    is the sentinel: _next[sentinel] is the LRU slot, _prev[sentinel] the MRU
+    one. Deleted slots go on a free list threaded through _next. Eviction
+    reuses the LRU slot in place, so steady-state puts and gets only rewrite
+    integers in the arrays.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError
+        self._capacity = capacity
+        self._index: dict[Any, int] = {}
+        self._keys: list = [None] * capacity
+        self._values: list = [None] * capacity
+        typecode = "i" if capacity < 2**31 - 1 else "q"
+        self._prev = array(typecode, [capacity]) * (capacity + 1)
+        self._next = array(typecode, [capacity]) * (capacity + 1)
+        self._free = -1  # head of the free list of deleted slots
+        self._fresh = 0  # slots [_fresh, capacity) have never been used
+
+    def get(self, key, default=_MISSING) -> Any:
+        slot = self._index.get(key)
+        if slot is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self._move_to_end(slot)
+        return self._values[slot]
+
+    def put(self, key, value) -> None:
+        slot = self._index.get(key)
+        if slot is not None:
+            self._values[slot] = value
+            self._move_to_end(slot)
+            return
+        if len(self._index) >= self._capacity:
+            slot = self._next[self._capacity]
+            del self._index[self._keys[slot]]
+            self._unlink(slot)
+        elif self._free >= 0:
+            slot = self._free
+            self._free = self._next[slot]
+        else:
+            slot = self._fresh
+            self._fresh += 1
+        self._keys[slot] = key
+        self._values[slot] = value
+        self._index[key] = slot
+        self._link_last(slot)
+
+    def delete(self, key) -> None:
+        slot = self._index.pop(key)
+        self._unlink(slot)
+        self._keys[slot] = self._values[slot] = None
+        self._next[slot] = self._free
+        self._free = slot
+
+    def clear(self) -> None:
+        self._index.clear()
+        self._keys[:] = [None] * self._capacity
+        self._values[:] = [None] * self._capacity
+        self._prev[self._capacity] = self._next[self._capacity] = self._capacity
+        self._free = -1
+        self._fresh = 0
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def keys(self) -> list:
+        return [self._keys[slot] for slot in self._iter_slots()]
+
+    def values(self) -> list:
+        return [self._values[slot] for slot in self._iter_slots()]
+
+    def items(self) -> list:
+        return [(self._keys[slot], self._values[slot]) for slot in self._iter_slots()]
+
+    def __repr__(self) -> str:
+        return f"CompactLRUCache(capacity={self._capacity}, size={len(self._index)})"
+
+    def _iter_slots(self):
+        sentinel, nxt = self._capacity, self._next
+        slot = nxt[sentinel]
+        while slot != sentinel:
+            yield slot
+            slot = nxt[slot]
+
+    def _link_last(self, slot: int) -> None:
+        sentinel, prev, nxt = self._capacity, self._prev, self._next
+        last = prev[sentinel]
+        prev[slot] = last
+        nxt[slot] = sentinel
+        nxt[last] = slot
+        prev[sentinel] = slot
+
+    def _unlink(self, slot: int) -> None:
+        prev, nxt = self._prev, self._next
+        p, n = prev[slot], nxt[slot]
+        nxt[p] = n
+        prev[n] = p
+
+    def _move_to_end(self, slot: int) -> None:
+        if slot == self._prev[self._capacity]:
+            return
+        self._unlink(slot)
+        self._link_last(slot)
@@ -0,0 +1,151 @@
+import functools
+import sys
+from collections.abc import Callable
+from itertools import chain
+from typing import Any, NamedTuple
+
+from .lru_cache import LRUCache, default_weigher
+
+_KWD_MARK = object()
+_ABSENT = object()
+_FAST_TYPES = {int, str}
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+
+
+class _HashedKey(list):
+    """Flattened call key that hashes its contents once, as functools does."""
+
+    __slots__ = ("hashvalue",)
+
+    def __init__(self, tup: tuple):
+        self[:] = tup
+        self.hashvalue = hash(tup)
+
+    def __hash__(self):
+        return self.hashvalue
+
+
+def _make_key(args: tuple, kwds: dict, typed: bool):
+    key = args
+    if kwds:
+        key += (_KWD_MARK, *chain.from_iterable(kwds.items()))
+    if typed:
+        key += tuple(type(v) for v in args)
+        if kwds:
+            key += tuple(type(v) for v in kwds.values())
+    elif len(key) == 1 and type(key[0]) in _FAST_TYPES:
+        return key[0]
+    return _HashedKey(key)
+
+
+class _Memoized:
+    """
+    Callable wrapper holding one LRUCache of results.
+
+    Used as a method, it behaves like functools.cached_property: the first
+    access through an instance builds a wrapper with its own cache and stores
+    it in the instance __dict__, so instances never share or pin each other's
+    entries and later lookups skip the descriptor entirely. Like LRUCache it
+    is not thread-safe.
+    """
+
+    def __init__(self, func: Callable, maxsize: int | None, typed: bool, key: Callable | None, cache_kwargs: dict):
+        self._func = func
+        self._maxsize = maxsize
+        self._typed = typed
+        self._key = key
+        self._cache_kwargs = cache_kwargs
+        # maxsize=None is unbounded and 0 caches nothing, as in functools
+        self._cache = LRUCache(maxsize or sys.maxsize, **cache_kwargs) if maxsize != 0 else None
+        self._name = None
+        self._hits = self._misses = self._evictions = 0
+        functools.update_wrapper(self, func)
+
+    def __call__(self, *args, **kwds) -> Any:
+        cache = self._cache
+        if cache is None:
+            self._misses += 1
+            return self._func(*args, **kwds)
+        if self._key is not None:
+            k = self._key(*args, **kwds)
+        elif not kwds and len(args) == 1 and type(args[0]) in _FAST_TYPES and not self._typed:
+            k = args[0]
+        else:
+            k = _make_key(args, kwds, self._typed)
+        value = cache.get(k, _ABSENT)
+        if value is not _ABSENT:
+            self._hits += 1
+            return value
+        self._misses += 1
+        result = self._func(*args, **kwds)
+        before = len(cache)
+        try:
+            cache.put(k, result)
+        except ValueError:
+            return result  # heavier than max_weight: return it uncached
+        self._evictions += before + 1 - len(cache)
+        return result
+
+    def __set_name__(self, owner, name: str) -> None:
+        self._name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        try:
+            instance_dict = obj.__dict__
+        except AttributeError:
+            instance_dict = None
+        if instance_dict is None or self._name is None:
+            # no instance __dict__ (e.g. __slots__): fall back to the shared
+            # cache, keyed on the instance as the first argument
+            return functools.partial(self, obj)
+        bound = _Memoized(self._func, self._maxsize, self._typed, self._key, self._cache_kwargs)
+        bound._func = functools.partial(self._func, obj)
+        instance_dict[self._name] = bound
+        return bound
+
+    def cache_info(self) -> CacheInfo:
+        currsize = len(self._cache) if self._cache is not None else 0
+        return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, currsize)
+
+    def cache_clear(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
+        self._hits = self._misses = self._evictions = 0
+
+
+def lru_memoize(
+    maxsize: int | None = 128,
+    typed: bool = False,
+    key: Callable[..., Any] | None = None,
+    max_weight: int | None = None,
+    weigher: Callable[[Any], int] = default_weigher,
+):
+    """
+    functools.lru_cache-style decorator backed by LRUCache.
+
+    key, if given, maps the call's (*args, **kwargs) to the cache key instead
+    of the default flattened tuple; max_weight/weigher bound the cache by the
+    weight of the results as well as by maxsize entries. As in functools,
+    maxsize=None leaves the entry count unbounded and maxsize=0 (or less)
+    caches nothing. The wrapper exposes cache_info() and cache_clear().
+    """
+    if callable(maxsize) and not isinstance(maxsize, int):
+        # used as a bare @lru_memoize
+        return lru_memoize()(maxsize)
+    if maxsize is not None and maxsize < 0:
+        maxsize = 0
+    cache_kwargs = {"max_weight": max_weight, "weigher": weigher} if max_weight is not None else {}
+
+    def decorator(func: Callable) -> _Memoized:
+        return _Memoized(func, maxsize, typed, key, cache_kwargs)
+
+    return decorator
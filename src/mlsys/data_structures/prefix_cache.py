@@ -0,0 +1,231 @@
+from collections.abc import Sequence
+
+
+class _RadixNode:
+    __slots__ = ("tokens", "blocks", "children", "parent", "ref", "_prev", "_next")
+
+    def __init__(self, tokens: tuple, blocks: list, parent: "_RadixNode | None"):
+        self.tokens = tokens  # len(blocks) * block_size token ids
+        self.blocks = blocks
+        self.children: dict[tuple, _RadixNode] = {}  # keyed by the child's first block of tokens
+        self.parent = parent
+        self.ref = 0
+        # links in the evictable-leaf list; None while the node is not in it
+        self._prev: _RadixNode | None = None
+        self._next: _RadixNode | None = None
+
+
+class PrefixCache:
+    """
+    Radix tree from token-id prefixes to fixed-size KV block ids.
+
+    Token sequences are cut into blocks of block_size tokens and only full
+    blocks are cached. Each edge holds a run of blocks, and a node is split
+    at a block boundary when two sequences diverge inside it, so a shared
+    system prompt is stored once however many conversations extend it.
+
+    acquire() pins the blocks of a matched prefix for a running request and
+    release() unpins them; pinned blocks are never evicted. Unpinned leaves
+    sit in a doubly linked list in LRU order, bounded by sentinels as in
+    LRUCache. Evicting takes the last block of the least recently used leaf;
+    a parent left childless joins at the LRU end, since it was last used no
+    later than the leaf just evicted.
+    """
+
+    def __init__(self, block_size: int, max_blocks: int):
+        if block_size <= 0 or max_blocks <= 0:
+            raise ValueError
+        self._block_size = block_size
+        self._max_blocks = max_blocks
+        self._num_blocks = 0
+        self._root = _RadixNode((), [], None)
+        self.head = _RadixNode((), [], None)
+        self.tail = _RadixNode((), [], None)
+        self.head._next = self.tail
+        self.tail._prev = self.head
+
+    def match(self, tokens: Sequence[int]) -> list[int]:
+        """Block ids of the longest cached prefix; it covers len(result) * block_size tokens."""
+        blocks, path, _ = self._walk(tokens)
+        for node in path:
+            self._touch(node)
+        return blocks
+
+    def acquire(self, tokens: Sequence[int]) -> list[int]:
+        """match() and pin the returned blocks until release()."""
+        blocks, path, partial = self._walk(tokens)
+        if partial:
+            self._split(path[-1], partial)
+        for node in path:
+            self._pin(node)
+        return blocks
+
+    def release(self, tokens: Sequence[int]) -> None:
+        """Unpin a prefix returned by acquire(): pass tokens[: len(blocks) * block_size]."""
+        bs = self._block_size
+        end = len(tokens) // bs * bs
+        node, pos, path = self._root, 0, []
+        while pos < end:
+            node = node.children.get(tuple(tokens[pos : pos + bs]))
+            if node is None or node.ref == 0:
+                raise ValueError("release without a matching acquire")
+            path.append(node)
+            pos += len(node.tokens)
+        if pos != end:
+            raise ValueError("tokens do not end on an acquired prefix boundary")
+        for node in path:
+            self._unpin(node)
+
+    def insert(self, tokens: Sequence[int], block_ids: Sequence[int]) -> list[int]:
+        """
+        Cache block_ids as the KV blocks of tokens' full blocks.
+
+        Returns the block ids the caller should free: the caller's ids for
+        blocks that were already cached, ids evicted to stay within
+        max_blocks, and ids that did not fit because the rest is pinned.
+        """
+        bs = self._block_size
+        n = len(tokens) // bs
+        if len(block_ids) != n:
+            raise ValueError(f"{n} full blocks of tokens but {len(block_ids)} block ids")
+        cached, path, partial = self._walk(tokens)
+        if partial:
+            self._split(path[-1], partial)
+        freed = [b for b, c in zip(block_ids, cached, strict=False) if b != c]
+        m = len(cached)
+        if m == n:
+            for node in path:
+                self._touch(node)
+            return freed
+        parent = path[-1] if path else self._root
+        # pin the path so making room cannot evict the prefix we attach to
+        for node in path:
+            self._pin(node)
+        freed += self.evict(self._num_blocks + n - m - self._max_blocks)
+        fit = min(n - m, self._max_blocks - self._num_blocks)
+        if fit > 0:
+            leaf = _RadixNode(tuple(tokens[m * bs : (m + fit) * bs]), list(block_ids[m : m + fit]), parent)
+            self._unlink(parent)
+            parent.children[leaf.tokens[:bs]] = leaf
+            self._num_blocks += fit
+            self._link_last(leaf)
+        freed += list(block_ids[m + max(fit, 0) :])
+        for node in reversed(path):
+            self._unpin(node)
+        return freed
+
+    def evict(self, num_blocks: int) -> list[int]:
+        """Evict up to num_blocks unpinned blocks, LRU leaves first; returns their ids."""
+        evicted = []
+        while len(evicted) < num_blocks:
+            leaf = self.head._next
+            if leaf is self.tail:
+                break
+            key = leaf.tokens[: self._block_size]
+            evicted.append(leaf.blocks.pop())
+            leaf.tokens = leaf.tokens[: len(leaf.blocks) * self._block_size]
+            self._num_blocks -= 1
+            if leaf.blocks:
+                continue
+            self._unlink(leaf)
+            parent = leaf.parent
+            del parent.children[key]
+            if parent is not self._root and not parent.children and parent.ref == 0:
+                self._link_first(parent)
+        return evicted
+
+    def __len__(self) -> int:
+        """Number of cached blocks."""
+        return self._num_blocks
+
+    @property
+    def evictable_blocks(self) -> int:
+        count, node = 0, self.head._next
+        while node is not self.tail:
+            count += len(node.blocks)
+            node = node._next
+        return count
+
+    def __repr__(self) -> str:
+        return f"PrefixCache(block_size={self._block_size}, blocks={self._num_blocks}/{self._max_blocks})"
+
+    def _walk(self, tokens: Sequence[int]) -> tuple[list[int], list[_RadixNode], int]:
+        """
+        Follow tokens down the tree.
+
+        Returns the matched block ids, the nodes on the path, and how many
+        blocks of the last node matched if that was only part of it (else 0).
+        """
+        bs = self._block_size
+        end = len(tokens) // bs * bs
+        blocks, path = [], []
+        node, pos = self._root, 0
+        while pos < end:
+            child = node.children.get(tuple(tokens[pos : pos + bs]))
+            if child is None:
+                break
+            path.append(child)
+            k = 1  # the first block matched via the children key
+            while k < len(child.blocks) and pos + (k + 1) * bs <= end:
+                if child.tokens[k * bs : (k + 1) * bs] != tuple(tokens[pos + k * bs : pos + (k + 1) * bs]):
+                    break
+                k += 1
+            blocks.extend(child.blocks[:k])
+            pos += k * bs
+            if k < len(child.blocks):
+                return blocks, path, k
+            node = child
+        return blocks, path, 0
+
+    def _split(self, node: _RadixNode, k: int) -> None:
+        """Cut node after its first k blocks; node keeps the head, a new child the tail."""
+        bs = self._block_size
+        tail = _RadixNode(node.tokens[k * bs :], node.blocks[k:], node)
+        tail.children = node.children
+        for child in tail.children.values():
+            child.parent = tail
+        tail.ref = node.ref
+        node.tokens, node.blocks = node.tokens[: k * bs], node.blocks[:k]
+        node.children = {tail.tokens[:bs]: tail}
+        if node._prev is not None:
+            # node was an evictable leaf; its tail now is, at the same recency
+            self._replace(node, tail)
+
+    def _touch(self, node: _RadixNode) -> None:
+        if node._prev is not None:
+            self._unlink(node)
+            self._link_last(node)
+
+    def _pin(self, node: _RadixNode) -> None:
+        node.ref += 1
+        self._unlink(node)
+
+    def _unpin(self, node: _RadixNode) -> None:
+        node.ref -= 1
+        if node.ref == 0 and not node.children:
+            self._link_last(node)
+
+    def _link_last(self, node: _RadixNode) -> None:
+        last = self.tail._prev
+        node._prev, node._next = last, self.tail
+        last._next = node
+        self.tail._prev = node
+
+    def _link_first(self, node: _RadixNode) -> None:
+        first = self.head._next
+        node._prev, node._next = self.head, first
+        first._prev = node
+        self.head._next = node
+
+    def _unlink(self, node: _RadixNode) -> None:
+        if node._prev is None:
+            return
+        node._prev._next = node._next
+        node._next._prev = node._prev
+        node._prev = node._next = None
+
+    def _replace(self, old: _RadixNode, new: _RadixNode) -> None:
+        new._prev, new._next = old._prev, old._next
+        old._prev._next = new
+        old._next._prev = new
+        old._prev = old._next = None
@@ -0,0 +1,93 @@
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from .hashmap import _GOLDEN, _MASK64
+from .lru_cache import _MISSING, LRUCache
+
+
+class ShardedLRUCache:
+    """
+    Thread-safe LRU cache split into independently locked LRUCache shards.
+
+    A key always maps to the same shard, so operations on different shards
+    never contend. Each shard holds ceil(capacity / num_shards) entries and
+    evicts on its own, which makes the global capacity and the global LRU
+    order approximate: recency is exact only within a shard.
+    """
+
+    def __init__(self, capacity: int, num_shards: int = 16):
+        if capacity <= 0 or num_shards <= 0:
+            raise ValueError
+        self._capacity = capacity
+        shard_capacity = -(-capacity // num_shards)
+        self._shards = [LRUCache(shard_capacity) for _ in range(num_shards)]
+        self._locks = [threading.Lock() for _ in range(num_shards)]
+
+    def get(self, key, default=_MISSING) -> Any:
+        i = self._shard_index(key)
+        with self._locks[i]:
+            return self._shards[i].get(key, default)
+
+    def put(self, key, value) -> None:
+        i = self._shard_index(key)
+        with self._locks[i]:
+            self._shards[i].put(key, value)
+
+    def delete(self, key) -> None:
+        i = self._shard_index(key)
+        with self._locks[i]:
+            self._shards[i].delete(key)
+
+    def get_or_put(self, key, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached value, or cache and return factory().
+
+        factory runs under the shard lock, so concurrent callers for a missing
+        key see exactly one call; keep it cheap or it stalls the whole shard.
+        """
+        i = self._shard_index(key)
+        with self._locks[i]:
+            shard = self._shards[i]
+            try:
+                return shard.get(key)
+            except KeyError:
+                value = factory()
+                shard.put(key, value)
+                return value
+
+    def clear(self) -> None:
+        for lock, shard in zip(self._locks, self._shards, strict=True):
+            with lock:
+                shard.clear()
+
+    def __contains__(self, key) -> bool:
+        i = self._shard_index(key)
+        with self._locks[i]:
+            return key in self._shards[i]
+
+    def __len__(self) -> int:
+        # shards are counted one at a time, so concurrent writes may or may
+        # not be reflected in the total
+        return sum(len(shard) for shard in self._shards)
+
+    def keys(self) -> list:
+        return [k for k, _ in self.items()]
+
+    def values(self) -> list:
+        return [v for _, v in self.items()]
+
+    def items(self) -> list:
+        """Entries shard by shard, each shard in LRU -> MRU order."""
+        out = []
+        for lock, shard in zip(self._locks, self._shards, strict=True):
+            with lock:
+                out.extend(shard.items())
+        return out
+
+    def __repr__(self) -> str:
+        return f"ShardedLRUCache(capacity={self._capacity}, shards={len(self._shards)}, size={len(self)})"
+
+    def _shard_index(self, key) -> int:
+        # mix the hash so strided int keys still spread across shards
+        return (((hash(key) * _GOLDEN) & _MASK64) >> 32) % len(self._shards)
@@ -0,0 +1,348 @@
+import fcntl
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any
+
+from .hashmap_snapshot import _encode_key, _stable_hash
+
+_MISSING = object()
+
+_MAGIC = int.from_bytes(b"MLSHMCA1", "little")
+# header words (uint64): magic, capacity, index slots, key size, value size,
+# then the mutable ones
+_CAPACITY, _SLOTS, _KEY_SIZE, _VALUE_SIZE = 1, 2, 3, 4
+_SEQ, _SIZE, _HAND, _FRESH, _FREE_HEAD = 5, 6, 7, 8, 9
+_HEADER_WORDS = 16
+_NO_ENTRY = (1 << 64) - 1  # empty free list, in an unsigned header word
+# lock-free attempts before a reader falls back to the writer lock
+_READ_RETRIES = 64
+
+
+def _pad8(n: int) -> int:
+    return -(-n // 8) * 8
+
+
+def _layout(capacity: int, slots: int, key_size: int, value_size: int) -> list[tuple[str, str, int]]:
+    """(attribute, memoryview format, byte length) of each section after the header."""
+    return [
+        ("_index", "q", 8 * slots),  # entry + 1 per slot, 0 = empty
+        ("_hashes", "Q", 8 * capacity),
+        ("_next_free", "q", 8 * capacity),
+        ("_key_len", "I", 4 * capacity),
+        ("_value_len", "I", 4 * capacity),
+        ("_ref", "B", capacity),
+        ("_keys", "B", capacity * key_size),
+        ("_values", "B", capacity * value_size),
+    ]
+
+
+class SharedMemoryCache:
+    """
+    Fixed-capacity cache whose table and arenas live in shared memory.
+
+    Every process that attaches by name sees the same entries, so a value
+    computed by one worker is a hit for all of them and the pool keeps one
+    copy instead of one per worker. Entries are `capacity` fixed slots of
+    key_size key bytes and value_size value bytes (values are pickled); an
+    open-addressing index of stable key hashes maps keys to slots, using
+    backward-shift deletion so it never accumulates tombstones. Keys are
+    encoded canonically as in HashMap snapshots, so they must be str, bytes,
+    int, None or tuples of them; other types raise TypeError.
+
+    Writers serialise on an flock'd lock file next to the segment and bump
+    a sequence counter before and after each change (a seqlock). Readers
+    take no lock: they copy the value bytes and retry if the counter moved
+    or was odd, falling back to the lock after _READ_RETRIES attempts.
+    Eviction is CLOCK (second chance) rather than exact LRU, so a hit only
+    sets a reference byte instead of relinking a shared list.
+
+    Python < 3.13 registers every attached segment with the attaching
+    process's resource tracker. Pool workers share their parent's tracker,
+    which is harmless, but an unrelated process that attaches will unlink
+    the segment when it exits.
+    """
+
+    def __init__(
+        self, capacity: int, key_size: int = 64, value_size: int = 1024, name: str | None = None
+    ):
+        if capacity <= 0 or key_size <= 0 or value_size <= 0:
+            raise ValueError
+        slots = 8
+        while slots < 2 * capacity:
+            slots <<= 1
+        size = 8 * _HEADER_WORDS + sum(_pad8(n) for _, _, n in _layout(capacity, slots, key_size, value_size))
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self._setup(shm)
+        header = self._header
+        header[_CAPACITY], header[_SLOTS] = capacity, slots
+        header[_KEY_SIZE], header[_VALUE_SIZE] = key_size, value_size
+        header[_FREE_HEAD] = _NO_ENTRY
+        header[0] = _MAGIC
+        self._map_sections()
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedMemoryCache":
+        """Open a cache created by another process."""
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+        self = cls.__new__(cls)
+        self._setup(shm)
+        if self._header[0] != _MAGIC:
+            self.close()
+            raise ValueError(f"{name!r} is not a SharedMemoryCache segment")
+        self._map_sections()
+        return self
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def get(self, key, default=_MISSING) -> Any:
+        key_bytes, h = self._encode(key)
+        header = self._header
+        for _ in range(_READ_RETRIES):
+            seq = header[_SEQ]
+            if seq & 1:
+                continue  # a writer is mid-update
+            raw = self._read(key_bytes, h)
+            if header[_SEQ] == seq:
+                break
+        else:
+            with self._write_lock():
+                raw = self._read(key_bytes, h)
+        if raw is None:
+            self.misses += 1
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self.hits += 1
+        return pickle.loads(raw)
+
+    def put(self, key, value) -> None:
+        key_bytes, h = self._encode(key)
+        raw = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(raw) > self._value_size:
+            raise ValueError(f"pickled value is {len(raw)} bytes, value_size is {self._value_size}")
+        with self._write_lock():
+            slot = self._find_slot(key_bytes, h)
+            if slot >= 0:
+                entry = self._index[slot] - 1
+                self._ref[entry] = 1
+            else:
+                entry = self._allocate()
+                self._hashes[entry] = h
+                self._key_len[entry] = len(key_bytes)
+                start = entry * self._key_size
+                self._keys[start : start + len(key_bytes)] = key_bytes
+                self._ref[entry] = 0
+                self._insert_slot(entry, h)
+                self._header[_SIZE] += 1
+            start = entry * self._value_size
+            self._values[start : start + len(raw)] = raw
+            self._value_len[entry] = len(raw)
+
+    def delete(self, key) -> None:
+        key_bytes, h = self._encode(key)
+        with self._write_lock():
+            slot = self._find_slot(key_bytes, h)
+            if slot < 0:
+                raise KeyError(key)
+            entry = self._index[slot] - 1
+            self._remove_slot(slot)
+            self._next_free[entry] = self._free_head()
+            self._header[_FREE_HEAD] = entry
+            self._header[_SIZE] -= 1
+
+    def clear(self) -> None:
+        with self._write_lock():
+            self._index[:] = memoryview(bytes(8 * self._slots)).cast("q")
+            header = self._header
+            header[_SIZE] = header[_HAND] = header[_FRESH] = 0
+            header[_FREE_HEAD] = _NO_ENTRY
+
+    def __contains__(self, key) -> bool:
+        key_bytes, h = self._encode(key)
+        header = self._header
+        for _ in range(_READ_RETRIES):
+            seq = header[_SEQ]
+            if seq & 1:
+                continue
+            found = self._find_slot(key_bytes, h) >= 0
+            if header[_SEQ] == seq:
+                return found
+        with self._write_lock():
+            return self._find_slot(key_bytes, h) >= 0
+
+    def __len__(self) -> int:
+        return self._header[_SIZE]
+
+    def __repr__(self) -> str:
+        return f"SharedMemoryCache(name={self.name!r}, capacity={self._capacity}, size={len(self)})"
+
+    def __reduce__(self):
+        # crossing a process boundary (e.g. a pool initializer) re-attaches
+        return SharedMemoryCache.attach, (self.name,)
+
+    def close(self) -> None:
+        """Detach this process; the segment lives on until unlink()."""
+        if self._lock_fd < 0:
+            return
+        for view in self._views:
+            view.release()
+        self._views = []
+        self._shm.close()
+        os.close(self._lock_fd)
+        self._lock_fd = -1
+
+    def __del__(self):
+        # the section views pin the mapping, and SharedMemory's own __del__
+        # cannot close it while they exist, so a cache dropped without
+        # close() (e.g. one unpickled into a pool task) detaches here
+        if getattr(self, "_lock_fd", -1) >= 0:
+            self.close()
+
+    def unlink(self) -> None:
+        """Destroy the segment and its lock file; call once, from the creator."""
+        self._shm.unlink()
+        try:
+            os.unlink(self._lock_path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "SharedMemoryCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _setup(self, shm: shared_memory.SharedMemory) -> None:
+        self._shm = shm
+        self._lock_path = os.path.join(tempfile.gettempdir(), f"{shm.name.lstrip('/')}.lock")
+        self._lock_fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        # flock excludes other open files, not other threads sharing this one
+        self._thread_lock = threading.Lock()
+        self._header = shm.buf[: 8 * _HEADER_WORDS].cast("Q")
+        self._views = [self._header]
+        self.hits = self.misses = 0
+
+    def _map_sections(self) -> None:
+        header = self._header
+        self._capacity, self._slots = header[_CAPACITY], header[_SLOTS]
+        self._key_size, self._value_size = header[_KEY_SIZE], header[_VALUE_SIZE]
+        self._mask = self._slots - 1
+        offset = 8 * _HEADER_WORDS
+        for attr, fmt, length in _layout(self._capacity, self._slots, self._key_size, self._value_size):
+            view = self._shm.buf[offset : offset + length].cast(fmt)
+            setattr(self, attr, view)
+            self._views.append(view)
+            offset += _pad8(length)
+
+    @contextmanager
+    def _write_lock(self):
+        with self._thread_lock:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+            header = self._header
+            header[_SEQ] += 1
+            try:
+                yield
+            finally:
+                header[_SEQ] += 1
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _encode(self, key) -> tuple[bytes, int]:
+        tag, payload = _encode_key(key)
+        key_bytes = bytes([tag]) + payload
+        if len(key_bytes) > self._key_size:
+            raise ValueError(f"encoded key is {len(key_bytes)} bytes, key_size is {self._key_size}")
+        return key_bytes, _stable_hash(tag, payload)
+
+    def _read(self, key_bytes: bytes, h: int) -> bytes | None:
+        slot = self._find_slot(key_bytes, h)
+        if slot < 0:
+            return None
+        entry = self._index[slot] - 1
+        start = entry * self._value_size
+        raw = bytes(self._values[start : start + min(self._value_len[entry], self._value_size)])
+        # a racing writer may have reused the entry; the seqlock check in the
+        # caller discards raw then, and a stray reference bit is harmless
+        self._ref[entry] = 1
+        return raw
+
+    def _find_slot(self, key_bytes: bytes, h: int) -> int:
+        index, hashes, key_len, keys = self._index, self._hashes, self._key_len, self._keys
+        mask, key_size, n = self._mask, self._key_size, len(key_bytes)
+        i = h & mask
+        # bounded so a reader racing a writer can't loop forever
+        for _ in range(self._slots):
+            entry = index[i] - 1
+            if entry < 0:
+                return -1
+            if hashes[entry] == h and key_len[entry] == n:
+                start = entry * key_size
+                if keys[start : start + n] == key_bytes:
+                    return i
+            i = (i + 1) & mask
+        return -1
+
+    def _insert_slot(self, entry: int, h: int) -> None:
+        index, mask = self._index, self._mask
+        i = h & mask
+        while index[i]:
+            i = (i + 1) & mask
+        index[i] = entry + 1
+
+    def _remove_slot(self, i: int) -> None:
+        # backward-shift deletion: pull later members of the probe run back
+        # into the hole so lookups never need tombstones
+        index, hashes, mask = self._index, self._hashes, self._mask
+        j = i
+        while True:
+            j = (j + 1) & mask
+            if not index[j]:
+                break
+            home = hashes[index[j] - 1] & mask
+            # move j into the hole unless its home lies cyclically in (i, j]
+            if (i < j and not i < home <= j) or (i > j and j < home <= i):
+                index[i] = index[j]
+                i = j
+        index[i] = 0
+
+    def _free_head(self) -> int:
+        head = self._header[_FREE_HEAD]
+        return -1 if head == _NO_ENTRY else head
+
+    def _allocate(self) -> int:
+        header = self._header
+        head = self._free_head()
+        if head >= 0:
+            header[_FREE_HEAD] = self._next_free[head] & _NO_ENTRY
+            return head
+        if header[_FRESH] < self._capacity:
+            entry = header[_FRESH]
+            header[_FRESH] = entry + 1
+            return entry
+        # full: sweep the clock hand, clearing reference bits, to the first
+        # entry not used since the last pass
+        ref, capacity = self._ref, self._capacity
+        hand = header[_HAND]
+        while ref[hand]:
+            ref[hand] = 0
+            hand = (hand + 1) % capacity
+        header[_HAND] = (hand + 1) % capacity
+        self._remove_slot(self._find_slot_of(hand))
+        header[_SIZE] -= 1
+        return hand
+
+    def _find_slot_of(self, entry: int) -> int:
+        index, mask = self._index, self._mask
+        i = self._hashes[entry] & mask
+        while index[i] != entry + 1:
+            i = (i + 1) & mask
+        return i
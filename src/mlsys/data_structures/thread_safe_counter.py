@@ -0,0 +1,103 @@
+import threading
+
+_MODES = ("striped", "locked")
+
+
+class ThreadSafeCounter:
+    """
+    Counter that many threads can increment without sharing a lock.
+
+    mode="striped" (default) gives every thread its own cell: increment only
+    touches the caller's cell, and reads sum the cells under a lock that
+    writers never take. Cells only ever grow, so reset() does not zero them;
+    it moves a base offset instead, which keeps a concurrent increment from
+    being lost. mode="locked" returns a LockedCounter, a plain int behind one
+    lock, for comparison.
+    """
+
+    def __new__(cls, mode: str = "striped"):
+        if mode not in _MODES:
+            raise ValueError(f"unknown mode {mode!r}, expected one of {_MODES}")
+        if cls is ThreadSafeCounter and mode == "locked":
+            cls = LockedCounter
+        return super().__new__(cls)
+
+    def __init__(self, mode: str = "striped"):
+        self._local = threading.local()
+        self._lock = threading.Lock()  # guards _cells, _retired and _base
+        self._cells: list[tuple[threading.Thread, list[int]]] = []
+        self._retired = 0  # counts folded in from threads that have exited
+        self._base = 0
+
+    def increment(self, n: int = 1) -> None:
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._register()
+        # only the owning thread writes its cell, so this needs no lock
+        cell[0] += n
+
+    def value(self) -> int:
+        with self._lock:
+            return self._total() - self._base
+
+    def reset(self) -> None:
+        with self._lock:
+            self._base = self._total()
+
+    def snapshot_and_reset(self) -> int:
+        """Return the count since the last reset and start a new interval."""
+        with self._lock:
+            total = self._total()
+            delta, self._base = total - self._base, total
+            return delta
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(value={self.value()})"
+
+    def _register(self) -> list[int]:
+        cell = [0]
+        self._local.cell = cell
+        with self._lock:
+            self._cells.append((threading.current_thread(), cell))
+        return cell
+
+    def _total(self) -> int:
+        # caller holds _lock; a dead thread can't write again, so its cell is
+        # folded into _retired to keep _cells bounded by the live threads
+        total = self._retired
+        live = []
+        for thread, cell in self._cells:
+            if thread.is_alive():
+                live.append((thread, cell))
+                total += cell[0]
+            else:
+                self._retired += cell[0]
+                total += cell[0]
+        self._cells = live
+        return total
+
+
+class LockedCounter(ThreadSafeCounter):
+    """A single int behind a single lock."""
+
+    def __init__(self, mode: str = "locked"):
+        self._lock = threading.Lock()
+        self._value = 0
+
+    def increment(self, n: int = 1) -> None:
+        with self._lock:
+            self._value += n
+
+    def value(self) -> int:
+        with self._lock:
+            return self._value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._value = 0
+
+    def snapshot_and_reset(self) -> int:
+        with self._lock:
+            value, self._value = self._value, 0
+            return value
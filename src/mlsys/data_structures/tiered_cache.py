@@ -0,0 +1,283 @@
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from .lru_cache import _MISSING, LRUCache, default_weigher
+
+_ABSENT = object()
+
+
+class TieredCacheInfo(NamedTuple):
+    memory_hits: int
+    buffer_hits: int  # evicted entries still waiting in the write buffer
+    disk_hits: int
+    misses: int
+    disk_entries: int
+    disk_bytes: int  # size of the segment files on disk
+
+
+class TieredCache:
+    """
+    In-memory LRUCache over a disk tier that catches what it evicts.
+
+    Entries the memory tier evicts go to a write buffer, and a background
+    thread writes the buffer out in batches of batch_size (or whatever has
+    gathered after flush_interval seconds). Each batch becomes one segment
+    file of pickled values in a private temporary directory, so a batch
+    costs one file creation rather than one per entry. put() never waits on
+    the disk unless the buffer holds 4 * batch_size entries, which pushes
+    back on callers that evict faster than the disk absorbs.
+
+    get() tries memory, then the write buffer, then disk. A hit below
+    memory promotes the entry: it leaves the lower tier and is put back in
+    memory, so every key lives in exactly one tier. The disk tier is an
+    LRUCache index from key to (segment, offset, length). Its entries only
+    leave by promotion or eviction, oldest write first, so segments empty
+    out roughly in the order they were written; a segment file is deleted
+    once none of its records is indexed. Segments are evicted to keep the
+    files within disk_max_bytes, and records to keep the index within
+    disk_max_entries.
+
+    Like LRUCache it is meant for one caller thread; the lock only guards
+    the state shared with the writer thread. close() stops the writer and
+    removes the directory, dropping whatever was on disk.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        disk_max_bytes: int,
+        directory: str | None = None,
+        disk_max_entries: int | None = None,
+        batch_size: int = 64,
+        flush_interval: float = 0.05,
+        max_weight: int | None = None,
+        weigher: Callable[[Any], int] = default_weigher,
+    ):
+        if disk_max_bytes <= 0 or batch_size <= 0:
+            raise ValueError
+        self._memory = LRUCache(capacity, max_weight=max_weight, weigher=weigher, on_evict=self._spill)
+        self._disk = LRUCache(disk_max_entries or sys.maxsize, on_evict=self._release)
+        self._dir = tempfile.mkdtemp(prefix="tiered-cache-", dir=directory)
+        self._disk_max_bytes = disk_max_bytes
+        self._disk_bytes = 0
+        # segment path -> [indexed records, file size]
+        self._segments: dict[str, list[int]] = {}
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._cond = threading.Condition()
+        # _pending fills up between batches; _writing is the batch on its way
+        # to disk. Both stay readable until the index takes over the entry.
+        self._pending: dict[Any, Any] = {}
+        self._writing: dict[Any, Any] = {}
+        self._flushing = 0
+        self._closed = False
+        self._error: BaseException | None = None
+        self._seq = 0
+        self.memory_hits = self.buffer_hits = self.disk_hits = self.misses = 0
+        self._writer = threading.Thread(target=self._write_loop, name="tiered-cache-writer", daemon=True)
+        self._writer.start()
+
+    def get(self, key, default=_MISSING) -> Any:
+        value = self._memory.get(key, _ABSENT)
+        if value is not _ABSENT:
+            self.memory_hits += 1
+            return value
+        value = self._take(key)
+        if value is _ABSENT:
+            self.misses += 1
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self._memory.put(key, value)
+        return value
+
+    def put(self, key, value) -> None:
+        # the new value supersedes any older copy further down
+        self._discard(key)
+        self._memory.put(key, value)
+
+    def delete(self, key) -> None:
+        if key in self._memory:
+            self._memory.delete(key)
+        elif not self._discard(key):
+            raise KeyError(key)
+
+    def flush(self) -> None:
+        """Block until every evicted entry so far is on disk (or was dropped)."""
+        with self._cond:
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                while (self._pending or self._writing) and not self._closed:
+                    self._cond.wait()
+            finally:
+                self._flushing -= 1
+            self._raise_write_error()
+
+    def info(self) -> TieredCacheInfo:
+        with self._cond:
+            return TieredCacheInfo(
+                self.memory_hits,
+                self.buffer_hits,
+                self.disk_hits,
+                self.misses,
+                len(self._disk),
+                self._disk_bytes,
+            )
+
+    def close(self) -> None:
+        """Stop the writer thread and delete the disk tier."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._writer.join()
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def __enter__(self) -> "TieredCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __contains__(self, key) -> bool:
+        if key in self._memory:
+            return True
+        with self._cond:
+            return key in self._pending or key in self._writing or key in self._disk
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._memory) + len(self._pending) + len(self._writing) + len(self._disk)
+
+    def __repr__(self) -> str:
+        with self._cond:
+            buffered = len(self._pending) + len(self._writing)
+            return f"TieredCache(memory={len(self._memory)}, buffered={buffered}, disk={len(self._disk)})"
+
+    def _spill(self, key, value) -> None:
+        # on_evict of the memory tier: hand the entry to the writer
+        with self._cond:
+            while len(self._pending) >= 4 * self._batch_size and not self._closed:
+                self._cond.wait()
+            self._pending[key] = value
+            if len(self._pending) >= self._batch_size:
+                self._cond.notify_all()
+
+    def _take(self, key) -> Any:
+        """Remove key from the tiers below memory and return its value, or _ABSENT."""
+        with self._cond:
+            for buffer in (self._pending, self._writing):
+                value = buffer.pop(key, _ABSENT)
+                if value is not _ABSENT:
+                    self.buffer_hits += 1
+                    return value
+            record = self._disk.get(key, None)
+            if record is None:
+                return _ABSENT
+            self._disk.delete(key)
+        # the record still counts towards its segment, so the file stays
+        # put while it is read outside the lock
+        path, offset, length = record
+        with open(path, "rb") as f:
+            f.seek(offset)
+            value = pickle.loads(f.read(length))
+        with self._cond:
+            self._release(key, record)
+        self.disk_hits += 1
+        return value
+
+    def _discard(self, key) -> bool:
+        with self._cond:
+            found = self._pending.pop(key, _ABSENT) is not _ABSENT
+            found |= self._writing.pop(key, _ABSENT) is not _ABSENT
+            record = self._disk.get(key, None)
+            if record is not None:
+                self._disk.delete(key)
+                self._release(key, record)
+        return found or record is not None
+
+    def _release(self, key, record: tuple) -> None:
+        # a record left the index (also on_evict of the index); called under the lock
+        path = record[0]
+        segment = self._segments[path]
+        segment[0] -= 1
+        if segment[0] == 0:
+            del self._segments[path]
+            self._disk_bytes -= segment[1]
+            os.unlink(path)
+
+    def _write_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if len(self._pending) < self._batch_size and not self._flushing and not self._closed:
+                    # let a partial batch fill up a little before writing it
+                    self._cond.wait(self._flush_interval)
+                if self._closed:
+                    return
+                if not self._pending:
+                    continue
+                batch = self._writing = self._pending
+                self._pending = {}
+                items = list(batch.items())
+                self._cond.notify_all()  # room in the buffer again
+            path, size, written = self._write_segment(items)
+            with self._cond:
+                # a get() or put() may have claimed entries while they were written
+                written = [(k, r) for k, v, r in written if batch.get(k, _ABSENT) is v]
+                if written:
+                    while self._disk_bytes + size > self._disk_max_bytes and len(self._disk):
+                        self._disk._evict()
+                    self._segments[path] = [len(written), size]
+                    self._disk_bytes += size
+                    for key, record in written:
+                        self._disk.put(key, record)
+                elif path is not None:
+                    os.unlink(path)
+                self._writing = {}
+                self._cond.notify_all()
+
+    def _write_segment(self, items: list) -> tuple[str | None, int, list]:
+        """Write the values that fit in the disk budget to a new segment file."""
+        written, chunks, size = [], [], 0
+        for key, value in items:
+            try:
+                data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as exc:
+                # the writer thread has no caller to raise to; flush() reports it
+                self._error = exc
+                continue
+            if size + len(data) > self._disk_max_bytes:
+                continue  # it is a cache: what does not fit is dropped
+            written.append((key, value, len(data)))
+            chunks.append(data)
+            size += len(data)
+        if not written:
+            return None, 0, []
+        path = os.path.join(self._dir, f"{self._seq:016x}.seg")
+        self._seq += 1
+        try:
+            with open(path, "wb") as f:
+                f.write(b"".join(chunks))
+        except OSError as exc:
+            self._error = exc
+            return None, 0, []
+        records, offset = [], 0
+        for key, value, length in written:
+            records.append((key, value, (path, offset, length)))
+            offset += length
+        return path, size, records
+
+    def _raise_write_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise RuntimeError("TieredCache failed to write evicted entries") from error
@@ -0,0 +1,140 @@
+# tests/test_async_loading_cache.py
+import asyncio
+
+import pytest
+
+from mlsys.data_structures.async_loading_cache import AsyncLoadingCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def counting_loader(value, calls, delay=0.01):
+    async def load():
+        calls.append(value)
+        await asyncio.sleep(delay)
+        return value
+
+    return load
+
+
+def test_concurrent_misses_share_one_load():
+    async def main():
+        cache = AsyncLoadingCache(capacity=4)
+        calls = []
+        results = await asyncio.gather(*(cache.get_or_load("k", counting_loader(1, calls)) for _ in range(100)))
+        assert results == [1] * 100
+        assert calls == [1]
+        assert cache.get("k") == 1
+        assert await cache.get_or_load("k", counting_loader(2, calls)) == 1
+        assert calls == [1]
+
+    asyncio.run(main())
+
+
+def test_loader_errors_reach_every_waiter_and_are_not_cached():
+    async def main():
+        cache = AsyncLoadingCache(capacity=4)
+        calls = []
+
+        async def failing():
+            calls.append("fail")
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(*(cache.get_or_load("k", failing) for _ in range(10)), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert calls == ["fail"]
+        assert "k" not in cache
+        assert await cache.get_or_load("k", counting_loader(7, calls)) == 7
+
+    asyncio.run(main())
+
+
+def test_cancelling_a_waiter_does_not_cancel_the_shared_load():
+    async def main():
+        cache = AsyncLoadingCache(capacity=4)
+        calls = []
+        first = asyncio.create_task(cache.get_or_load("k", counting_loader(3, calls, delay=0.05)))
+        second = asyncio.create_task(cache.get_or_load("k", counting_loader(4, calls)))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert await second == 3
+        assert calls == [3]
+        assert cache.get("k") == 3
+
+    asyncio.run(main())
+
+
+def test_load_completes_after_all_waiters_cancel():
+    async def main():
+        cache = AsyncLoadingCache(capacity=4)
+        calls = []
+        waiter = asyncio.create_task(cache.get_or_load("k", counting_loader(5, calls, delay=0.02)))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0.05)
+        assert cache.get("k") == 5
+
+    asyncio.run(main())
+
+
+def test_invalidate_during_load_skips_caching():
+    async def main():
+        cache = AsyncLoadingCache(capacity=4)
+        calls = []
+        waiter = asyncio.create_task(cache.get_or_load("k", counting_loader(1, calls)))
+        await asyncio.sleep(0)
+        cache.invalidate("k")
+        assert await waiter == 1
+        assert "k" not in cache
+
+    asyncio.run(main())
+
+
+def test_ttl_expiry_reloads():
+    async def main():
+        clock = FakeClock()
+        cache = AsyncLoadingCache(capacity=4, ttl=10, clock=clock)
+        calls = []
+        await cache.get_or_load("k", counting_loader(1, calls, delay=0))
+        clock.now = 11
+        assert await cache.get_or_load("k", counting_loader(2, calls, delay=0)) == 2
+        assert calls == [1, 2]
+
+    asyncio.run(main())
+
+
+def test_refresh_ahead_serves_stale_value_while_reloading():
+    async def main():
+        clock = FakeClock()
+        cache = AsyncLoadingCache(capacity=4, ttl=10, refresh_ahead=2, clock=clock)
+        calls = []
+        await cache.get_or_load("k", counting_loader(1, calls, delay=0))
+        clock.now = 5
+        assert await cache.get_or_load("k", counting_loader(2, calls)) == 1
+        assert calls == [1]  # not due yet
+        clock.now = 8.5
+        assert await cache.get_or_load("k", counting_loader(2, calls)) == 1
+        assert await cache.get_or_load("k", counting_loader(3, calls)) == 1
+        await asyncio.sleep(0.05)
+        assert calls == [1, 2]
+        assert cache.get("k") == 2
+        clock.now = 17  # the refreshed entry lives until 18.5
+        assert "k" in cache
+
+    asyncio.run(main())
+
+
+def test_refresh_ahead_validation():
+    with pytest.raises(ValueError):
+        AsyncLoadingCache(4, refresh_ahead=1)
+    with pytest.raises(ValueError):
+        AsyncLoadingCache(4, ttl=1, refresh_ahead=2)
@@ -0,0 +1,82 @@
+# tests/test_cache_policies.py
+import random
+
+import pytest
+
+from mlsys.data_structures.cache_policies import ARCCache, CountMinSketch, SLRUCache, WTinyLFUCache
+
+POLICIES = [SLRUCache, ARCCache, WTinyLFUCache]
+
+
+@pytest.mark.parametrize("cls", POLICIES)
+def test_basic_interface_matches_lru_cache(cls):
+    with pytest.raises(ValueError):
+        cls(0)
+    c = cls(4)
+    assert len(c) == 0
+    assert c.get("x", default=None) is None
+    with pytest.raises(KeyError):
+        c.get("x")
+    with pytest.raises(KeyError):
+        c.delete("x")
+
+    c.put("a", 1)
+    assert "a" in c and c.get("a") == 1
+    c.put("a", 2)
+    assert c.get("a") == 2 and len(c) == 1
+    c.delete("a")
+    assert "a" not in c and len(c) == 0
+
+
+@pytest.mark.parametrize("capacity", [1, 2, 7, 50])
+@pytest.mark.parametrize("cls", POLICIES)
+def test_random_operations_respect_capacity_and_values(cls, capacity):
+    rng = random.Random(capacity)
+    c = cls(capacity)
+    truth = {}
+    for _ in range(5_000):
+        k = int(rng.paretovariate(1.0)) % 200
+        r = rng.random()
+        if r < 0.45:
+            v = rng.random()
+            c.put(k, v)
+            truth[k] = v
+        elif r < 0.95:
+            got = c.get(k, default=None)
+            assert got is None or got == truth[k]  # a hit is never stale
+        elif k in c:
+            c.delete(k)
+            assert k not in c
+        assert len(c) <= capacity
+    assert all(c.get(k) == truth[k] for k in range(200) if k in c)
+
+
+@pytest.mark.parametrize("cls", POLICIES)
+def test_hot_set_survives_a_one_off_scan(cls):
+    c = cls(100)
+    hot = list(range(50))
+    for _ in range(5):
+        for k in hot:
+            if c.get(k, default=None) is None:
+                c.put(k, k)
+
+    for k in range(1_000, 1_500):  # a scan of keys never seen again
+        if c.get(k, default=None) is None:
+            c.put(k, k)
+
+    survivors = sum(k in c for k in hot)
+    assert survivors >= 40
+
+
+def test_count_min_sketch_estimates_and_ages():
+    s = CountMinSketch(4_096, sample_size=200)
+    for _ in range(10):
+        s.increment("hot")
+    s.increment("cold")
+    assert s.estimate("hot") >= 10
+    assert 1 <= s.estimate("cold") < s.estimate("hot")
+    assert s.estimate("never") <= 1
+
+    for i in range(200):  # crossing sample_size halves every counter
+        s.increment(i)
+    assert s.estimate("hot") <= 6
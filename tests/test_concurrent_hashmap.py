@@ -0,0 +1,162 @@
+# tests/test_concurrent_hashmap.py
+import random
+import sys
+import threading
+
+import pytest
+
+from mlsys.data_structures.concurrent_hashmap import ConcurrentHashMap
+
+
+@pytest.fixture
+def fast_switching():
+    # hand the GIL over as often as possible so threads interleave mid-operation
+    old = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(old)
+
+
+def _run(workers) -> None:
+    errors = []
+
+    def wrap(fn):
+        def run():
+            try:
+                fn()
+            except BaseException as exc:  # re-raised in the main thread below
+                errors.append(exc)
+        return run
+
+    threads = [threading.Thread(target=wrap(fn)) for fn in workers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
+
+
+def test_basic_operations_and_missing_keys():
+    m = ConcurrentHashMap(num_segments=4)
+    m.set("a", 1)
+    m.set("a", 2)
+    m.set(None, 0)
+    assert m.get("a") == 2 and m.get(None) == 0
+    assert "a" in m and "b" not in m
+    assert m.get("b", None) is None
+    with pytest.raises(KeyError):
+        m.get("b")
+    m.delete("a")
+    with pytest.raises(KeyError):
+        m.delete("a")
+    assert len(m) == 1 and list(m.items()) == [(None, 0)]
+    m.clear()
+    assert len(m) == 0 and list(m) == []
+
+
+def test_random_operations_match_dict():
+    rng = random.Random(0)
+    m = ConcurrentHashMap(initial_capacity=1, num_segments=3)
+    ref = {}
+    for _ in range(20_000):
+        k = rng.choice([rng.randrange(300) * 4096, f"k{rng.randrange(300)}"])
+        op = rng.random()
+        if op < 0.5:
+            m.set(k, op)
+            ref[k] = op
+        elif op < 0.7 and k in ref:
+            m.delete(k)
+            del ref[k]
+        else:
+            assert m.get(k, None) == ref.get(k)
+    assert len(m) == len(ref)
+    assert sorted(m.items(), key=repr) == sorted(ref.items(), key=repr)
+
+
+def test_update_and_compute_if_absent():
+    m = ConcurrentHashMap()
+    assert m.update("n", lambda v: v + 1, 0) == 1
+    assert m.update("n", lambda v: v * 10) == 10
+    with pytest.raises(KeyError):
+        m.update("missing", lambda v: v)
+    assert "missing" not in m
+
+    calls = []
+    assert m.compute_if_absent("x", lambda: calls.append(1) or "made") == "made"
+    assert m.compute_if_absent("x", lambda: calls.append(1) or "again") == "made"
+    assert calls == [1]
+
+
+def test_concurrent_update_loses_no_increments(fast_switching):
+    m = ConcurrentHashMap(num_segments=2)
+
+    def worker():
+        for i in range(2_000):
+            m.update(i % 8, lambda v: v + 1, 0)
+
+    _run([worker] * 8)
+    assert dict(m.items()) == {k: 2_000 for k in range(8)}
+
+
+def test_compute_if_absent_calls_factory_once_per_key(fast_switching):
+    m = ConcurrentHashMap(initial_capacity=2)
+    calls = ConcurrentHashMap()
+
+    def factory(k):
+        def make():
+            calls.update(k, lambda v: v + 1, 0)
+            return k * 2
+        return make
+
+    def worker():
+        for k in range(500):
+            assert m.compute_if_absent(k, factory(k)) == k * 2
+
+    _run([worker] * 6)
+    assert dict(calls.items()) == {k: 1 for k in range(500)}
+
+
+def test_stress_readers_and_writers_across_resizes(fast_switching):
+    # stable keys must stay visible to lock-free readers while writers churn
+    # other keys through many resizes of every segment
+    m = ConcurrentHashMap(initial_capacity=1, num_segments=4)
+    stable = range(0, 2_000, 2)
+    for k in stable:
+        m.set(k, -k)
+    done = threading.Event()
+
+    def writer(seed):
+        def run():
+            rng = random.Random(seed)
+            mine = [k for k in range(1, 40_000, 2) if k % 4 == seed]
+            for k in mine:
+                m.set(k, k)
+            for k in rng.sample(mine, len(mine) // 2):
+                m.delete(k)
+        return run
+
+    def reader():
+        rng = random.Random()
+        while not done.is_set():
+            k = rng.choice(stable)
+            assert m.get(k) == -k
+            assert k in m
+
+    def iterator():
+        while not done.is_set():
+            keys = list(m)
+            assert len(keys) == len(set(keys))  # weakly consistent, but never a duplicate
+            assert set(stable) <= set(keys)
+
+    writers = [writer(s) for s in (1, 3)]
+
+    def writers_then_stop():
+        _run(writers)
+        done.set()
+
+    _run([writers_then_stop, reader, reader, iterator])
+    # each writer inserted 10_000 odd keys and deleted half of them
+    assert len(m) == len(stable) + 10_000
+    assert len(list(m.items())) == len(m)
+    assert all(m.get(k) == -k for k in stable)
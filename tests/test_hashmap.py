@@ -305,3 +305,690 @@ def test_random_operations_match_dict():
                     hm.get(k)
 
         assert len(hm) == len(d)
+
+
+# ----------------------------
+# Open-addressing backend
+# ----------------------------
+
+def test_open_backend_is_selected_by_constructor():
+    from mlsys.data_structures.hashmap import OpenAddressingHashMap
+
+    assert isinstance(HashMap(backend="open"), OpenAddressingHashMap)
+    assert type(HashMap()) is HashMap
+    with pytest.raises(ValueError):
+        HashMap(backend="cuckoo")
+
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_options_after_backend_are_keyword_only(backend):
+    with pytest.raises(TypeError):
+        HashMap(8, 0.75, backend, False)
+    hm = HashMap(8, 0.75, backend, min_load_factor=0.1)
+    hm.set("a", 1)
+    assert hm.get("a") == 1
+
+
+def test_open_backend_collisions_tombstones_and_resize():
+    hm = HashMap(initial_capacity=4, backend="open")
+    keys = [ConstantHashKey(i) for i in range(30)]
+    for i, k in enumerate(keys):
+        hm.set(k, i)
+
+    # deleting from the middle of a probe run must not hide later keys
+    hm.delete(keys[3])
+    assert keys[3] not in hm
+    assert all(hm.get(k) == i for i, k in enumerate(keys) if i != 3)
+
+    # re-inserting reuses the tombstone rather than duplicating
+    hm.set(keys[3], 333)
+    hm.set(keys[3], 334)
+    assert len(hm) == 30
+    assert dict(hm.items())[keys[3]] == 334
+    assert set(hm.keys()) == set(keys)
+
+
+def test_open_backend_random_operations_match_dict():
+    import random
+    rng = random.Random(1)
+
+    hm = HashMap(initial_capacity=4, backend="open")
+    d = {}
+    for _ in range(5000):
+        k = rng.randrange(200)
+        if rng.random() < 0.4 and k in d:
+            hm.delete(k)
+            del d[k]
+        else:
+            hm.set(k, -k)
+            d[k] = -k
+        assert len(hm) == len(d)
+
+    assert sorted(hm.items()) == sorted(d.items())
+    assert sorted(hm.values()) == sorted(d.values())
+    assert hm.get(10_000, default=None) is None
+
+
+# ----------------------------
+# Cached hashes
+# ----------------------------
+
+class CountingKey:
+    """Counts __hash__ and __eq__ calls across all instances."""
+    hash_calls = 0
+    eq_calls = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        CountingKey.hash_calls += 1
+        return hash(self.value)
+
+    def __eq__(self, other):
+        CountingKey.eq_calls += 1
+        return isinstance(other, CountingKey) and self.value == other.value
+
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_resize_never_rehashes_stored_keys(backend):
+    hm = HashMap(initial_capacity=4, backend=backend)
+    keys = [CountingKey(i) for i in range(100)]
+    CountingKey.hash_calls = 0
+    for i, k in enumerate(keys):
+        hm.set(k, i)
+
+    # one hash per set, none from the resizes in between
+    assert CountingKey.hash_calls == len(keys)
+
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_hash_mismatch_skips_eq(backend):
+    hm = HashMap(initial_capacity=4, backend=backend)
+    for i in range(50):
+        hm.set(CountingKey(i), i)
+
+    CountingKey.eq_calls = 0
+    assert CountingKey(1_000) not in hm
+    assert hm.get(CountingKey(7)) == 7
+    # a fresh-but-equal key needs exactly one __eq__; distinct hashes need none
+    assert CountingKey.eq_calls == 1
+
+
+# ----------------------------
+# Bulk construction
+# ----------------------------
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_reserve_presizes_so_inserts_never_resize(backend):
+    hm = HashMap(backend=backend)
+    hm.reserve(1_000)
+    capacity = hm._capacity
+    for i in range(1_000):
+        hm.set(i, i)
+    assert hm._capacity == capacity
+
+    # reserving less than what is already there is a no-op
+    hm.reserve(10)
+    assert hm._capacity == capacity
+
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_update_accepts_mappings_hashmaps_and_pair_iterables(backend):
+    hm = HashMap(backend=backend)
+    hm.set("a", 0)
+    hm.update({"a": 1, "b": 2})
+    hm.update([("c", 3)])
+    hm.update((k, k.upper()) for k in "de")
+
+    other = HashMap()
+    other.set("f", 6)
+    hm.update(other)
+
+    assert sorted(hm.items()) == [("a", 1), ("b", 2), ("c", 3), ("d", "D"), ("e", "E"), ("f", 6)]
+
+
+def test_from_items_sizes_once_and_forwards_constructor_args():
+    pairs = [(i, str(i)) for i in range(500)]
+    hm = HashMap.from_items(iter(pairs), size_hint=500, backend="open")
+    assert type(hm).__name__ == "OpenAddressingHashMap"
+    assert len(hm) == 500
+    assert hm.get(499) == "499"
+
+    chained = HashMap.from_items(pairs, load_factor=0.5)
+    assert chained._capacity * 0.5 >= 500
+    assert sorted(chained.items()) == sorted(pairs)
+
+
+# ----------------------------
+# Incremental resize
+# ----------------------------
+
+def test_incremental_resize_keeps_both_tables_visible_during_migration():
+    hm = HashMap(initial_capacity=64, incremental_resize=True)
+    for i in range(49):  # the 49th insert crosses 0.75 * 64
+        hm.set(i, i)
+    assert hm._old_buckets is not None
+    assert hm._capacity == 128
+
+    # every entry is reachable and iteration sees both tables mid-migration
+    assert sorted(hm.keys()) == list(range(49))
+    assert all(hm.get(i) == i for i in range(49))
+    assert len(hm) == 49
+
+
+def test_incremental_resize_migrates_in_bounded_steps_and_finishes():
+    hm = HashMap(initial_capacity=64, incremental_resize=True)
+    for i in range(49):
+        hm.set(i, i)
+    old_capacity = hm._old_capacity
+
+    steps = 0
+    while hm._old_buckets is not None:
+        before = hm._rehash_idx
+        assert 1000 not in hm
+        assert hm._old_buckets is None or hm._rehash_idx - before == HashMap._REHASH_STEP
+        steps += 1
+    assert steps == old_capacity // HashMap._REHASH_STEP
+    assert sorted(hm.items()) == [(i, i) for i in range(49)]
+
+
+def test_incremental_resize_random_operations_match_dict():
+    import random
+    rng = random.Random(2)
+
+    hm = HashMap(initial_capacity=4, incremental_resize=True)
+    d = {}
+    keys = [ConstantHashKey(i) for i in range(20)] + list(range(500))
+    for _ in range(5000):
+        k = rng.choice(keys)
+        if rng.random() < 0.3 and k in d:
+            hm.delete(k)
+            del d[k]
+        else:
+            hm.set(k, rng.random())
+            d[k] = hm.get(k)
+        assert len(hm) == len(d)
+        assert (k in hm) == (k in d)
+
+    hm.reserve(10_000)  # a stop-the-world rehash completes any migration first
+    assert hm._old_buckets is None
+    assert sorted(hm.items(), key=repr) == sorted(d.items(), key=repr)
+
+
+def test_incremental_resize_is_chained_only():
+    with pytest.raises(ValueError):
+        HashMap(backend="open", incremental_resize=True)
+
+
+# ----------------------------
+# Shrinking, compaction, clear
+# ----------------------------
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_clear_resets_to_initial_capacity(backend):
+    hm = HashMap(initial_capacity=8, backend=backend)
+    for i in range(1_000):
+        hm.set(i, i)
+    hm.clear()
+
+    assert len(hm) == 0
+    assert hm._capacity == 8
+    assert list(hm.items()) == []
+    assert 1 not in hm
+    hm.set("a", 1)
+    assert hm.get("a") == 1
+
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_compact_shrinks_to_fit_and_keeps_entries(backend):
+    hm = HashMap(initial_capacity=8, backend=backend)
+    for i in range(10_000):
+        hm.set(i, i)
+    for i in range(10, 10_000):
+        hm.delete(i)
+    peak = hm._capacity
+
+    hm.compact()
+    assert hm._capacity == 16
+    assert hm._capacity < peak
+    assert sorted(hm.items()) == [(i, i) for i in range(10)]
+
+
+@pytest.mark.parametrize("backend, incremental", [("chained", False), ("chained", True), ("open", False)])
+def test_min_load_factor_shrinks_with_hysteresis(backend, incremental):
+    hm = HashMap(backend=backend, incremental_resize=incremental, min_load_factor=0.1)
+    for i in range(4_096):
+        hm.set(i, i)
+    peak = hm._capacity
+
+    for i in range(4_096 - 100):
+        hm.delete(i)
+    assert hm._capacity < peak
+    assert len(hm) / hm._capacity >= 0.1 or hm._capacity == 8
+
+    # alternating delete/insert at the threshold must not resize every time
+    capacity = hm._capacity
+    for _ in range(50):
+        hm.delete(4_095)
+        hm.set(4_095, 0)
+    assert hm._capacity == capacity
+    assert sorted(hm.keys()) == list(range(4_096 - 100, 4_096))
+
+
+def test_min_load_factor_must_leave_room_for_hysteresis():
+    with pytest.raises(ValueError):
+        HashMap(load_factor=0.75, min_load_factor=0.3)
+    with pytest.raises(ValueError):
+        HashMap(backend="open", min_load_factor=0)
+
+
+# ----------------------------
+# Live views and iteration
+# ----------------------------
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_views_are_live_and_dict_like(backend):
+    hm = HashMap(backend=backend)
+    keys, values, items = hm.keys(), hm.values(), hm.items()
+    assert len(keys) == 0 and list(items) == []
+
+    hm.set("a", 1)
+    hm.set("b", 2)
+    assert len(keys) == 2
+    assert "a" in keys and "z" not in keys
+    assert 2 in values and 3 not in values
+    assert ("a", 1) in items and ("a", 2) not in items and ("z", 1) not in items
+    # like dict.items(), anything that is not a (key, value) pair is simply absent
+    assert ("a",) not in items and ("a", 1, 2) not in items and 5 not in items
+    assert keys == {"a", "b"}
+    assert keys & {"b", "c"} == {"b"}
+    assert sorted(hm) == ["a", "b"]
+
+    hm.delete("a")
+    assert list(keys) == ["b"]
+    assert list(items) == [("b", 2)]
+
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_mutation_during_iteration_raises(backend):
+    hm = HashMap(backend=backend)
+    for i in range(20):
+        hm.set(i, i)
+
+    with pytest.raises(RuntimeError):
+        for k in hm:
+            hm.set(k + 100, 0)
+    with pytest.raises(RuntimeError):
+        for k, _ in hm.items():
+            hm.delete(k)
+
+    # overwriting values is not a structural change
+    for k in list(hm.keys()):
+        hm.set(k, -1)
+    for k in hm:
+        hm.set(k, -2)
+    assert set(hm.values()) == {-2}
+
+
+def test_iteration_during_incremental_migration_sees_every_entry_once():
+    hm = HashMap(initial_capacity=64, incremental_resize=True)
+    for i in range(49):
+        hm.set(i, i)
+    assert hm._old_buckets is not None
+
+    seen = []
+    for k in hm:
+        seen.append(k)
+        assert hm.get(k) == k  # lookups during iteration are fine
+    assert sorted(seen) == list(range(49))
+
+
+# ----------------------------
+# Snapshots (save / open_mmap)
+# ----------------------------
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_save_and_open_mmap_round_trip(tmp_path, backend):
+    import numpy as np
+
+    hm = HashMap(backend=backend)
+    hm.set("text", "héllo")
+    hm.set(b"raw", b"\x00\x01payload")
+    hm.set(-(2**70), 3.5)
+    hm.set(7, None)
+    hm.set(("tuple", 1), {"nested": [1, 2]})
+    hm.set("vec", np.arange(12, dtype=np.float32).reshape(3, 4))
+    for i in range(200):
+        hm.set(f"k{i}", i)
+    path = tmp_path / "map.snap"
+    hm.save(path)
+
+    with HashMap.open_mmap(path) as mapped:
+        assert len(mapped) == len(hm)
+        assert mapped.get("text") == "héllo"
+        assert mapped.get(-(2**70)) == 3.5
+        assert mapped.get(7) is None
+        assert mapped.get(("tuple", 1)) == {"nested": [1, 2]}
+        assert all(mapped.get(f"k{i}") == i for i in range(200))
+        assert "k5" in mapped and "k200" not in mapped and 8 not in mapped
+        assert mapped.get("missing", "d") == "d"
+        with pytest.raises(KeyError):
+            mapped.get("missing")
+        assert set(mapped) == set(hm.keys())
+
+        raw = mapped.get(b"raw")
+        assert isinstance(raw, memoryview) and raw.readonly
+        assert bytes(raw) == b"\x00\x01payload"
+        vec = mapped.get("vec")
+        assert not vec.flags.writeable and not vec.flags.owndata
+        np.testing.assert_array_equal(vec, np.arange(12, dtype=np.float32).reshape(3, 4))
+        assert vec.ctypes.data % 16 == 0
+        del raw, vec
+
+
+def test_snapshot_arrays_keep_shape_and_fields(tmp_path):
+    import numpy as np
+
+    scalar = np.array(5.0)
+    records = np.array([(1, 2.5), (3, -1.0)], dtype=[("id", "<i4"), ("score", "<f8")])
+    strided = np.arange(20, dtype=np.int16).reshape(4, 5)[:, ::2]
+    hm = HashMap()
+    hm.set("scalar", scalar)
+    hm.set("records", records)
+    hm.set("strided", strided)
+    path = tmp_path / "map.snap"
+    hm.save(path)
+
+    with HashMap.open_mmap(path) as mapped:
+        got = mapped["scalar"]
+        assert got.shape == () and got.dtype == scalar.dtype and got == 5.0
+        got = mapped["records"]
+        assert got.dtype == records.dtype and got.dtype.names == ("id", "score")
+        np.testing.assert_array_equal(got, records)
+        np.testing.assert_array_equal(mapped["strided"], strided)
+        del got
+
+
+def test_failed_close_leaves_mapped_map_usable(tmp_path):
+    hm = HashMap()
+    hm.set("a", b"alpha")
+    hm.set("b", b"beta")
+    path = tmp_path / "map.snap"
+    hm.save(path)
+
+    mapped = HashMap.open_mmap(path)
+    held = mapped["a"]
+    with pytest.raises(BufferError):
+        mapped.close()
+    assert bytes(mapped["b"]) == b"beta" and bytes(held) == b"alpha"
+    held.release()
+    mapped.close()
+
+
+def test_snapshot_tuple_keys_match_by_value(tmp_path):
+    hm = HashMap()
+    hm.set(("emb", "emb"), 1)
+    hm.set((None, (b"x", -5), ()), 2)
+    path = tmp_path / "map.snap"
+    hm.save(path)
+
+    key = ("emb", "".join(["e", "mb"]))  # equal, but the two strs are distinct objects
+    assert key in hm
+    with HashMap.open_mmap(path) as mapped:
+        assert key in mapped and mapped[key] == 1
+        assert mapped[(None, (b"x", -5), ())] == 2
+        assert set(mapped) == {("emb", "emb"), (None, (b"x", -5), ())}
+        assert 1.5 not in mapped
+
+
+def test_save_rejects_keys_without_a_canonical_encoding(tmp_path):
+    path = tmp_path / "map.snap"
+    hm = HashMap()
+    hm.set(frozenset({"a", "b"}), 1)
+    with pytest.raises(TypeError):
+        hm.save(path)
+    assert not path.exists() and list(tmp_path.iterdir()) == []
+
+
+def test_save_into_missing_directory_raises_the_open_error(tmp_path):
+    with pytest.raises(FileNotFoundError) as excinfo:
+        HashMap().save(tmp_path / "missing" / "map.snap")
+    assert excinfo.value.__context__ is None  # not masked by the cleanup
+
+
+def test_open_mmap_rejects_other_files(tmp_path):
+    path = tmp_path / "not.snap"
+    path.write_bytes(b"definitely not a snapshot header")
+    with pytest.raises(ValueError):
+        HashMap.open_mmap(path)
+
+
+def test_save_empty_map_and_overwrite(tmp_path):
+    path = tmp_path / "map.snap"
+    HashMap().save(path)
+    with HashMap.open_mmap(path) as mapped:
+        assert len(mapped) == 0 and "x" not in mapped
+    hm = HashMap()
+    hm.set("x", 1)
+    hm.save(path)
+    with HashMap.open_mmap(path) as mapped:
+        assert mapped["x"] == 1
+
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_pickle_rehashes_in_a_new_interpreter(tmp_path, backend):
+    import pickle
+    import subprocess
+    import sys
+
+    hm = HashMap(initial_capacity=16, backend=backend, min_load_factor=0.1)
+    for i in range(50):
+        hm.set(f"key{i}", i)
+    path = tmp_path / "map.pkl"
+    path.write_bytes(pickle.dumps(hm))
+
+    clone = pickle.loads(path.read_bytes())
+    assert type(clone) is type(hm) and clone._min_capacity == 16
+    assert dict(clone.items()) == dict(hm.items())
+
+    # str hashes are salted per process, so a table of stale hashes would miss
+    script = (
+        "import pickle, sys; from mlsys.data_structures.hashmap import HashMap;"
+        f"hm = pickle.load(open({str(path)!r}, 'rb'));"
+        "sys.exit(0 if all(hm.get(f'key{i}') == i for i in range(50)) else 1)"
+    )
+    env = {"PYTHONHASHSEED": "random", "PYTHONPATH": ":".join(sys.path)}
+    assert subprocess.run([sys.executable, "-c", script], env=env).returncode == 0
+
+
+# ----------------------------
+# Introspection (stats / repr)
+# ----------------------------
+
+def test_stats_chained_histogram_counts_buckets():
+    hm = HashMap(initial_capacity=8)
+    for i in range(3):
+        hm.set(ConstantHashKey(i), i)
+    hm.set(2, "two")  # 12345 % 8 == 1, so bucket 2 is its own
+
+    s = hm.stats()
+    assert (s.size, s.capacity) == (4, 8)
+    assert s.load_factor == 0.5
+    assert s.histogram == {0: 6, 1: 1, 3: 1}
+    assert s.max_chain == 3
+    assert s.mean_chain == 2.0
+    # counters are off by default
+    assert s.resizes is s.resize_seconds is s.comparisons_per_lookup is None
+
+
+def test_stats_open_histogram_counts_probe_lengths():
+    hm = HashMap(initial_capacity=16, backend="open")
+    for i in range(3):
+        hm.set(ConstantHashKey(i), i)
+
+    s = hm.stats()
+    assert s.histogram == {1: 1, 2: 1, 3: 1}
+    assert s.max_chain == 3
+    assert s.mean_chain == 2.0
+
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_tracked_stats_count_resizes_and_comparisons(backend):
+    hm = HashMap(initial_capacity=4, backend=backend, track_stats=True)
+    keys = [ConstantHashKey(i) for i in range(4)]
+    for i, k in enumerate(keys):
+        hm.set(k, i)
+    s = hm.stats()
+    assert s.resizes >= 1
+    assert s.resize_seconds >= 0.0
+    assert s.comparisons_per_lookup == 0.0
+
+    # one chain of 4: hits cost 1..4 comparisons, a miss costs all 4
+    for k in keys:
+        assert hm.get(k) == k.value
+    assert ConstantHashKey(99) not in hm
+    assert hm.get(ConstantHashKey(99), None) is None
+    assert hm.stats().comparisons_per_lookup == (1 + 2 + 3 + 4 + 4 + 4) / 6
+
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_tracked_lookups_hash_and_compare_once(backend):
+    class CountingKey(ConstantHashKey):
+        calls = 0
+
+        def __hash__(self):
+            CountingKey.calls += 1
+            return 12345
+
+        def __eq__(self, other):
+            CountingKey.calls += 1
+            return super().__eq__(other)
+
+    hm = HashMap(backend=backend, track_stats=True)
+    hm.set(CountingKey("a"), 1)
+    CountingKey.calls = 0
+    assert hm.get(CountingKey("a")) == 1
+    assert CountingKey("a") in hm
+    assert hm.get(CountingKey("b"), None) is None
+    # one hash per lookup, plus one __eq__ against "a" for each
+    assert CountingKey.calls == 6
+    assert hm.stats().comparisons_per_lookup == 1.0
+
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_track_stats_is_keyword_only_and_selects_the_tracked_class(backend):
+    assert type(HashMap(backend=backend, track_stats=True)).__name__.startswith("_Tracked")
+    assert not type(HashMap(backend=backend)).__name__.startswith("_Tracked")
+    with pytest.raises(TypeError):
+        HashMap(8, 0.75, backend, False, None, True)
+
+
+def test_tracked_incremental_resize_counts_each_resize_once():
+    hm = HashMap(initial_capacity=4, incremental_resize=True, track_stats=True)
+    for i in range(100):
+        hm.set(i, i)
+    # 4 -> 8 -> ... -> 256
+    assert hm.stats().resizes == 6
+    assert sorted(hm.items()) == [(i, i) for i in range(100)]
+
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_tracked_map_round_trips_through_pickle(backend):
+    import pickle
+
+    hm = HashMap(backend=backend, track_stats=True)
+    hm.set("a", 1)
+    clone = pickle.loads(pickle.dumps(hm))
+    assert type(clone) is type(hm)
+    assert clone.get("a") == 1
+    assert clone.stats().comparisons_per_lookup == 1.0
+
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_repr_truncates_large_maps(backend):
+    hm = HashMap(backend=backend)
+    for i in range(10_000):
+        hm.set(i, i)
+
+    s = repr(hm)
+    assert "size=10000" in s
+    assert s.endswith("...})")
+    assert len(s) < 200
+
+    small = HashMap(backend=backend)
+    small.set("a", 1)
+    assert "{'a': 1}" in repr(small)
+
+
+# ----------------------------
+# Hash mixing
+# ----------------------------
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_mixer_spreads_strided_int_keys(backend):
+    keys = [i * 1024 for i in range(2_000)]
+    plain = HashMap(backend=backend)
+    mixed = HashMap(backend=backend, hash_mixer="fibonacci")
+    for k in keys:
+        plain.set(k, k)
+        mixed.set(k, k)
+
+    # identical table sizes, but raw ints sharing low zero bits pile up
+    assert plain.stats().capacity == mixed.stats().capacity
+    assert plain.stats().max_chain > 100
+    assert mixed.stats().max_chain < 10
+    assert all(mixed.get(k) == k for k in keys)
+
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+@pytest.mark.parametrize("mixer", ["fibonacci", "splitmix"])
+def test_mixed_random_operations_match_dict(backend, mixer):
+    import random
+
+    rng = random.Random(1)
+    hm = HashMap(initial_capacity=5, backend=backend, hash_mixer=mixer, hash_seed=rng.getrandbits(64), min_load_factor=0.1)
+    ref = {}
+    for _ in range(5_000):
+        k = rng.choice([rng.randrange(-500, 500) * 64, f"s{rng.randrange(200)}"])
+        if rng.random() < 0.6:
+            hm.set(k, k)
+            ref[k] = k
+        elif k in ref:
+            hm.delete(k)
+            del ref[k]
+        assert hm.get(k, None) == ref.get(k)
+    assert len(hm) == len(ref)
+    assert sorted(hm.items(), key=repr) == sorted(ref.items(), key=repr)
+
+
+def test_mixed_chained_table_is_power_of_two_and_incremental_resize_works():
+    hm = HashMap(initial_capacity=10, hash_mixer="splitmix", incremental_resize=True)
+    assert hm.stats().capacity == 16
+    for i in range(1_000):
+        hm.set(i << 20, i)
+    assert all(hm.get(i << 20) == i for i in range(1_000))
+
+
+def test_hash_seed_changes_layout_per_instance():
+    a = HashMap(hash_mixer="splitmix", hash_seed=1)
+    b = HashMap(hash_mixer="splitmix", hash_seed=2)
+    assert [a._bucket_index(i) for i in range(64)] != [b._bucket_index(i) for i in range(64)]
+
+
+def test_hash_mixer_validation():
+    with pytest.raises(ValueError):
+        HashMap(hash_mixer="md5")
+    with pytest.raises(ValueError):
+        HashMap(hash_seed=3)
+
+
+@pytest.mark.parametrize("backend", ["chained", "open"])
+def test_mixer_and_seed_survive_pickle(backend):
+    import pickle
+
+    hm = HashMap(backend=backend, hash_mixer="fibonacci", hash_seed=7)
+    hm.update((i * 64, i) for i in range(100))
+    clone = pickle.loads(pickle.dumps(hm))
+    assert (clone._mixer_name, clone._seed) == ("fibonacci", 7)
+    assert sorted(clone.items()) == sorted(hm.items())
@@ -0,0 +1,103 @@
+# tests/test_heap.py
+import heapq
+import random
+
+import pytest
+
+from mlsys.data_structures.heap import IndexedHeap
+
+
+def assert_heap_invariant(h):
+    d = h._d
+    for i in range(1, len(h._keys)):
+        assert not h._before(h._prios[i], h._prios[(i - 1) // d])
+    assert {k: i for i, k in enumerate(h._keys)} == h._pos
+
+
+def drain(h):
+    out = []
+    while h:
+        out.append(h.pop())
+    return out
+
+
+def test_empty_heap_errors():
+    h = IndexedHeap()
+    assert len(h) == 0
+    with pytest.raises(IndexError):
+        h.pop()
+    with pytest.raises(IndexError):
+        h.peek()
+    with pytest.raises(IndexError):
+        h.replace("a", 1)
+    with pytest.raises(KeyError):
+        h.remove("a")
+    with pytest.raises(KeyError):
+        h.update_priority("a", 1)
+    with pytest.raises(ValueError):
+        IndexedHeap(d=1)
+
+
+def test_push_pop_peek_order_min_and_max():
+    pairs = [("a", 5), ("b", 1), ("c", 3), ("d", 4), ("e", 2)]
+    h = IndexedHeap()
+    for k, p in pairs:
+        h.push(k, p)
+    assert h.peek() == "b" and h.peek_priority() == 1
+    assert [k for k, _ in drain(h)] == ["b", "e", "c", "d", "a"]
+
+    hmax = IndexedHeap(pairs, max_heap=True)
+    assert [p for _, p in drain(hmax)] == [5, 4, 3, 2, 1]
+
+    with pytest.raises(ValueError):
+        IndexedHeap([("a", 1), ("a", 2)])
+    h.push("x", 1)
+    with pytest.raises(ValueError):
+        h.push("x", 2)
+
+
+def test_update_priority_and_remove():
+    h = IndexedHeap([(k, i) for i, k in enumerate("abcdefgh")], d=3)
+    h.update_priority("h", -1)   # decrease-key moves to the top
+    h.update_priority("a", 100)  # increase-key sinks
+    assert h.remove("d") == 3
+    assert "d" not in h
+    assert h.priority("a") == 100
+    assert_heap_invariant(h)
+    assert [k for k, _ in drain(h)] == ["h", "b", "c", "e", "f", "g", "a"]
+
+
+def test_pushpop_and_replace_match_heapq():
+    h = IndexedHeap([(i, i) for i in (5, 7, 9)])
+    assert h.pushpop(1, 1) == (1, 1)     # better than the top: returned directly
+    assert h.pushpop(8, 8) == (5, 5)
+    assert h.replace(2, 2) == (7, 7)     # pops first, even if the new item is better
+    assert h.replace(2, 10) == (2, 2)    # the popped key may be pushed back
+    assert drain(h) == [(8, 8), (9, 9), (2, 10)]
+
+
+@pytest.mark.parametrize("d", [2, 4, 8])
+def test_random_operations_match_reference(d):
+    rng = random.Random(d)
+    h = IndexedHeap(((i, rng.random()) for i in range(200)), d=d)
+    ref = {i: h.priority(i) for i in range(200)}
+    next_key = 200
+    for _ in range(5_000):
+        r = rng.random()
+        if r < 0.3:
+            h.push(next_key, rng.random())
+            ref[next_key] = h.priority(next_key)
+            next_key += 1
+        elif r < 0.6 and ref:
+            k = rng.choice(list(ref))
+            ref[k] = rng.random()
+            h.update_priority(k, ref[k])
+        elif r < 0.8 and ref:
+            k = rng.choice(list(ref))
+            assert h.remove(k) == ref.pop(k)
+        elif ref:
+            k, p = h.pop()
+            assert p == min(ref.values())
+            assert ref.pop(k) == p
+    assert_heap_invariant(h)
+    assert [p for _, p in drain(h)] == heapq.nsmallest(len(ref), ref.values())
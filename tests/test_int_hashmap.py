@@ -0,0 +1,84 @@
+# tests/test_int_hashmap.py
+import numpy as np
+import pytest
+
+from mlsys.data_structures.int_hashmap import IntHashMap
+
+
+def test_scalar_api_matches_hashmap_semantics():
+    m = IntHashMap()
+    assert len(m) == 0
+    assert (3 in m) is False
+    assert m.get(3, default=0) == 0
+    with pytest.raises(KeyError):
+        m.get(3)
+    with pytest.raises(KeyError):
+        m.delete(3)
+
+    m.set(3, 30)
+    m.set(-7, 70)
+    m.set(3, 31)
+    assert len(m) == 2
+    assert m.get(3) == 31
+    assert m.get(-7) == 70
+
+    m.delete(3)
+    assert 3 not in m
+    assert sorted(m.items()) == [(-7, 70)]
+
+
+def test_batched_ops_match_dict():
+    rng = np.random.default_rng(0)
+    m = IntHashMap()
+    d = {}
+    for _ in range(20):
+        keys = rng.integers(-5_000, 5_000, size=1_000)
+        values = rng.integers(0, 1 << 40, size=1_000)
+        m.set_many(keys, values)
+        d.update(zip(keys.tolist(), values.tolist(), strict=True))  # last write wins
+
+        present = np.fromiter(d.keys(), dtype=np.int64)
+        drop = np.unique(rng.choice(present, size=200))
+        m.delete_many(drop)
+        for k in drop.tolist():
+            del d[k]
+        assert len(m) == len(d)
+
+    probe = rng.integers(-6_000, 6_000, size=5_000)
+    expected = np.array([d.get(k, -1) for k in probe.tolist()])
+    np.testing.assert_array_equal(m.get_many(probe, default=-1), expected)
+    np.testing.assert_array_equal(m.contains_many(probe), expected != -1)
+    assert sorted(m.keys().tolist()) == sorted(d)
+
+
+def test_get_many_missing_without_default_raises():
+    m = IntHashMap()
+    m.set_many([1, 2], [10, 20])
+    np.testing.assert_array_equal(m.get_many([2, 1]), [20, 10])
+    with pytest.raises(KeyError):
+        m.get_many([1, 99])
+
+
+def test_delete_many_is_all_or_nothing():
+    m = IntHashMap()
+    m.set_many([1, 2, 3], 0)
+    with pytest.raises(KeyError):
+        m.delete_many([1, 42])
+    assert len(m) == 3
+    assert 1 in m
+
+
+def test_float_values_and_extreme_keys():
+    m = IntHashMap(value_dtype=np.float64)
+    keys = np.array([np.iinfo(np.int64).min, -1, 0, np.iinfo(np.int64).max])
+    m.set_many(keys, [0.5, 1.5, 2.5, 3.5])
+    np.testing.assert_array_equal(m.get_many(keys[::-1]), [3.5, 2.5, 1.5, 0.5])
+
+
+def test_strided_keys_grow_table():
+    m = IntHashMap()
+    keys = np.arange(0, 64 * 50_000, 64)
+    m.set_many(keys, keys // 64)
+    assert len(m) == 50_000
+    assert m._capacity * m._load_factor >= 50_000
+    np.testing.assert_array_equal(m.get_many(keys[::7]), keys[::7] // 64)
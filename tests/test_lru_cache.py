@@ -1,7 +1,10 @@
 # tests/test_lru_cache.py
+import random
+
 import pytest
 
-from mlsys.data_structures.lru_cache import LRUCache
+from mlsys.data_structures.lru_cache import CompactLRUCache, LRUCache
+
 # ----------------------------
 # Helpers
 # ----------------------------
@@ -315,3 +318,233 @@ def test_repr_optional_smoke_if_implemented():
         s = repr(c)
         assert isinstance(s, str)
         assert ("LRU" in s) or ("a" in s)
+
+
+# ----------------------------
+# O(1) engine internals
+# ----------------------------
+
+def test_get_tail_is_mru_node_or_head_when_empty():
+    c = LRUCache(2)
+    assert c.get_tail() is c.head
+
+    c.put("a", 1)
+    c.put("b", 2)
+    assert c.get_tail()._key == "b"
+
+    c.get("a")
+    assert c.get_tail()._key == "a"
+
+
+def test_many_evictions_keep_index_and_list_in_sync():
+    c = LRUCache(100)
+    for i in range(10_000):
+        c.put(i, i * 2)
+
+    assert len(c) == 100
+    assert c.keys() == list(range(9_900, 10_000))
+    assert 9_899 not in c
+    assert c.get(9_950) == 19_900
+
+
+# ----------------------------
+# Compact array-backed variant
+# ----------------------------
+
+def test_compact_cache_matches_lru_semantics():
+    with pytest.raises(ValueError):
+        CompactLRUCache(0)
+
+    c = CompactLRUCache(3)
+    assert c.get("missing", default=None) is None
+    with pytest.raises(KeyError):
+        c.get("missing")
+    with pytest.raises(KeyError):
+        c.delete("missing")
+
+    c.put("a", 1)
+    c.put("b", 2)
+    c.put("c", 3)
+    c.get("a")
+    c.put("d", 4)  # evicts b
+    assert_lru_to_mru(c, [("c", 3), ("a", 1), ("d", 4)])
+
+    c.delete("a")
+    c.put("e", 5)  # reuses the freed slot, no eviction
+    assert_lru_to_mru(c, [("c", 3), ("d", 4), ("e", 5)])
+
+    c.clear()
+    assert len(c) == 0 and c.items() == []
+    c.put(WeirdKey(1), "one")
+    assert c.get(WeirdKey(1)) == "one"
+
+
+def test_compact_cache_random_operations_match_lru_cache():
+    rng = random.Random(3)
+    ref, c = LRUCache(50), CompactLRUCache(50)
+    for _ in range(20_000):
+        k = rng.randrange(120)
+        r = rng.random()
+        if r < 0.5:
+            ref.put(k, r)
+            c.put(k, r)
+        elif r < 0.8:
+            assert c.get(k, default=None) == ref.get(k, default=None)
+        elif k in ref:
+            ref.delete(k)
+            c.delete(k)
+        assert len(c) == len(ref)
+    assert c.items() == ref.items()
+
+
+# ----------------------------
+# TTL expiration
+# ----------------------------
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_entries_expire_and_are_never_returned_stale():
+    clock = FakeClock()
+    c = LRUCache(10, clock=clock)
+    c.put("a", 1, ttl=5)
+    c.put("b", 2, ttl=10)
+    c.put("c", 3)  # no expiry
+
+    clock.now = 4.9
+    assert c.get("a") == 1
+    clock.now = 5
+    assert c.get("a", default=None) is None
+    assert "a" not in c
+    assert len(c) == 2
+
+    clock.now = 100
+    assert_lru_to_mru(c, [("c", 3)])
+    assert len(c._expiry) == 0
+
+
+def test_default_ttl_overwrite_resets_and_none_clears_ttl():
+    clock = FakeClock()
+    c = LRUCache(10, default_ttl=5, clock=clock)
+    c.put("a", 1)
+    c.put("b", 2)
+    c.put("keep", 0, ttl=None)
+
+    clock.now = 3
+    c.put("a", 10)  # overwrite restarts the default TTL
+    c.put("b", 20, ttl=None)  # and an explicit None removes it
+
+    clock.now = 7
+    assert c.get("a") == 10
+    assert c.get("b") == 20
+    clock.now = 8
+    assert "a" not in c
+    assert sorted(c.keys()) == ["b", "keep"]
+
+
+def test_ttl_bookkeeping_follows_evictions_and_deletes():
+    clock = FakeClock()
+    c = LRUCache(2, default_ttl=10, clock=clock)
+    c.put("a", 1)
+    c.put("b", 2)
+    c.put("c", 3)  # evicts a, which must leave the expiry heap too
+    c.delete("b")
+    assert "a" not in c._expiry and "b" not in c._expiry
+
+    c.put("a", 4)  # re-inserted key gets a fresh deadline
+    clock.now = 10
+    assert len(c) == 0
+
+    c.put("x", 1)
+    c.clear()
+    clock.now = 100
+    assert len(c) == 0
+
+    with pytest.raises(ValueError):
+        c.put("x", 1, ttl=0)
+    with pytest.raises(ValueError):
+        LRUCache(2, default_ttl=-1)
+
+
+# ----------------------------
+# Weighted (byte-budgeted) mode
+# ----------------------------
+
+def test_weighted_eviction_pops_lru_until_entry_fits():
+    np = pytest.importorskip("numpy")
+    c = LRUCache(100, max_weight=1_000)
+    c.put("a", np.zeros(300, dtype=np.uint8))
+    c.put("b", np.zeros(300, dtype=np.uint8))
+    c.put("c", np.zeros(300, dtype=np.uint8))
+    assert c.current_weight == 900
+
+    c.get("a")  # b becomes LRU
+    c.put("d", np.zeros(500, dtype=np.uint8))  # needs 400 more: evicts b and c
+    assert c.keys() == ["a", "d"]
+    assert c.current_weight == 800
+
+    # overwriting with a heavier value evicts others, never the entry itself
+    c.put("a", np.zeros(900, dtype=np.uint8))
+    assert c.keys() == ["a"]
+    assert c.current_weight == 900
+
+
+def test_weighted_rejects_oversized_entries_and_tracks_deletes():
+    c = LRUCache(10, max_weight=10, weigher=len)
+    c.put("a", "xxxx")
+    with pytest.raises(ValueError):
+        c.put("big", "x" * 11)
+    assert "big" not in c
+    assert c.current_weight == 4
+
+    c.put("b", "yyyyyy")
+    c.delete("a")
+    assert c.current_weight == 6
+    c.clear()
+    assert c.current_weight == 0
+
+
+def test_weighted_count_capacity_still_applies_and_ttl_releases_weight():
+    clock = FakeClock()
+    c = LRUCache(2, max_weight=100, weigher=lambda v: v, clock=clock)
+    c.put("a", 10)
+    c.put("b", 10)
+    c.put("c", 10)  # count cap evicts a
+    assert c.keys() == ["b", "c"] and c.current_weight == 20
+
+    c.put("d", 30, ttl=1)  # count cap evicts b
+    clock.now = 1
+    assert c.current_weight == 10
+    assert c.keys() == ["c"]
+
+
+# ----------------------------
+# Eviction callback
+# ----------------------------
+
+def test_on_evict_sees_capacity_and_weight_evictions_only():
+    clock = FakeClock()
+    evicted = []
+    c = LRUCache(2, max_weight=10, weigher=lambda v: v, clock=clock, on_evict=lambda k, v: evicted.append((k, v)))
+    c.put("a", 1)
+    c.put("b", 2)
+    c.put("c", 3)  # count cap
+    assert evicted == [("a", 1)]
+    c.put("d", 8)  # weight cap pushes out b and c
+    assert evicted == [("a", 1), ("b", 2), ("c", 3)]
+    assert "d" in c
+
+    # overwrite, delete, expiry and clear are not evictions
+    c.put("d", 7)
+    c.put("e", 1, ttl=1)
+    c.delete("d")
+    clock.now = 2
+    assert "e" not in c
+    c.put("f", 1)
+    c.clear()
+    assert evicted == [("a", 1), ("b", 2), ("c", 3)]
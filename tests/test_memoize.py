@@ -0,0 +1,188 @@
+# tests/test_memoize.py
+import pytest
+
+from mlsys.data_structures.memoize import CacheInfo, lru_memoize
+
+
+def test_hits_misses_and_evictions():
+    calls = []
+
+    @lru_memoize(maxsize=2)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert [square(1), square(2), square(1)] == [1, 4, 1]
+    assert calls == [1, 2]
+    square(3)  # evicts 2, the least recently used
+    square(2)
+    assert calls == [1, 2, 3, 2]
+    assert square.cache_info() == CacheInfo(hits=1, misses=4, evictions=2, maxsize=2, currsize=2)
+
+
+def test_cache_clear_resets_entries_and_stats():
+    @lru_memoize(maxsize=4)
+    def ident(x):
+        return x
+
+    ident(1)
+    ident(1)
+    ident.cache_clear()
+    assert ident.cache_info() == CacheInfo(0, 0, 0, 4, 0)
+
+
+def test_maxsize_none_is_unbounded_and_zero_caches_nothing():
+    calls = []
+
+    @lru_memoize(maxsize=None)
+    def unbounded(x):
+        calls.append(x)
+        return x
+
+    for _ in range(2):
+        for i in range(1_000):
+            unbounded(i)
+    assert calls == list(range(1_000))
+    assert unbounded.cache_info() == CacheInfo(1_000, 1_000, 0, None, 1_000)
+
+    @lru_memoize(maxsize=0)
+    def uncached(x):
+        calls.append(x)
+        return x
+
+    calls.clear()
+    assert [uncached(1), uncached(1)] == [1, 1]
+    assert calls == [1, 1]
+    assert uncached.cache_info() == CacheInfo(0, 2, 0, 0, 0)
+    uncached.cache_clear()
+    assert lru_memoize(maxsize=-1)(len).cache_info().maxsize == 0
+
+
+def test_keyword_and_positional_keys_are_distinct_and_flattened():
+    calls = []
+
+    @lru_memoize(maxsize=8)
+    def f(a, b=0):
+        calls.append((a, b))
+        return a
+
+    f(1, 2)
+    f(1, b=2)
+    f(1, b=2)
+    f((1, 2))  # a single tuple argument must not collide with two arguments
+    assert calls == [(1, 2), (1, 2), ((1, 2), 0)]
+
+
+def test_typed_keys():
+    @lru_memoize(maxsize=8, typed=True)
+    def kind(x):
+        return type(x).__name__
+
+    assert kind(1) == "int"
+    assert kind(1.0) == "float"
+    assert kind.cache_info().misses == 2
+
+    @lru_memoize(maxsize=8)
+    def untyped(x):
+        return type(x).__name__
+
+    untyped((1,))
+    assert untyped((1.0,)) == "tuple"
+    assert untyped.cache_info().hits == 1  # (1,) == (1.0,), so untyped keys collide
+
+
+def test_custom_key_function():
+    @lru_memoize(maxsize=8, key=lambda path, verbose=False: path)
+    def load(path, verbose=False):
+        return path.upper()
+
+    load("a")
+    load("a", verbose=True)
+    assert load.cache_info().hits == 1
+
+
+def test_bare_decorator_and_metadata():
+    @lru_memoize
+    def documented(x):
+        """Docs."""
+        return x
+
+    assert documented(3) == 3
+    assert documented.__name__ == "documented"
+    assert documented.__doc__ == "Docs."
+    assert documented.cache_info().maxsize == 128
+
+
+def test_methods_get_per_instance_caches():
+    class Model:
+        def __init__(self, scale):
+            self.scale = scale
+            self.calls = 0
+
+        @lru_memoize(maxsize=2)
+        def forward(self, x):
+            self.calls += 1
+            return x * self.scale
+
+    a, b = Model(2), Model(3)
+    assert a.forward(5) == 10
+    assert b.forward(5) == 15
+    assert a.forward(5) == 10
+    assert (a.calls, b.calls) == (1, 1)
+    assert a.forward.cache_info() == CacheInfo(1, 1, 0, 2, 1)
+    assert b.forward.cache_info() == CacheInfo(0, 1, 0, 2, 1)
+    assert a.forward is a.forward
+    assert Model.forward.cache_info().currsize == 0
+    a.forward.cache_clear()
+    assert b.forward.cache_info().currsize == 1
+
+
+def test_methods_on_slotted_classes_share_a_cache():
+    class Point:
+        __slots__ = ("x",)
+
+        def __init__(self, x):
+            self.x = x
+
+        def __hash__(self):
+            return hash(self.x)
+
+        def __eq__(self, other):
+            return self.x == other.x
+
+        @lru_memoize(maxsize=4)
+        def norm(self):
+            return abs(self.x)
+
+    assert Point(-2).norm() == 2
+    assert Point(-2).norm() == 2
+    assert Point.norm.cache_info().hits == 1
+
+
+def test_weighted_results():
+    @lru_memoize(maxsize=100, max_weight=10, weigher=len)
+    def blob(n):
+        return b"x" * n
+
+    blob(4)
+    blob(4)
+    blob(8)  # evicts the 4-byte result
+    assert blob.cache_info().evictions == 1
+    assert blob(20) == b"x" * 20  # heavier than the budget: returned, not cached
+    assert blob.cache_info().currsize == 1
+
+
+def test_exceptions_are_not_cached():
+    calls = []
+
+    @lru_memoize(maxsize=4)
+    def flaky(x):
+        calls.append(x)
+        if len(calls) == 1:
+            raise RuntimeError
+        return x
+
+    with pytest.raises(RuntimeError):
+        flaky(1)
+    assert flaky(1) == 1
+    assert calls == [1, 1]
@@ -0,0 +1,108 @@
+# tests/test_prefix_cache.py
+import random
+
+import pytest
+
+from mlsys.data_structures.prefix_cache import PrefixCache
+
+
+def blocks_in_tree(cache):
+    count, stack = 0, [cache._root]
+    while stack:
+        node = stack.pop()
+        count += len(node.blocks)
+        for key, child in node.children.items():
+            assert child.parent is node and child.tokens[: cache._block_size] == key and child.blocks
+            stack.append(child)
+    return count
+
+
+def test_match_returns_longest_full_block_prefix():
+    cache = PrefixCache(block_size=2, max_blocks=16)
+    assert cache.insert([1, 2, 3, 4, 5, 6, 7], [10, 11, 12]) == []
+    assert cache.match([1, 2, 3, 4, 5, 6]) == [10, 11, 12]
+    assert cache.match([1, 2, 3, 4, 9, 9]) == [10, 11]
+    assert cache.match([1, 2, 3]) == [10]
+    assert cache.match([2, 1]) == []
+    assert len(cache) == 3
+
+
+def test_insert_shares_prefixes_and_returns_duplicate_ids():
+    cache = PrefixCache(block_size=2, max_blocks=16)
+    cache.insert([1, 2, 3, 4, 5, 6], [10, 11, 12])
+    # diverges inside the first node: it is split after two blocks
+    assert cache.insert([1, 2, 3, 4, 7, 8], [20, 21, 22]) == [20, 21]
+    assert cache.match([1, 2, 3, 4, 7, 8]) == [10, 11, 22]
+    assert cache.match([1, 2, 3, 4, 5, 6]) == [10, 11, 12]
+    assert len(cache) == 4 == blocks_in_tree(cache)
+    # re-inserting cached blocks with the same ids frees nothing
+    assert cache.insert([1, 2, 3, 4], [10, 11]) == []
+    with pytest.raises(ValueError):
+        cache.insert([1, 2, 3, 4], [10])
+
+
+def test_lru_eviction_takes_leaf_tails_first():
+    cache = PrefixCache(block_size=1, max_blocks=5)
+    cache.insert([0, 1, 2], [0, 1, 2])  # shared prefix 0, then leaf 1, 2
+    cache.insert([0, 5, 6], [0, 5, 6])
+    cache.match([0, 1, 2])  # the 0-1-2 branch is now most recent
+    assert cache.insert([7], [7]) == [6]
+    assert cache.match([0, 5, 6]) == [0, 5]
+    assert cache.insert([8, 9], [8, 9]) == [2, 1]  # the 1-2 leaf is now the LRU one
+    assert cache.match([0, 1, 2]) == [0]
+    assert cache.match([0, 5]) == [0, 5]
+    assert len(cache) == 5 == blocks_in_tree(cache)
+
+
+def test_pinned_blocks_are_never_evicted():
+    cache = PrefixCache(block_size=1, max_blocks=3)
+    cache.insert([1, 2, 3], [1, 2, 3])
+    assert cache.acquire([1, 2, 9]) == [1, 2]  # splits so only 1, 2 are pinned
+    assert cache.evictable_blocks == 1
+    assert cache.insert([4, 5], [4, 5]) == [3, 5]  # 3 evicted, 5 does not fit
+    assert cache.evict(10) == [4]  # the new leaf is not pinned
+    assert cache.evict(10) == []
+    cache.release([1, 2])
+    assert cache.evictable_blocks == 2
+    assert cache.evict(10) == [2, 1]
+    assert len(cache) == 0
+    with pytest.raises(ValueError):
+        cache.release([1])
+
+
+def test_nested_acquires_and_split_while_pinned():
+    cache = PrefixCache(block_size=1, max_blocks=8)
+    cache.insert([1, 2, 3, 4], [1, 2, 3, 4])
+    cache.acquire([1, 2, 3, 4])
+    cache.acquire([1, 2, 3, 4])
+    cache.insert([1, 2, 7], [1, 2, 7])  # splits a pinned node
+    cache.release([1, 2, 3, 4])
+    assert cache.evict(10) == [7]
+    cache.release([1, 2, 3, 4])
+    assert sorted(cache.evict(10)) == [1, 2, 3, 4]
+
+
+def test_random_workload_keeps_budget_and_tree_consistent():
+    rng = random.Random(0)
+    cache = PrefixCache(block_size=4, max_blocks=40)
+    prompts = [[rng.randrange(50) for _ in range(rng.randrange(4, 40))] for _ in range(8)]
+    next_id, live, pinned = 0, set(), []
+    for _ in range(2_000):
+        tokens = rng.choice(prompts) + [rng.randrange(50) for _ in range(rng.randrange(0, 16))]
+        op = rng.random()
+        if op < 0.2 and pinned:
+            cache.release(pinned.pop(rng.randrange(len(pinned))))
+        elif op < 0.4:
+            blocks = cache.acquire(tokens)
+            pinned.append(tokens[: len(blocks) * 4])
+        else:
+            cached = cache.match(tokens)
+            n = len(tokens) // 4
+            ids = cached + list(range(next_id, next_id + n - len(cached)))
+            next_id += n - len(cached)
+            freed = cache.insert(tokens, ids)
+            live |= set(ids)
+            live -= set(freed)
+        assert len(cache) <= 40
+        assert len(cache) == blocks_in_tree(cache)
+    assert len(live) == len(cache)
@@ -0,0 +1,103 @@
+# tests/test_sharded_lru_cache.py
+import random
+import threading
+
+import pytest
+
+from mlsys.data_structures.sharded_lru_cache import ShardedLRUCache
+
+
+def run_threads(n, target):
+    errors = []
+
+    def wrapped(i):
+        try:
+            target(i)
+        except Exception as e:  # surfaced in the main thread below
+            errors.append(e)
+
+    threads = [threading.Thread(target=wrapped, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+
+
+def assert_shards_consistent(cache):
+    for shard in cache._shards:
+        walked = shard.keys()
+        assert len(walked) == len(shard) <= shard._capacity
+        assert set(walked) == set(shard._map)
+        node = shard.head
+        while node._next is not None:
+            assert node._next._prev is node
+            node = node._next
+        assert node is shard.tail
+
+
+def test_capacity_and_shards_must_be_positive():
+    with pytest.raises(ValueError):
+        ShardedLRUCache(0)
+    with pytest.raises(ValueError):
+        ShardedLRUCache(10, num_shards=0)
+
+
+def test_basic_api_and_approximate_capacity():
+    c = ShardedLRUCache(64, num_shards=4)
+    assert c.get("x", default=None) is None
+    with pytest.raises(KeyError):
+        c.get("x")
+    with pytest.raises(KeyError):
+        c.delete("x")
+
+    c.put("a", 1)
+    assert "a" in c and c.get("a") == 1
+    c.delete("a")
+    assert "a" not in c
+
+    for i in range(1_000):
+        c.put(i * 64, i)  # strided keys must still spread over every shard
+    assert len(c) == 64
+    assert all(len(shard) == 16 for shard in c._shards)
+
+    c.clear()
+    assert len(c) == 0 and c.items() == []
+
+
+def test_concurrent_mixed_operations_keep_shards_consistent():
+    c = ShardedLRUCache(200, num_shards=8)
+
+    def worker(seed):
+        rng = random.Random(seed)
+        for _ in range(5_000):
+            k = rng.randrange(500)
+            r = rng.random()
+            if r < 0.5:
+                c.put(k, (k, seed))
+            elif r < 0.9:
+                v = c.get(k, default=None)
+                assert v is None or v[0] == k
+            else:
+                try:
+                    c.delete(k)
+                except KeyError:
+                    pass
+
+    run_threads(16, worker)
+    assert len(c) <= 200
+    assert_shards_consistent(c)
+
+
+def test_get_or_put_calls_factory_once_per_key():
+    c = ShardedLRUCache(1_000, num_shards=4)
+    calls = []
+    barrier = threading.Barrier(16)
+
+    def worker(_):
+        barrier.wait()
+        for k in range(100):
+            assert c.get_or_put(k, lambda k=k: calls.append(k) or k * 10) == k * 10
+
+    run_threads(16, worker)
+    assert sorted(calls) == list(range(100))
@@ -0,0 +1,148 @@
+# tests/test_shared_memory_cache.py
+import multiprocessing
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from mlsys.data_structures.shared_memory_cache import SharedMemoryCache
+
+
+@pytest.fixture
+def cache():
+    c = SharedMemoryCache(capacity=64, key_size=32, value_size=128)
+    yield c
+    c.close()
+    c.unlink()
+
+
+def test_put_get_delete_and_overwrite(cache):
+    cache.put("a", {"x": 1})
+    cache.put(7, [1, 2, 3])
+    cache.put(b"raw", b"bytes")
+    assert cache.get("a") == {"x": 1}
+    assert cache.get(7) == [1, 2, 3]
+    assert cache.get(b"raw") == b"bytes"
+    assert "a" in cache and "b" not in cache and len(cache) == 3
+    cache.put("a", "new")
+    assert cache.get("a") == "new" and len(cache) == 3
+    cache.delete("a")
+    assert "a" not in cache and len(cache) == 2
+    assert cache.get("a", None) is None
+    with pytest.raises(KeyError):
+        cache.get("a")
+    with pytest.raises(KeyError):
+        cache.delete("a")
+    assert (cache.hits, cache.misses) == (4, 2)
+
+
+def test_tuple_keys_match_by_value_and_other_types_are_rejected(cache):
+    cache.put(("emb", "emb", 3), 1)
+    # equal but not identical elements: a pickled key would differ here
+    assert cache.get(("emb", "".join(["e", "mb"]), 3)) == 1
+    with pytest.raises(TypeError):
+        cache.put(frozenset({"a"}), 1)
+
+
+def test_oversized_entries_are_rejected(cache):
+    with pytest.raises(ValueError):
+        cache.put("k" * 40, 1)
+    with pytest.raises(ValueError):
+        cache.put("k", b"x" * 200)
+
+
+def test_clock_eviction_keeps_referenced_entries(cache):
+    for i in range(64):
+        cache.put(i, i)
+    for i in range(32):
+        cache.get(i)  # referenced: survive the next sweep
+    for i in range(64, 96):
+        cache.put(i, i)
+    assert len(cache) == 64
+    assert all(i in cache for i in range(32))
+    assert not any(i in cache for i in range(32, 64))
+
+
+def test_random_operations_match_dict_and_clear(cache):
+    rng = random.Random(0)
+    model = {}
+    for _ in range(5_000):
+        k = rng.randrange(48)  # below capacity, so nothing is evicted
+        op = rng.random()
+        if op < 0.5:
+            cache.put(k, k * 10)
+            model[k] = k * 10
+        elif op < 0.7 and k in model:
+            cache.delete(k)
+            del model[k]
+        else:
+            assert cache.get(k, None) == model.get(k)
+    assert len(cache) == len(model)
+    assert all(cache.get(k) == v for k, v in model.items())
+    cache.clear()
+    assert len(cache) == 0 and 1 not in cache
+    cache.put(1, 1)
+    assert cache.get(1) == 1
+
+
+def test_attach_by_name_shares_entries(cache):
+    other = SharedMemoryCache.attach(cache.name)
+    try:
+        cache.put("k", "v")
+        assert other.get("k") == "v"
+        other.delete("k")
+        assert "k" not in cache
+    finally:
+        other.close()
+
+
+def _worker(cache, worker_id):
+    for i in range(200):
+        cache.put((worker_id, i), i)
+    return sum(cache.get((other, i), 0) for other in range(4) for i in range(200))
+
+
+def test_workers_share_one_cache_across_processes():
+    cache = SharedMemoryCache(capacity=1024, key_size=48, value_size=32)
+    try:
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(4, mp_context=ctx) as pool:
+            list(pool.map(_worker, [cache] * 4, range(4)))
+        assert len(cache) == 800
+        assert all(cache.get((w, i)) == i for w in range(4) for i in range(200))
+    finally:
+        cache.close()
+        cache.unlink()
+
+
+def test_concurrent_readers_never_see_torn_values():
+    cache = SharedMemoryCache(capacity=32, key_size=16, value_size=256)
+    stop = threading.Event()
+    errors = []
+
+    def writer():
+        n = 0
+        while not stop.is_set():
+            n += 1
+            cache.put(n % 40, [n % 40] * 20)  # over capacity: evicts too
+
+    def reader():
+        for _ in range(20_000):
+            k = random.randrange(40)
+            v = cache.get(k, None)
+            if v is not None and v != [k] * 20:
+                errors.append((k, v))
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads[1:]:
+            t.join()
+        stop.set()
+        threads[0].join()
+        assert errors == []
+    finally:
+        cache.close()
+        cache.unlink()
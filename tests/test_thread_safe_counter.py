@@ -0,0 +1,71 @@
+# tests/test_thread_safe_counter.py
+import random
+import threading
+
+import pytest
+
+from mlsys.data_structures.thread_safe_counter import LockedCounter, ThreadSafeCounter
+
+MODES = ["striped", "locked"]
+
+
+def test_mode_selects_implementation():
+    assert type(ThreadSafeCounter()) is ThreadSafeCounter
+    assert type(ThreadSafeCounter(mode="locked")) is LockedCounter
+    with pytest.raises(ValueError):
+        ThreadSafeCounter(mode="atomic")
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_single_thread_semantics(mode):
+    c = ThreadSafeCounter(mode=mode)
+    assert c.value() == 0
+    c.increment()
+    c.increment(5)
+    c.increment(-2)
+    assert c.value() == 4
+    assert c.snapshot_and_reset() == 4
+    assert c.value() == 0
+    c.increment(3)
+    c.reset()
+    assert c.value() == 0
+    assert c.snapshot_and_reset() == 0
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_concurrent_increments_and_snapshots_lose_nothing(mode):
+    c = ThreadSafeCounter(mode=mode)
+    n_threads, per_thread = 16, 2_000
+    expected = []
+    done = threading.Event()
+    collected = []
+
+    def writer(seed):
+        rng = random.Random(seed)
+        total = 0
+        for _ in range(per_thread):
+            n = rng.randint(1, 5)
+            c.increment(n)
+            total += n
+        expected.append(total)
+
+    def reader():
+        # every increment must land in exactly one snapshot interval
+        while not done.is_set():
+            collected.append(c.snapshot_and_reset())
+            assert c.value() >= 0
+
+    r = threading.Thread(target=reader)
+    r.start()
+    writers = [threading.Thread(target=writer, args=(i,)) for i in range(n_threads)]
+    for t in writers:
+        t.start()
+    for t in writers:
+        t.join()
+    done.set()
+    r.join()
+
+    assert sum(collected) + c.value() == sum(expected)
+    if mode == "striped":
+        c.value()
+        assert c._cells == []  # cells of finished threads were folded in
@@ -0,0 +1,100 @@
+# tests/test_tiered_cache.py
+import os
+import random
+
+import pytest
+
+from mlsys.data_structures.tiered_cache import TieredCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = TieredCache(2, disk_max_bytes=1 << 20, directory=tmp_path, batch_size=2)
+    yield c
+    c.close()
+
+
+def test_evictions_spill_to_disk_and_promote_back(cache):
+    for i in range(6):
+        cache.put(i, f"v{i}")
+    cache.flush()
+    info = cache.info()
+    assert info.disk_entries == 4
+    assert len(cache) == 6 and all(i in cache for i in range(6))
+
+    assert cache.get(0) == "v0"  # promoted; its slot in memory pushes out key 4
+    info = cache.info()
+    assert (info.memory_hits, info.disk_hits, info.misses) == (0, 1, 0)
+    assert info.disk_entries == 3
+    assert cache.get(0) == "v0"
+    assert cache.info().memory_hits == 1
+    assert len(cache) == 6
+
+
+def test_buffered_entries_are_readable_before_the_write(tmp_path):
+    with TieredCache(1, disk_max_bytes=1 << 20, directory=tmp_path, batch_size=1_000, flush_interval=60) as c:
+        c.put("a", 1)
+        c.put("b", 2)  # "a" waits in the buffer: the batch is far from full
+        assert c.info().disk_entries == 0
+        assert c.get("a") == 1
+        assert c.info().buffer_hits == 1
+
+
+def test_put_and_delete_supersede_lower_tiers(cache):
+    for i in range(4):
+        cache.put(i, i)
+    cache.flush()
+    cache.put(0, "new")  # 0 was on disk; the old copy must not come back
+    cache.delete(1)
+    cache.flush()
+    assert cache.get(0) == "new"
+    assert 1 not in cache
+    with pytest.raises(KeyError):
+        cache.delete(1)
+    assert cache.get(1, None) is None
+    assert cache.info().misses == 1
+
+
+def test_disk_tier_evicts_oldest_writes_within_its_budget(tmp_path):
+    payload = b"x" * 1_000
+    with TieredCache(1, disk_max_bytes=3_500, directory=tmp_path, batch_size=1) as c:
+        for i in range(10):
+            c.put(i, payload)
+            c.flush()
+        info = c.info()
+        assert info.disk_entries == 3
+        assert info.disk_bytes <= 3_500
+        assert [i for i in range(10) if i in c] == [6, 7, 8, 9]
+        # evicted files are gone, not just unindexed
+        (subdir,) = os.listdir(tmp_path)
+        assert len(os.listdir(tmp_path / subdir)) == 3
+
+
+def test_close_removes_the_disk_tier(tmp_path):
+    c = TieredCache(1, disk_max_bytes=1 << 20, directory=tmp_path, batch_size=1)
+    c.put("a", 1)
+    c.put("b", 2)
+    c.flush()
+    c.close()
+    c.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_random_operations_match_dict(tmp_path):
+    rng = random.Random(0)
+    ref = {}
+    with TieredCache(8, disk_max_bytes=1 << 30, directory=tmp_path, batch_size=4, flush_interval=0.001) as c:
+        for _ in range(3_000):
+            k = rng.randrange(50)
+            op = rng.random()
+            if op < 0.5:
+                c.put(k, k * 10 + rng.randrange(10))
+                ref[k] = c.get(k)
+            elif op < 0.9:
+                assert c.get(k, None) == ref.get(k)
+            elif k in ref:
+                c.delete(k)
+                del ref[k]
+        c.flush()
+        assert len(c) == len(ref)
+        assert {k: c.get(k) for k in ref} == ref